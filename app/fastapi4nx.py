@@ -41,27 +41,50 @@ Run this file directly to start the development server, or deploy using
 a production WSGI server like Gunicorn or Uvicorn for production environments.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import Depends, FastAPI
 from fastapi.security import HTTPBasicCredentials
 from src.api import contacts, events, utils
 from src.api import load_config as load_fastapi_config
+from src.api.errors import register_exception_handlers
 import uvicorn
 from starlette.staticfiles import StaticFiles
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 from src.common.add_proxy import CustomProxyHeadersMiddleware
 from src.common import security
+from src.common.sec import close_auth_client
+from src.common.audit import start_audit_writer, stop_audit_writer
+from src.nextcloud.libs.dav_clients import open_shared_session, close_shared_session
+from src.nextcloud.contacts import shutdown_parse_pool
 from fastapi_pagination import add_pagination
 from src import logger
 
 # Load configuration
 fastapi_config = load_fastapi_config()
 
-# Create FastAPI app instance with metadata
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared CardDAV/CalDAV connection pool and audit writer at startup; close them on shutdown."""
+    app.state.dav_session = await open_shared_session()
+    await start_audit_writer()
+    yield
+    await stop_audit_writer()
+    await close_shared_session()
+    await close_auth_client()
+    shutdown_parse_pool()
+
+
+# Create FastAPI app instance with metadata.
+# default_response_class is left unset on purpose: routes declaring a response_model
+# (e.g. List[Event]) are then serialized straight to JSON bytes by Pydantic's Rust core,
+# which is faster than ORJSONResponse (deprecated) and would be bypassed by setting it.
 app = FastAPI(
-    title=fastapi_config['fastapi']['title'],
-    summary=fastapi_config['fastapi']['summary'],
-    description=fastapi_config['fastapi']['description'],
-    version=fastapi_config['fastapi']['version'],
+    lifespan=lifespan,
+    title=fastapi_config.fastapi.title,
+    summary=fastapi_config.fastapi.summary,
+    description=fastapi_config.fastapi.description,
+    version=fastapi_config.fastapi.version,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -71,7 +94,10 @@ app = FastAPI(
 app.add_middleware(CustomProxyHeadersMiddleware)
 
 # (Optionnel) Ajoute TrustedHostMiddleware si tu veux restreindre les hôtes autorisés
-app.add_middleware(TrustedHostMiddleware, allowed_hosts=fastapi_config['fastapi']['allowed_hosts'])
+app.add_middleware(TrustedHostMiddleware, allowed_hosts=fastapi_config.fastapi.allowed_hosts)
+
+# ValueError -> 400 and unexpected errors -> 503, without per-endpoint try/except wrappers
+register_exception_handlers(app)
 
 # Add pagination support to the FastAPI app
 add_pagination(app)
@@ -120,20 +146,20 @@ async def get_documentation(username: str = Depends(validate_api_key)):
 async def openapi(username: str = Depends(validate_api_key)):
     return get_openapi(title = "FastAPI", version="0.1.0", routes=app.routes)
 """
-logger.info(f"Starting {fastapi_config['fastapi']['title']} v{fastapi_config['fastapi']['version']}")
-logger.info(f"API documentation available at http://{fastapi_config['fastapi']['host']}:{fastapi_config['fastapi']['port']}/docs")
-logger.info(f"ReDoc documentation available at http://{fastapi_config['fastapi']['host']}:{fastapi_config['fastapi']['port']}/redoc")
-logger.info(f"Server status at http://{fastapi_config['fastapi']['host']}:{fastapi_config['fastapi']['port']}/status")
+logger.info(f"Starting {fastapi_config.fastapi.title} v{fastapi_config.fastapi.version}")
+logger.info(f"API documentation available at http://{fastapi_config.fastapi.host}:{fastapi_config.fastapi.port}/docs")
+logger.info(f"ReDoc documentation available at http://{fastapi_config.fastapi.host}:{fastapi_config.fastapi.port}/redoc")
+logger.info(f"Server status at http://{fastapi_config.fastapi.host}:{fastapi_config.fastapi.port}/status")
 
 # Run the server directly with uvicorn when this script is executed
 if __name__ == "__main__":
     # Start the FastAPI server with Uvicorn
     uvicorn.run(
         "fastapi4nx:app",  # Path to the FastAPI app object (filename:variable_name)
-        reload=fastapi_config['fastapi']['reload'],             # Enable auto-reload for development
-        port=fastapi_config['fastapi']['port'],                 # Port to listen on
-        host=fastapi_config['fastapi']['host'],                 # Host to bind to (0.0.0.0 for all interfaces)
-        log_level=fastapi_config['fastapi']['log_level'],       # Log level
+        reload=fastapi_config.fastapi.reload,             # Enable auto-reload for development
+        port=fastapi_config.fastapi.port,                 # Port to listen on
+        host=fastapi_config.fastapi.host,                 # Host to bind to (0.0.0.0 for all interfaces)
+        log_level=fastapi_config.fastapi.log_level,       # Log level
     )
 
 
@@ -4,7 +4,12 @@
 """Core application package for the src namespace.
 
 This package serves as the root for all src-related modules and subpackages.
+
+Modules should log through the shared ``logger`` (``from src import logger``)
+rather than calling ``logging.getLogger`` themselves.
 """
 import logging
 
+__all__ = ["logger"]
+
 logger = logging.getLogger('uvicorn.error')
\ No newline at end of file
@@ -1,39 +1,231 @@
+import hashlib
+import json
 import os
-import yaml
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from pathlib import Path
+from types import MappingProxyType
+
+# YAML loader class, resolved lazily on first parse (see _get_yaml_loader)
+_Loader = None
+
+# Parsed configuration keyed by resolved config path (parsed once per process,
+# inherited by forked workers)
+_CONFIG_CACHE = {}
+
+_DEFAULT_CONFIG_PATH = str(Path(__file__).with_name("config.yaml"))
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+
+def _to_bool(value):
+    """Interpret an environment string as a boolean flag."""
+    return value.lower() in _TRUTHY
+
+
+# (config key, environment variable, converter) for FastAPI overrides
+_ENV_KEYS = (
+    ("host", "FASTAPI_HOST", str),
+    ("port", "FASTAPI_PORT", int),
+    ("reload", "FASTAPI_RELOAD", _to_bool),
+    ("log_level", "FASTAPI_LOG_LEVEL", str),
+)
+
+
+def _freeze(obj):
+    """Return a read-only view of ``obj``: dicts become mapping proxies, lists tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(x) for x in obj)
+    return obj
+
+
+@dataclass(slots=True, frozen=True)
+class FastAPIConfig:
+    """Validated ``fastapi`` section of the configuration file."""
+    title: str
+    version: str
+    host: str
+    port: int
+    reload: bool = False
+    log_level: str = "info"
+    summary: str = ""
+    description: str = ""
+    allowed_hosts: tuple = ("*",)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build from the raw mapping, ignoring keys the application does not use."""
+        return cls(**{f.name: _freeze(data[f.name]) for f in fields(cls) if f.name in data})
+
+
+@dataclass(slots=True, frozen=True)
+class AppConfig:
+    """Top-level application configuration returned by :func:`load_config`."""
+    fastapi: FastAPIConfig
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(fastapi=FastAPIConfig.from_dict(data.get("fastapi") or {}))
 
 
 def _get_config_path():
-    """Return the config path, allowing FASTAPI_CONFIG_FILE override."""
-    default_path = os.path.join(os.path.dirname(__file__), "config.yaml")
-    return os.getenv("FASTAPI_CONFIG_FILE", default_path)
+    """Return the config path (file or fragment directory), allowing FASTAPI_CONFIG_FILE override."""
+    return os.environ.get("FASTAPI_CONFIG_FILE", _DEFAULT_CONFIG_PATH)
 
 
 def _override_fastapi_settings(config):
     """Override YAML values with environment variables if provided."""
-    fastapi_cfg = config.setdefault("fastapi", {})
-    env_overrides = {
-        "host": os.getenv("FASTAPI_HOST"),
-        "port": os.getenv("FASTAPI_PORT"),
-        "reload": os.getenv("FASTAPI_RELOAD"),
-        "log_level": os.getenv("FASTAPI_LOG_LEVEL"),
-    }
-
-    for key, value in env_overrides.items():
-        if value is None:
-            continue
-        if key == "port":
-            fastapi_cfg[key] = int(value)
-        elif key == "reload":
-            fastapi_cfg[key] = value.lower() in {"1", "true", "yes", "on"}
+    env = os.environ
+    # Common case: a complete config.yaml and no overrides at all
+    if not any(env_name in env for _, env_name, _ in _ENV_KEYS):
+        return config
+
+    fastapi_cfg = config.get("fastapi")
+    if fastapi_cfg is None:
+        fastapi_cfg = config["fastapi"] = {}
+    for key, env_name, convert in _ENV_KEYS:
+        value = env.get(env_name)
+        if value is not None:
+            fastapi_cfg[key] = convert(value)
+
+    return config
+
+
+def _get_json_loads():
+    """Pick the fastest available JSON decoder (msgspec, then orjson, then stdlib)."""
+    try:
+        import msgspec
+        return msgspec.json.decode
+    except ImportError:
+        pass
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        return json.loads
+
+
+def _get_yaml_loader():
+    """Import PyYAML on demand and prefer the libyaml-backed loader when available."""
+    global _Loader
+    if _Loader is None:
+        import yaml
+        _Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return _Loader
+
+
+def _parse_yaml_file(path):
+    """Parse one YAML file; top-level so it can run in a worker process."""
+    import yaml
+    with open(path, 'rb') as file:
+        return yaml.load(file.read(), Loader=_get_yaml_loader()) or {}
+
+
+def _deep_merge(base, override):
+    """Recursively merge ``override`` into ``base`` (later values win) and return ``base``."""
+    for key, value in override.items():
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _deep_merge(current, value)
         else:
-            fastapi_cfg[key] = value
+            base[key] = value
+    return base
+
+
+def _read_config_dir(config_dir):
+    """
+    Parse and deep-merge every ``*.yaml``/``*.yml`` fragment of a config directory.
 
+    Fragments are merged in file name order. Set ``FASTAPI_CONFIG_PARALLEL=1`` to
+    parse them in a process pool; single-file setups never pay the spawn cost.
+    """
+    paths = sorted(
+        entry.path for entry in os.scandir(config_dir)
+        if entry.is_file() and entry.name.endswith((".yaml", ".yml"))
+    )
+    if len(paths) > 1 and _to_bool(os.environ.get("FASTAPI_CONFIG_PARALLEL", "")):
+        workers = min(8, os.cpu_count() or 1, len(paths))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fragments = list(pool.map(_parse_yaml_file, paths))
+    else:
+        fragments = [_parse_yaml_file(path) for path in paths]
+
+    config = {}
+    for fragment in fragments:
+        _deep_merge(config, fragment)
+    return config
+
+
+def _read_config_file(config_path):
+    """
+    Parse the YAML config, reusing a JSON sidecar cache when it is up to date.
+
+    The sidecar (``<config>.cache.json``) stores a BLAKE2b digest of the YAML bytes
+    and is only trusted when that digest still matches; otherwise the same buffer is
+    parsed and the sidecar rewritten atomically. Failing to write the sidecar (e.g.
+    read-only mount) is not an error.
+    A config path ending in ``.json`` is decoded directly and never cached, and a
+    directory is treated as a set of YAML fragments (see :func:`_read_config_dir`).
+    """
+    if os.path.isdir(config_path):
+        return _read_config_dir(config_path)
+
+    if config_path.endswith(".json"):
+        # JSON configs need neither libyaml nor the sidecar cache
+        with open(config_path, 'rb') as file:
+            return _get_json_loads()(file.read())
+
+    # Read once: the same bytes feed both the digest and the YAML parser
+    with open(config_path, 'rb') as file:
+        data = file.read()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    cache_path = config_path + ".cache.json"
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            cached = json.load(file)
+        if cached.get("digest") == digest:
+            return cached["config"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    import yaml
+    # libyaml handles the UTF-8 decoding itself, so skip the TextIOWrapper pass
+    config = yaml.load(data, Loader=_get_yaml_loader())
+
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({"digest": digest, "config": config}, file, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
     return config
 
 
 def load_config():
-    """Load configuration from YAML file with optional env overrides."""
+    """
+    Load configuration from YAML file with optional env overrides.
+
+    Returns an immutable :class:`AppConfig`. Each config path is parsed once per
+    process (and inherited by forked uvicorn workers); a changed
+    ``FASTAPI_CONFIG_FILE`` is picked up on the next call. Call
+    ``load_config.cache_clear()`` to force a re-read.
+    """
     config_path = _get_config_path()
-    with open(config_path, 'r', encoding='utf-8') as file:
-        config = yaml.safe_load(file)
-    return _override_fastapi_settings(config)
+    config = _CONFIG_CACHE.get(config_path)
+    if config is None:
+        raw = _override_fastapi_settings(_read_config_file(config_path))
+        config = _CONFIG_CACHE[config_path] = AppConfig.from_dict(raw)
+    return config
+
+
+load_config.cache_clear = _CONFIG_CACHE.clear
+
+# Optionally parse the config at import time so the first request finds it cached
+if _to_bool(os.environ.get("FASTAPI_EAGER_CONFIG", "")):
+    load_config()
@@ -2,15 +2,22 @@
 # Licensed under the MIT License - https://opensource.org/licenses/MIT
 
 from fastapi import APIRouter, HTTPException, Depends, Path, Query
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from fastapi.security import HTTPBasicCredentials
 from src.common import security
 
-from src.common.sec import authenticate_with_nextcloud
+from src.common.sec import current_user
+from src.common.cache import (
+    contact_cache,
+    contact_cache_key,
+    contact_search_cache,
+    contact_search_cache_key,
+    invalidate_contact,
+)
 from src.models.contact import Contact, ContactSearchCriteria
-from src.models.api_params import UidParam
-from src.nextcloud.contacts import get_all_contacts, search_contacts, create_contact, update_contact, delete_contact, get_contact_by_uid
+from src.models.api_params import ContactsBatchCreateRequest, ContactsBatchGetRequest, UID_PATTERN
+from src.nextcloud.contacts import get_all_contacts, search_contacts, create_contact, update_contact, delete_contact, get_contact_by_uid, get_contacts_by_uids, create_contacts
 # import all you need from fastapi-pagination
 from fastapi_pagination import Page, paginate
 from src import logger
@@ -64,6 +71,14 @@ router = APIRouter()
                 }
             },
         },
+        409: {
+            "description": "A contact with this UID already exists",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Contact already exists at https://cloud.example.com/remote.php/dav/addressbooks/users/alice/contacts/550e8400-e29b-41d4-a716-446655440000.vcf"}
+                }
+            },
+        },
         503: {
             "description": "Server error or connection issue",
             "content": {
@@ -77,7 +92,8 @@ router = APIRouter()
 )
 async def create_contact_endpoint(
     contact: Contact,
-    credentials: HTTPBasicCredentials = Depends(security)
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
 ):
     """
     Create a new contact in the Nextcloud CardDAV addressbook.
@@ -103,21 +119,20 @@ async def create_contact_endpoint(
     
     **UID Handling:**
     If no UID is provided in the request, a UUID4 will be automatically generated.
-    The UID must be unique within the addressbook.
+    The UID must be unique within the addressbook: the vCard is written with
+    `If-None-Match: *`, so an existing contact is never overwritten (409).
     """
     try:
 
         logger.debug(f"Received contact to create: {contact}")
 
-        # Authenticate with Nextcloud
-        user_info = await authenticate_with_nextcloud(credentials)
-        logger.debug(f"User credentials: {user_info}")
-        
         # Call the create_contact function to create the contact on the server
         created_contact = await create_contact(
             credentials=credentials,
             contact=contact
         )
+        # A new contact may match searches cached before it existed
+        invalidate_contact(user_info['id'], None, created_contact.uid)
         
         return created_contact
         
@@ -193,13 +208,15 @@ async def read_contact_endpoint(
         example="550e8400-e29b-41d4-a716-446655440000",
         min_length=1,
         max_length=255,
+        pattern=UID_PATTERN,
     ),
     privacy: bool = Query(
         False,
         description="Enable privacy mode to mask sensitive values in the response",
         example=False
     ),
-    credentials: HTTPBasicCredentials = Depends(security)
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
 ):
     """
     Retrieve a single contact by its UID from the Nextcloud CardDAV addressbook.
@@ -239,16 +256,18 @@ async def read_contact_endpoint(
     try:
         logger.debug(f"Retrieving contact with UID: {uid} with privacy mode: {privacy}")
         
-        # Authenticate with Nextcloud
-        user_info = await authenticate_with_nextcloud(credentials)
-        logger.debug(f"User credentials: {user_info}")
-        
-        # Call the get_contact_by_uid function to retrieve the contact from the server
-        contact = await get_contact_by_uid(
-            credentials=credentials,
-            uid=uid,
-            privacy=privacy
-        )
+        # Serve repeated reads from the short-lived cache (write endpoints invalidate it)
+        key = contact_cache_key(user_info['id'], None, uid, privacy)
+        contact = contact_cache.get(key)
+        if contact is None:
+            # Call the get_contact_by_uid function to retrieve the contact from the server
+            contact = await get_contact_by_uid(
+                credentials=credentials,
+                uid=uid,
+                privacy=privacy
+            )
+            if contact is not None:
+                contact_cache[key] = contact
         
         # If contact is not found, raise a 404 error
         if contact is None:
@@ -345,8 +364,10 @@ async def update_contact_endpoint(
         example="550e8400-e29b-41d4-a716-446655440000",
         min_length=1,
         max_length=255,
+        pattern=UID_PATTERN,
     ),
-    credentials: HTTPBasicCredentials = Depends(security)
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
 ):
     """
     Update an existing contact in the Nextcloud CardDAV addressbook.
@@ -390,15 +411,15 @@ async def update_contact_endpoint(
             )
         logger.debug(f"Updating contact with UID: {uid}")
         
-        # Authenticate with Nextcloud
-        user_info = await authenticate_with_nextcloud(credentials)
-        logger.debug(f"User credentials: {user_info}")
-        
         # Call the update_contact function to update the contact on the server
-        updated_contact = await update_contact(
-            credentials=credentials,
-            contact=contact_update
-        )
+        try:
+            updated_contact = await update_contact(
+                credentials=credentials,
+                contact=contact_update
+            )
+        finally:
+            # Drop the cached copy even on conflicts so the next read sees the server state
+            invalidate_contact(user_info['id'], None, uid)
         
         return updated_contact
         
@@ -478,8 +499,10 @@ async def delete_contact_endpoint(
         example="550e8400-e29b-41d4-a716-446655440000",
         min_length=1,
         max_length=255,
+        pattern=UID_PATTERN,
     ),
-    credentials: HTTPBasicCredentials = Depends(security)
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
 ):
     """
     Delete a contact from the Nextcloud CardDAV addressbook.
@@ -512,15 +535,14 @@ async def delete_contact_endpoint(
     try:
         logger.debug(f"Deleting contact with UID: {uid}")
         
-        # Authenticate with Nextcloud
-        user_info = await authenticate_with_nextcloud(credentials)
-        logger.debug(f"User credentials: {user_info}")
-        
         # Call the delete_contact function to delete the contact from the server
-        result = await delete_contact(
-            credentials=credentials,
-            uid=uid
-        )
+        try:
+            result = await delete_contact(
+                credentials=credentials,
+                uid=uid
+            )
+        finally:
+            invalidate_contact(user_info['id'], None, uid)
         
         # Return 204 No Content on successful deletion
         return None
@@ -593,7 +615,8 @@ async def get_all_contacts_endpoint(
         description="Enable privacy mode to mask sensitive values in the response",
         example=False
     ),
-    credentials: HTTPBasicCredentials = Depends(security)
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
 ) -> Page[Contact]:
     """
     Retrieve all contacts from the Nextcloud CardDAV addressbook.
@@ -639,9 +662,6 @@ async def get_all_contacts_endpoint(
     """
     logger.debug(f"Get all contacts with privacy mode: {privacy}")
 
-    user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
-    
     try:
         contacts = await get_all_contacts(
             credentials=credentials,
@@ -722,7 +742,8 @@ async def search_contacts_endpoint(
         description="Enable privacy mode to mask sensitive values in the response",
         example=False
     ),
-    credentials: HTTPBasicCredentials = Depends(security)
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
 ) -> List[Contact]:
     """
     Search for contacts in the Nextcloud CardDAV addressbook using specified criteria.
@@ -769,6 +790,7 @@ async def search_contacts_endpoint(
     - More efficient than retrieving all contacts and filtering client-side
     - Response time depends on search complexity and addressbook size
     - Consider using specific criteria to narrow results
+    - Identical searches are cached for a short time; writes through this API clear the cache
     
     **Note:** When privacy mode is enabled, certain sensitive fields may be masked
     or omitted from the response to protect confidential information.
@@ -777,15 +799,16 @@ async def search_contacts_endpoint(
 
         logger.debug(f"Get contacts using search criterias: {search_criteria} with privacy mode: {privacy}")
 
-        # Authenticate with Nextcloud
-        user_info = await authenticate_with_nextcloud(credentials)
-        logger.debug(f"User credentials: {user_info}")
-        
-        contacts = await search_contacts(
-            credentials=credentials,
-            search_criteria=search_criteria,
-            privacy=privacy
-        )
+        # Identical searches within the cache TTL are answered without a REPORT
+        key = contact_search_cache_key(user_info['id'], None, search_criteria.model_dump(), privacy)
+        contacts = contact_search_cache.get(key)
+        if contacts is None:
+            contacts = await search_contacts(
+                credentials=credentials,
+                search_criteria=search_criteria,
+                privacy=privacy
+            )
+            contact_search_cache[key] = contacts
     except HTTPException as exc:
         res_txt = f"Could not search contacts: {exc.detail if hasattr(exc, 'detail') else str(exc)}"
         logger.error(res_txt)
@@ -796,3 +819,197 @@ async def search_contacts_endpoint(
         raise HTTPException(status_code=503, detail=res_txt)
 
     return contacts
+
+
+@router.post(
+    "/:batchGet",
+    operation_id="batch_get_contacts",
+    response_model=Dict[str, Optional[Contact]],
+    summary="Get several contacts by UID",
+    description="Retrieve several contacts with a single CardDAV addressbook-multiget request",
+    responses={
+        200: {
+            "description": "Contacts keyed by UID; UIDs that do not exist map to null",
+        },
+        400: {
+            "description": "Invalid UID list",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "ValueError: Contact UIDs must be provided for retrieval"}
+                }
+            },
+        },
+        401: {
+            "description": "Authentication failed",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid credentials"}
+                }
+            },
+        },
+        403: {
+            "description": "Authorization refused",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Access denied to addressbook"}
+                }
+            },
+        },
+        503: {
+            "description": "Server error or connection issue",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Could not retrieve contacts: Connection failed"}
+                }
+            },
+        },
+    },
+    tags=["contacts"],
+)
+async def batch_get_contacts_endpoint(
+    body: ContactsBatchGetRequest,
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
+) -> Dict[str, Optional[Contact]]:
+    """
+    Retrieve several contacts by UID in one request.
+    
+    Instead of one `GET /contacts/{uid}` per contact, clients send up to 100 UIDs and the
+    API resolves them with a single CardDAV `addressbook-multiget` REPORT against Nextcloud.
+    
+    **Authentication:**
+    Requires HTTP Basic Authentication with valid Nextcloud credentials.
+    
+    **Response:**
+    A JSON object mapping every requested UID to its contact, or to `null` when the
+    addressbook holds no contact with that UID. Privacy masking applies as on the
+    single-contact endpoint.
+    """
+    try:
+        logger.debug("Batch retrieving %d contacts with privacy mode: %s", len(body.uids), body.privacy)
+        
+        found = await get_contacts_by_uids(
+            credentials=credentials,
+            uids=body.uids,
+            addressbook_name=body.addressbook_name,
+            privacy=body.privacy,
+        )
+    except ValueError as e:
+        res_txt = f"ValueError: {str(e)}"
+        logger.error(res_txt)
+        raise HTTPException(status_code=400, detail=res_txt)
+    except HTTPException as exc:
+        res_txt = f"Could not retrieve contacts: {exc.detail if hasattr(exc, 'detail') else str(exc)}"
+        logger.error(res_txt)
+        raise
+    except Exception as e:
+        res_txt = f"Could not retrieve contacts: {str(e)}"
+        logger.error(res_txt)
+        raise HTTPException(status_code=503, detail=res_txt)
+    
+    # Warm the single-contact cache with what we just fetched
+    for uid, contact in found.items():
+        contact_cache[contact_cache_key(user_info['id'], body.addressbook_name, uid, body.privacy)] = contact
+    
+    return {uid: found.get(uid) for uid in body.uids}
+
+
+@router.post(
+    "/:batchCreate",
+    operation_id="batch_create_contacts",
+    response_model=List[Contact],
+    status_code=201,
+    summary="Create several contacts",
+    description="Create several contacts with concurrent CardDAV PUT requests",
+    responses={
+        201: {
+            "description": "Contacts created successfully, in request order",
+        },
+        401: {
+            "description": "Authentication failed",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid credentials"}
+                }
+            },
+        },
+        403: {
+            "description": "Authorization refused",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Access denied to addressbook"}
+                }
+            },
+        },
+        409: {
+            "description": "A contact with one of the UIDs already exists",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": {
+                            "message": "1 of 2 contacts could not be created",
+                            "created": ["7c9e6679-7425-40de-944b-e07fc1f90ae7"],
+                            "failed": [
+                                {
+                                    "uid": "550e8400-e29b-41d4-a716-446655440000",
+                                    "status_code": 409,
+                                    "detail": "Contact already exists at https://cloud.example.com/remote.php/dav/addressbooks/users/alice/contacts/550e8400-e29b-41d4-a716-446655440000.vcf"
+                                }
+                            ]
+                        }
+                    }
+                }
+            },
+        },
+        503: {
+            "description": "Server error or connection issue",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Could not create contacts: Connection failed"}
+                }
+            },
+        },
+    },
+    tags=["contacts"],
+)
+async def batch_create_contacts_endpoint(
+    body: ContactsBatchCreateRequest,
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
+) -> List[Contact]:
+    """
+    Create several contacts in one request.
+    
+    Up to 100 contacts are written with concurrent CardDAV PUTs (bounded, so
+    Nextcloud is not flooded). UID handling is the same as on the single-contact
+    endpoint.
+    
+    **Authentication:**
+    Requires HTTP Basic Authentication with valid Nextcloud credentials.
+    
+    **Errors:**
+    Every PUT runs to completion; if any of them fails, the response carries the
+    status code of the first failure and a detail listing the `created` UIDs (those
+    contacts are kept) and the `failed` ones with their own status code and detail.
+    """
+    try:
+        logger.debug("Batch creating %d contacts", len(body.contacts))
+        
+        return await create_contacts(
+            credentials=credentials,
+            contacts=body.contacts,
+            addressbook_name=body.addressbook_name,
+        )
+    except HTTPException as exc:
+        res_txt = f"Could not create contacts: {exc.detail if hasattr(exc, 'detail') else str(exc)}"
+        logger.error(res_txt)
+        raise
+    except Exception as e:
+        res_txt = f"Could not create contacts: {str(e)}"
+        logger.error(res_txt)
+        raise HTTPException(status_code=503, detail=res_txt)
+    finally:
+        # New contacts may match searches cached before they existed
+        for contact in body.contacts:
+            if contact.uid:
+                invalidate_contact(user_info['id'], body.addressbook_name, contact.uid)
@@ -0,0 +1,56 @@
+# Copyright (c) 2025 harokku999@gmail.com
+# Licensed under the MIT License - https://opensource.org/licenses/MIT
+
+"""
+Application-wide exception handlers.
+
+Endpoints let ``ValueError``, ``EventNotFound`` and unexpected exceptions
+propagate; the handlers registered here turn them into the 400/404/503 responses
+the API documents, so the success path runs without any extra wrapper frame. ``HTTPException`` keeps
+FastAPI's default handling.
+"""
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from src import logger
+from src.nextcloud.events import EventNotFound
+
+
+def error_operation(operation: str):
+    """
+    Tag an endpoint with the operation named in its 503 message.
+
+    Only sets an attribute on the function; it does not wrap it.
+    """
+    def decorator(func):
+        func.error_operation = operation
+        return func
+    return decorator
+
+
+async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
+    res_txt = f"ValueError: {str(exc)}"
+    logger.error(res_txt)
+    return JSONResponse(status_code=400, content={"detail": res_txt})
+
+
+async def event_not_found_handler(request: Request, exc: EventNotFound) -> JSONResponse:
+    res_txt = str(exc)
+    logger.error(res_txt)
+    return JSONResponse(status_code=404, content={"detail": res_txt})
+
+
+async def unexpected_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    endpoint = request.scope.get("endpoint")
+    operation = getattr(endpoint, "error_operation", "process request")
+    res_txt = f"Could not {operation}: {str(exc)}"
+    logger.error(res_txt)
+    return JSONResponse(status_code=503, content={"detail": res_txt})
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Install the ValueError (400), EventNotFound (404) and catch-all (503) handlers on ``app``."""
+    app.add_exception_handler(ValueError, value_error_handler)
+    app.add_exception_handler(EventNotFound, event_not_found_handler)
+    app.add_exception_handler(Exception, unexpected_error_handler)
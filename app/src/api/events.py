@@ -1,15 +1,35 @@
 # Copyright (c) 2025 harokku999@gmail.com
 # Licensed under the MIT License - https://opensource.org/licenses/MIT
 
-from fastapi import APIRouter, HTTPException, Depends, Path, Query
-from typing import List, Optional
-from functools import wraps
+from fastapi import APIRouter, HTTPException, Depends, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+import hashlib
+from datetime import datetime
+from typing import Dict, List, Optional
 from src.common import security
 from fastapi.security import HTTPBasicCredentials
-from src.common.sec import authenticate_with_nextcloud
+from src.api.errors import error_operation
+from src.common.sec import current_user
+from src.common.timezones import to_naive_utc
+from src.common.cache import (
+    event_cache,
+    event_cache_key,
+    invalidate_event,
+    cached_time_range,
+    range_cache_key,
+    invalidate_ranges,
+)
 from src.models.event import Event
-from src.models.api_params import UidParam, EventsQueryParams
-from src.nextcloud.events import get_event_by_uid, get_events_by_time_range, create_event, update_event, delete_event
+from src.models.api_params import EventsBatchGetRequest, UID_PATTERN
+from src.nextcloud.events import (
+    event_fetcher,
+    get_events_by_uids,
+    get_events_by_time_range,
+    create_event,
+    update_event,
+    delete_event,
+)
 from src import logger
 
 # --- Router Definition ---
@@ -17,31 +37,119 @@ from src import logger
 # instead of applying a global dependency to all routes
 router = APIRouter()
 
+# --- Shared OpenAPI examples ---
+# Built once at import and reused by every route instead of repeating the literals
+EVENT_EXAMPLE = {
+    "uid": "550e8400-e29b-41d4-a716-446655440000",
+    "summary": "Team Sync",
+    "description": "Weekly planning touchpoint",
+    "location": "Conference Room A",
+    "url": "https://nextcloud.local/remote.php/dav/calendars/user/personal/550e8400-e29b-41d4-a716-446655440000.ics",
+    "start": "2025-04-21T14:00:00",
+    "end": "2025-04-21T15:00:00",
+    "all_day": False,
+    "status": "CONFIRMED",
+    "classification": "PRIVATE",
+    "organizer": "manager@example.com",
+    "attendees": [
+        {
+            "email": "manager@example.com",
+            "name": "Manager",
+            "role": "CHAIR",
+            "status": "ACCEPTED",
+            "type": "INDIVIDUAL"
+        }
+    ],
+    "reminders": [
+        {
+            "type": "DISPLAY",
+            "mode": "relative",
+            "offset": "-PT10M",
+            "relation": "START",
+            "fire_time": "2025-04-21T13:50:00",
+            "timezone": "Europe/Paris",
+            "description": "Reminder fires 10 minutes before start"
+        }
+    ]
+}
+
+_AUTH_ERROR_RESPONSES = {
+    401: {
+        "description": "Authentication failed",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Invalid credentials"}
+            }
+        },
+    },
+    403: {
+        "description": "Authorization refused",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Access denied to calendar"}
+            }
+        },
+    },
+}
+
+_INVALID_UID_RESPONSE = {
+    "description": "Invalid UID format",
+    "content": {
+        "application/json": {
+            "example": {"detail": "Invalid UID format provided"}
+        }
+    },
+}
+
+_EVENT_NOT_FOUND_RESPONSE = {
+    "description": "Event not found",
+    "content": {
+        "application/json": {
+            "example": {"detail": "Event with UID 550e8400-e29b-41d4-a716-446655440000 not found"}
+        }
+    },
+}
+
+
+def _service_error_response(operation: str) -> dict:
+    """OpenAPI entry for the 503 raised when Nextcloud cannot be reached."""
+    return {
+        "description": "Server error or connection issue",
+        "content": {
+            "application/json": {
+                "example": {"detail": f"Could not {operation}: Connection failed"}
+            }
+        },
+    }
+
+
+EVENT_CACHE_CONTROL = "private, max-age=30"
+
+
+def _event_http_etag(event: Event, privacy: bool) -> str:
+    """Weak HTTP ETag for the JSON representation of an event."""
+    if event.etag:
+        # The CalDAV ETag changes with the stored iCalendar; masking yields a different body
+        tag = event.etag.removeprefix("W/").strip('"') + ("-p" if privacy else "")
+    else:
+        tag = hashlib.blake2b(event.model_dump_json().encode(), digest_size=16).hexdigest()
+    return f'W/"{tag}"'
+
+
+def _if_none_match(request: Request, etag: str) -> bool:
+    """True when the client's If-None-Match header already covers ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {value.strip() for value in header.split(",")}
+    return "*" in candidates or etag in candidates or etag[2:] in candidates
+
 
-def endpoint_error_handler(operation: str):
-    """Decorator to normalize error handling across event endpoints."""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await func(*args, **kwargs)
-            except ValueError as e:
-                res_txt = f"ValueError: {str(e)}"
-                logger.error(res_txt)
-                raise HTTPException(status_code=400, detail=res_txt)
-            except HTTPException:
-                raise
-            except Exception as e:
-                res_txt = f"Could not {operation}: {str(e)}"
-                logger.error(res_txt)
-                raise HTTPException(status_code=503, detail=res_txt)
-        return wrapper
-    return decorator
-
 @router.get(
     "/{uid}",
     operation_id="get_event_by_uid",
     response_model=Event,
+    response_model_exclude_none=True,
     summary="Get event by UID",
     description="Retrieve a single event by its unique identifier",
     responses={
@@ -49,93 +157,31 @@ def endpoint_error_handler(operation: str):
             "description": "Event retrieved successfully",
             "content": {
                 "application/json": {
-                    "example": {
-                        "uid": "550e8400-e29b-41d4-a716-446655440000",
-                        "summary": "Team Sync",
-                        "description": "Weekly planning touchpoint",
-                        "location": "Conference Room A",
-                        "url": "https://nextcloud.local/remote.php/dav/calendars/user/personal/550e8400-e29b-41d4-a716-446655440000.ics",
-                        "start": "2025-04-21T14:00:00",
-                        "end": "2025-04-21T15:00:00",
-                        "all_day": False,
-                        "status": "CONFIRMED",
-                        "classification": "PRIVATE",
-                        "organizer": "manager@example.com",
-                        "attendees": [
-                            {
-                                "email": "manager@example.com",
-                                "name": "Manager",
-                                "role": "CHAIR",
-                                "status": "ACCEPTED",
-                                "type": "INDIVIDUAL"
-                            }
-                        ],
-                        "reminders": [
-                            {
-                                "type": "DISPLAY",
-                                "mode": "relative",
-                                "offset": "-PT10M",
-                                "relation": "START",
-                                "fire_time": "2025-04-21T13:50:00",
-                                "timezone": "Europe/Paris",
-                                "description": "Reminder fires 10 minutes before start"
-                            }
-                        ]
-                    }
+                    "example": EVENT_EXAMPLE
                 }
             },
         },
-        400: {
-            "description": "Invalid UID format",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Invalid UID format provided"}
-                }
-            },
-        },
-        401: {
-            "description": "Authentication failed",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Invalid credentials"}
-                }
-            },
-        },
-        403: {
-            "description": "Authorization refused",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Access denied to calendar"}
-                }
-            },
-        },
-        404: {
-            "description": "Event not found",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Event with UID 550e8400-e29b-41d4-a716-446655440000 not found"}
-                }
-            },
-        },
-        503: {
-            "description": "Server error or connection issue",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Could not retrieve event: Connection failed"}
-                }
-            },
+        304: {
+            "description": "Event unchanged since the ETag sent in If-None-Match",
         },
+        400: _INVALID_UID_RESPONSE,
+        **_AUTH_ERROR_RESPONSES,
+        404: _EVENT_NOT_FOUND_RESPONSE,
+        503: _service_error_response("retrieve event"),
     },
     tags=["events"],
 )
-@endpoint_error_handler("retrieve event")
+@error_operation("retrieve event")
 async def read_event_endpoint(
+    request: Request,
+    response: Response,
     uid: str = Path(
         ...,
         description="Unique identifier for the event",
         example="550e8400-e29b-41d4-a716-446655440000",
         min_length=1,
         max_length=255,
+        pattern=UID_PATTERN,
     ),
     privacy: bool = Query(
         False,
@@ -148,7 +194,8 @@ async def read_event_endpoint(
         example="personal",
         max_length=100
     ),
-    credentials: HTTPBasicCredentials = Depends(security)
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
 ):
     """
     Retrieve a single event by its UID from the Nextcloud CalDAV calendar.
@@ -206,33 +253,54 @@ async def read_event_endpoint(
     **Note:** When privacy mode is enabled, certain sensitive fields may be masked
     or omitted from the response to protect confidential information.
     """
-    logger.debug(f"Retrieving event with UID: {uid} with privacy mode: {privacy}")
-    
-    # Authenticate with Nextcloud
-    user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
-    
-    # Pass privacy flag down so helper can mask sensitive fields when requested
-    event = await get_event_by_uid(
-        credentials=credentials,
-        uid=uid,
-        calendar_name=calendar_name,
-        privacy = privacy,
-    )
+    logger.debug("Retrieving event with UID: %s with privacy mode: %s", uid, privacy)
     
-    # If event is not found, raise a 404 error
+    # Serve repeated reads from the short-lived cache (write endpoints invalidate it)
+    key = event_cache_key(user_info['id'], calendar_name, uid, privacy)
+    event = event_cache.get(key)
     if event is None:
-        res_txt = f"Event with UID {uid} not found"
-        logger.error(res_txt)
-        raise HTTPException(status_code=404, detail=res_txt)
+        # Pass privacy flag down so helper can mask sensitive fields when requested;
+        # concurrent reads of the same calendar are coalesced into one multiget.
+        # A missing event raises EventNotFound, which the app turns into a 404.
+        event = await event_fetcher.get(
+            credentials=credentials,
+            uid=uid,
+            calendar_name=calendar_name,
+            privacy = privacy,
+        )
+        event_cache[key] = event
     
+    # Conditional GET: let clients revalidate without re-downloading the body
+    etag = _event_http_etag(event, privacy)
+    headers = {"ETag": etag, "Cache-Control": EVENT_CACHE_CONTROL}
+    if _if_none_match(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     return event
+
 
-
+EVENTS_PAGE_DEFAULT = 200
+EVENTS_PAGE_MAX = 1000
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Built once; serializes a page of already-validated events straight to JSON bytes
+_EVENTS_ADAPTER = TypeAdapter(List[Event])
+
+
+def _decode_cursor(cursor: Optional[str]) -> int:
+    """Turn a pagination cursor back into a list offset."""
+    if not cursor:
+        return 0
+    if not cursor.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return int(cursor)
+
+
 @router.get(
     "/",
     operation_id="get_events_by_timerange",
     response_model=List[Event],
+    response_model_exclude_none=True,
     summary="Get events by time range",
     description="Retrieve events within a specified date/time range",
     responses={
@@ -256,7 +324,10 @@ async def read_event_endpoint(
                             "classification": "PUBLIC"
                         }
                     ]
-                }
+                },
+                "application/x-ndjson": {
+                    "schema": {"type": "string"},
+                },
             },
         },
         400: {
@@ -276,46 +347,24 @@ async def read_event_endpoint(
                 }
             },
         },
-        401: {
-            "description": "Authentication failed",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Invalid credentials"}
-                }
-            },
-        },
-        403: {
-            "description": "Authorization refused",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Access denied to calendar"}
-                }
-            },
-        },
-        503: {
-            "description": "Server error or connection issue",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Could not retrieve events: Connection failed"}
-                }
-            },
-        },
+        **_AUTH_ERROR_RESPONSES,
+        503: _service_error_response("retrieve events"),
     },
     tags=["events"],
 )
-@endpoint_error_handler("retrieve events")
+@error_operation("retrieve events")
 async def read_events_by_time_range_endpoint(
-    start_datetime: str = Query(
+    request: Request,
+    response: Response,
+    start_datetime: datetime = Query(
         ...,
         description="Start datetime in ISO format (YYYY-MM-DDTHH:MM:SS)",
         example="2025-04-21T00:00:00",
-        regex=r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$"
     ),
-    end_datetime: str = Query(
+    end_datetime: datetime = Query(
         ...,
         description="End datetime in ISO format (YYYY-MM-DDTHH:MM:SS)",
         example="2025-04-28T23:59:59",
-        regex=r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$"
     ),
     privacy: bool = Query(
         False,
@@ -328,7 +377,20 @@ async def read_events_by_time_range_endpoint(
         example="personal",
         max_length=100
     ),
-    credentials: HTTPBasicCredentials = Depends(security)
+    limit: int = Query(
+        EVENTS_PAGE_DEFAULT,
+        ge=1,
+        le=EVENTS_PAGE_MAX,
+        description="Maximum number of events returned in this page",
+        example=EVENTS_PAGE_DEFAULT
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from the previous page's Link/X-Next-Cursor header",
+        max_length=20
+    ),
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
 ):
     """
     Retrieve events within a specified date/time range from the Nextcloud CalDAV calendar.
@@ -368,6 +430,15 @@ async def read_events_by_time_range_endpoint(
     Events are returned sorted by their start datetime in ascending order,
     making it easy to display chronological event lists.
     
+    **Streaming:**
+    Send `Accept: application/x-ndjson` to receive the page as newline-delimited JSON,
+    one event per line, streamed as each event is encoded.
+    
+    **Pagination:**
+    At most `limit` events (default 200, maximum 1000) are returned per call. When more
+    events remain, the response carries a `Link: <...>; rel="next"` header and an
+    `X-Next-Cursor` header; pass that value as `cursor` to fetch the next page.
+    
     **Performance Considerations:**
     - Larger time ranges may return more data and take longer to process
     - Consider using smaller time windows for better performance
@@ -398,28 +469,59 @@ async def read_events_by_time_range_endpoint(
     **Note:** When privacy mode is enabled, certain sensitive fields may be masked
     or omitted from the response to protect confidential information.
     """
-    logger.debug(f"Retrieving events between {start_datetime} and {end_datetime} with privacy mode: {privacy}")
+    logger.debug("Retrieving events between %s and %s with privacy mode: %s", start_datetime, end_datetime, privacy)
     
-    # Authenticate with Nextcloud
-    user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
+    start_dt = to_naive_utc(start_datetime)
+    end_dt = to_naive_utc(end_datetime)
+    if end_dt <= start_dt:
+        raise ValueError("end_datetime must be after start_datetime")
+    start_datetime = start_dt.isoformat(timespec="seconds")
+    end_datetime = end_dt.isoformat(timespec="seconds")
     
-    # CalDAV helper handles filtering plus optional privacy masking
-    events = await get_events_by_time_range(
-        calendar_name=calendar_name,
-        credentials=credentials,
-        start_datetime=start_datetime,
-        end_datetime=end_datetime,
-        privacy=privacy
+    # CalDAV helper handles filtering plus optional privacy masking; calendar UIs
+    # re-request the same window while navigating, so serve it stale-while-revalidate
+    events = await cached_time_range(
+        range_cache_key(user_info['id'], calendar_name, start_datetime, end_datetime, privacy),
+        lambda: get_events_by_time_range(
+            calendar_name=calendar_name,
+            credentials=credentials,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            privacy=privacy
+        ),
     )
     
-    return events
+    offset = _decode_cursor(cursor)
+    page = events[offset:offset + limit]
+    next_offset = offset + len(page)
+    if next_offset < len(events):
+        next_cursor = str(next_offset)
+        next_url = request.url.include_query_params(cursor=next_cursor)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+        response.headers["X-Next-Cursor"] = next_cursor
+    
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        # One JSON document per line, written as each event is encoded
+        return StreamingResponse(
+            (event.model_dump_json(exclude_none=True).encode() + b"\n" for event in page),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers=dict(response.headers),
+        )
+    
+    # The events come from our own parser, so skip FastAPI's response re-validation
+    # (response_model stays on the route for the OpenAPI schema)
+    return Response(
+        _EVENTS_ADAPTER.dump_json(page, exclude_none=True),
+        media_type="application/json",
+        headers=dict(response.headers),
+    )
 
 
 @router.post(
     "/",
     operation_id="create_event",
     response_model=Event,
+    response_model_exclude_none=True,
     status_code=201,
     summary="Create a new event",
     description="Create a new event in the Nextcloud CalDAV calendar",
@@ -449,34 +551,12 @@ async def read_events_by_time_range_endpoint(
                 }
             },
         },
-        401: {
-            "description": "Authentication failed",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Invalid credentials"}
-                }
-            },
-        },
-        403: {
-            "description": "Authorization refused",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Access denied to calendar"}
-                }
-            },
-        },
-        503: {
-            "description": "Server error or connection issue",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Could not create event: Connection failed"}
-                }
-            },
-        },
+        **_AUTH_ERROR_RESPONSES,
+        503: _service_error_response("create event"),
     },
     tags=["events"],
 )
-@endpoint_error_handler("create event")
+@error_operation("create event")
 async def create_event_endpoint(
     event: Event,
     calendar_name: Optional[str] = Query(
@@ -485,7 +565,8 @@ async def create_event_endpoint(
         example="personal",
         max_length=100
     ),
-    credentials: HTTPBasicCredentials = Depends(security)
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
 ):
     """
     Create a new event in the Nextcloud CalDAV calendar.
@@ -543,11 +624,7 @@ async def create_event_endpoint(
     Write operations always persist the full event payload. Privacy masking
     is only available on the read endpoints (`GET /events` and `GET /events/{uid}`).
     """
-    logger.debug(f"Received event to create: {event}")
-    
-    # Authenticate with Nextcloud
-    user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
+    logger.debug("Received event to create: %s", event)
     
     # Call the create_event function to create the event on the server
     # None calendar_name defaults to the authenticated user's primary calendar
@@ -556,6 +633,8 @@ async def create_event_endpoint(
         event=event,
         calendar_name=calendar_name
     )
+    invalidate_event(user_info['id'], calendar_name, created_event.uid)
+    invalidate_ranges(user_info['id'], calendar_name)
     
     return created_event
 
@@ -564,6 +643,7 @@ async def create_event_endpoint(
     "/{uid}",
     operation_id="update_event_by_uid",
     response_model=Event,
+    response_model_exclude_none=True,
     summary="Update an existing event",
     description="Update an existing event in the Nextcloud CalDAV calendar",
     responses={
@@ -592,52 +672,31 @@ async def create_event_endpoint(
                 }
             },
         },
-        401: {
-            "description": "Authentication failed",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Invalid credentials"}
-                }
-            },
-        },
-        403: {
-            "description": "Authorization refused",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Access denied to calendar"}
-                }
-            },
-        },
-        404: {
-            "description": "Event not found",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Event with UID 550e8400-e29b-41d4-a716-446655440000 not found"}
-                }
-            },
-        },
-        503: {
-            "description": "Server error or connection issue",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Could not update event: Connection failed"}
-                }
-            },
-        },
+        **_AUTH_ERROR_RESPONSES,
+        404: _EVENT_NOT_FOUND_RESPONSE,
+        503: _service_error_response("update event"),
     },
     tags=["events"],
 )
-@endpoint_error_handler("update event")
+@error_operation("update event")
 async def update_event_endpoint(
     event: Event,
-    uid: str = Path(..., description="Unique identifier for the event", example="550e8400-e29b-41d4-a716-446655440000"),
+    uid: str = Path(
+        ...,
+        description="Unique identifier for the event",
+        example="550e8400-e29b-41d4-a716-446655440000",
+        min_length=1,
+        max_length=255,
+        pattern=UID_PATTERN,
+    ),
     calendar_name: Optional[str] = Query(
         None,
         description="Optional calendar name to update the event in a specific calendar",
         example="personal",
         max_length=100
     ),
-    credentials: HTTPBasicCredentials = Depends(security)
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
 ):
     """
     Update an existing event in the Nextcloud CalDAV calendar.
@@ -681,7 +740,7 @@ async def update_event_endpoint(
     Privacy masking is not applied to update operations. Use the read endpoints
     when you need sanitized data for public surfaces.
     """
-    logger.debug(f"Updating event with UID: {uid}")
+    logger.debug("Updating event with UID: %s", uid)
     
     # Ensure the UID in the path matches the UID in the event data
     if event.uid and event.uid != uid:
@@ -691,11 +750,6 @@ async def update_event_endpoint(
             status_code=400,
             detail=res_txt
         )
-    logger.debug(f"Updating event with UID: {uid}")
-    
-    # Authenticate with Nextcloud
-    user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
     
     # Set the UID from the path if not provided in the event data
     if not event.uid:
@@ -703,11 +757,16 @@ async def update_event_endpoint(
     
     # Call the update_event function to update the event on the server
     # calendar_name falling back to None keeps behavior aligned with Nextcloud defaults
-    updated_event = await update_event(
-        credentials=credentials,
-        event=event,
-        calendar_name=calendar_name
-    )
+    try:
+        updated_event = await update_event(
+            credentials=credentials,
+            event=event,
+            calendar_name=calendar_name
+        )
+    finally:
+        # Drop the cached copy even on conflicts so the next read sees the server state
+        invalidate_event(user_info['id'], calendar_name, uid)
+        invalidate_ranges(user_info['id'], calendar_name)
     
     return updated_event
 
@@ -722,59 +781,31 @@ async def update_event_endpoint(
         204: {
             "description": "Event deleted successfully",
         },
-        400: {
-            "description": "Invalid UID format",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Invalid UID format provided"}
-                }
-            },
-        },
-        401: {
-            "description": "Authentication failed",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Invalid credentials"}
-                }
-            },
-        },
-        403: {
-            "description": "Authorization refused",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Access denied to calendar"}
-                }
-            },
-        },
-        404: {
-            "description": "Event not found",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Event with UID 550e8400-e29b-41d4-a716-446655440000 not found"}
-                }
-            },
-        },
-        503: {
-            "description": "Server error or connection issue",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Could not delete event: Connection failed"}
-                }
-            },
-        },
+        400: _INVALID_UID_RESPONSE,
+        **_AUTH_ERROR_RESPONSES,
+        404: _EVENT_NOT_FOUND_RESPONSE,
+        503: _service_error_response("delete event"),
     },
     tags=["events"],
 )
-@endpoint_error_handler("delete event")
+@error_operation("delete event")
 async def delete_event_endpoint(
-    uid: str = Path(..., description="Unique identifier for the event", example="550e8400-e29b-41d4-a716-446655440000"),
+    uid: str = Path(
+        ...,
+        description="Unique identifier for the event",
+        example="550e8400-e29b-41d4-a716-446655440000",
+        min_length=1,
+        max_length=255,
+        pattern=UID_PATTERN,
+    ),
     calendar_name: Optional[str] = Query(
         None,
         description="Optional calendar name to delete the event from a specific calendar",
         example="personal",
         max_length=100
     ),
-    credentials: HTTPBasicCredentials = Depends(security)
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
 ):
     """
     Delete an event from the Nextcloud CalDAV calendar.
@@ -814,19 +845,19 @@ async def delete_event_endpoint(
     Privacy masking only affects read endpoints. Delete operations never return
     event data beyond success/failure metadata.
     """
-    logger.debug(f"Deleting event with UID: {uid}")
-    
-    # Authenticate with Nextcloud
-    user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
+    logger.debug("Deleting event with UID: %s", uid)
     
     # Call the delete_event function to delete the event from the server
     # calendar_name None indicates the default "personal" calendar on Nextcloud
-    result = await delete_event(
-        credentials=credentials,
-        uid=uid,
-        calendar_name=calendar_name
-    )
+    try:
+        result = await delete_event(
+            credentials=credentials,
+            uid=uid,
+            calendar_name=calendar_name
+        )
+    finally:
+        invalidate_event(user_info['id'], calendar_name, uid)
+        invalidate_ranges(user_info['id'], calendar_name)
     
     # If the event was not found, return a 404 error
     if not result:
@@ -836,3 +867,62 @@ async def delete_event_endpoint(
     
     # Return 204 No Content on successful deletion
     return None
+
+
+@router.post(
+    "/:batchGet",
+    operation_id="batch_get_events",
+    response_model=Dict[str, Optional[Event]],
+    summary="Get several events by UID",
+    description="Retrieve several events with a single CalDAV calendar-multiget request",
+    responses={
+        200: {
+            "description": "Events keyed by UID; UIDs that do not exist map to null",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "550e8400-e29b-41d4-a716-446655440000": EVENT_EXAMPLE,
+                        "8c51dfa0-53a5-42fb-8f7c-90ce31c1f7f2": None,
+                    }
+                }
+            },
+        },
+        **_AUTH_ERROR_RESPONSES,
+        503: _service_error_response("retrieve events"),
+    },
+    tags=["events"],
+)
+@error_operation("retrieve events")
+async def batch_get_events_endpoint(
+    body: EventsBatchGetRequest,
+    credentials: HTTPBasicCredentials = Depends(security),
+    user_info: dict = Depends(current_user)
+):
+    """
+    Retrieve several events by UID in one request.
+    
+    Instead of one `GET /events/{uid}` per event, clients send up to 100 UIDs and the
+    API resolves them with a single CalDAV `calendar-multiget` REPORT against Nextcloud.
+    
+    **Authentication:**
+    Requires HTTP Basic Authentication with valid Nextcloud credentials.
+    
+    **Response:**
+    A JSON object mapping every requested UID to its event, or to `null` when the
+    calendar holds no event with that UID. Privacy masking applies as on the
+    single-event endpoint.
+    """
+    logger.debug("Batch retrieving %d events with privacy mode: %s", len(body.uids), body.privacy)
+    
+    found = await get_events_by_uids(
+        credentials=credentials,
+        uids=body.uids,
+        calendar_name=body.calendar_name,
+        privacy=body.privacy,
+    )
+    
+    # Warm the single-event cache with what we just fetched
+    for uid, event in found.items():
+        event_cache[event_cache_key(user_info['id'], body.calendar_name, uid, body.privacy)] = event
+    
+    return {uid: found.get(uid) for uid in body.uids}
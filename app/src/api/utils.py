@@ -3,11 +3,7 @@
 
 from fastapi import APIRouter, Depends
 
-from fastapi.security import HTTPBasicCredentials
-from src.common import security
-from src.models.api_params import StatusQueryParams
-from src.common.sec import authenticate_with_nextcloud
-from src import logger
+from src.common.sec import current_user
 
 # --- Router Definition ---
 # We're using the get_user_settings dependency directly in each endpoint
@@ -47,7 +43,7 @@ router = APIRouter()
     },
     tags=["utils"],
 )
-async def get_status(credentials: HTTPBasicCredentials = Depends(security)):
+async def get_status(user_info: dict = Depends(current_user)):
     """
     Get the status of the server and verify Nextcloud connectivity.
     
@@ -73,6 +69,4 @@ async def get_status(credentials: HTTPBasicCredentials = Depends(security)):
     Returns a simple status object indicating the server is operational
     and can successfully authenticate with Nextcloud.
     """
-    user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
     return {"status": "running"}
@@ -6,14 +6,23 @@
 This package contains common helpers for all functions and classes.
 """
 
-import logging
+import json
 import os
+from functools import lru_cache
 from fastapi.security import HTTPBasic
 import yaml
 
+try:  # optional C JSON parser for COMMON_USERS_JSON-style overrides
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
 
 security = HTTPBasic()
-logger = logging.getLogger(__name__)
+
+# The libyaml-backed loader is much faster than the pure-Python one when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# config path -> loaded config (with env overrides applied)
+_CONFIG_CACHE = {}
 
 
 def _get_config_path():
@@ -32,13 +41,7 @@ def _load_users_override_from_env():
     """
     raw_users = os.getenv("COMMON_USERS_YAML") or os.getenv("COMMON_USERS_JSON")
     if raw_users:
-        try:
-            users_data = yaml.safe_load(raw_users)
-        except yaml.YAMLError as exc:
-            raise ValueError("Invalid COMMON_USERS_YAML/JSON content") from exc
-        if not isinstance(users_data, dict):
-            raise ValueError("COMMON_USERS_YAML/JSON must define a mapping of users")
-        return users_data
+        return _parse_users_override(raw_users)
 
     username = os.getenv("NEXTCLOUD_USERNAME")
     password = os.getenv("NEXTCLOUD_PASSWORD")
@@ -54,6 +57,31 @@ def _load_users_override_from_env():
     return None
 
 
+@lru_cache(maxsize=8)
+def _parse_users_override(raw_users):
+    """
+    Parse a COMMON_USERS_YAML/JSON value (cached per raw string).
+
+    JSON objects and arrays are decoded with the JSON parser first; anything
+    else (including YAML flow mappings such as ``{user: {...}}``) goes through YAML.
+    """
+    raw_users = raw_users.strip()
+    users_data = None
+    if raw_users[:1] in ("{", "["):
+        try:
+            users_data = _json_loads(raw_users)
+        except ValueError:
+            pass
+    if users_data is None:
+        try:
+            users_data = yaml.load(raw_users, Loader=_YAML_LOADER)
+        except yaml.YAMLError as exc:
+            raise ValueError("Invalid COMMON_USERS_YAML/JSON content") from exc
+    if not isinstance(users_data, dict):
+        raise ValueError("COMMON_USERS_YAML/JSON must define a mapping of users")
+    return users_data
+
+
 def _override_common_settings(config):
     """Override YAML values with environment variables if provided."""
     overrides = _load_users_override_from_env()
@@ -64,8 +92,19 @@ def _override_common_settings(config):
 
 
 def load_config():
-    """Load configuration from YAML file with optional env overrides."""
+    """
+    Load configuration from YAML file with optional env overrides.
+
+    The result is cached per config path; call ``load_config.cache_clear()``
+    to force a re-read.
+    """
     config_path = _get_config_path()
-    with open(config_path, 'r', encoding='utf-8') as file:
-        config = yaml.safe_load(file)
-    return _override_common_settings(config)
+    config = _CONFIG_CACHE.get(config_path)
+    if config is None:
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.load(file, Loader=_YAML_LOADER)
+        config = _CONFIG_CACHE[config_path] = _override_common_settings(config)
+    return config
+
+
+load_config.cache_clear = _CONFIG_CACHE.clear
@@ -1,18 +1,42 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.responses import JSONResponse
+from src.common.sec import auth_cached, auth_circuit_open
 from src import logger
 
-class CustomProxyHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        x_forwarded_for = request.headers.get("x-forwarded-for")
-        x_forwarded_proto = request.headers.get("x-forwarded-proto")
 
-        if x_forwarded_for:
-            # Met à jour le client avec la première IP dans la liste
-            request.scope["client"] = (x_forwarded_for.split(",")[0].strip(), 0)
-        if x_forwarded_proto:
-            # Met à jour le scheme http/https
-            request.scope["scheme"] = x_forwarded_proto
+class CustomProxyHeadersMiddleware:
+    """
+    Pure ASGI middleware applying X-Forwarded-For/Proto to the request scope.
 
-        response = await call_next(request)
-        return response
+    Reads the raw header list directly instead of going through
+    BaseHTTPMiddleware, which wraps every request in an extra task and streams.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        auth_header = None
+        for name, value in scope["headers"]:
+            if not value:
+                continue
+            if name == b"x-forwarded-for":
+                # Met à jour le client avec la première IP dans la liste
+                scope["client"] = (value.split(b",", 1)[0].strip().decode("latin-1"), 0)
+            elif name == b"x-forwarded-proto":
+                # Met à jour le scheme http/https
+                scope["scheme"] = value.decode("latin-1")
+            elif name == b"authorization":
+                auth_header = value
+
+        # Fail fast while the Nextcloud auth breaker is open, before routing and DI;
+        # credentials still in the auth cache need no Nextcloud call and keep working
+        if auth_header is not None and auth_circuit_open() and not auth_cached(auth_header.decode("latin-1")):
+            response = JSONResponse({"detail": "Nextcloud auth temporarily unavailable"}, status_code=503)
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
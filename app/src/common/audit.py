@@ -1,7 +1,14 @@
 # Copyright (c) 2025 harokku999@gmail.com
 # Licensed under the MIT License - https://opensource.org/licenses/MIT
 
-"""Simple JSONL audit logging helpers."""
+"""
+Simple JSONL audit logging helpers.
+
+While the application runs, entries are queued and a background task appends
+them in batches through one long-lived O_APPEND descriptor, one ``os.write``
+per batch (see ``start_audit_writer``). Without a running writer (scripts,
+tests) each entry is appended directly.
+"""
 
 from __future__ import annotations
 
@@ -10,15 +17,132 @@ import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, TypedDict
+
+from src import logger
+
+try:  # orjson encodes the payload (and datetimes) in C; json is the fallback
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 AUDIT_LOG_PATH = Path(os.getenv("FASTAPI_AUDIT_LOG", "app/logs/audit.log"))
+AUDIT_QUEUE_SIZE = int(os.getenv("FASTAPI_AUDIT_QUEUE_SIZE", "20000"))
+AUDIT_BATCH_SIZE = int(os.getenv("FASTAPI_AUDIT_BATCH_SIZE", "256"))
+# How long shutdown waits for the queued entries to be flushed
+AUDIT_STOP_TIMEOUT = 10.0
+
+_queue: Optional[asyncio.Queue] = None
+_writer_task: Optional[asyncio.Task] = None
+# Entries discarded because the queue was full
+dropped_entries = 0
+
+
+class AuditEntry(TypedDict):
+    """Shape of one audit line (fields are written in this order)."""
+    timestamp: datetime
+    resource: str
+    action: str
+    uid: str
+    before: Optional[Dict[str, Any]]
+    after: Optional[Dict[str, Any]]
+
 
+def _json_default(value: Any) -> str:
+    return value.isoformat() if isinstance(value, datetime) else str(value)
 
-def _write_entry(line: str) -> None:
+
+# The encoder is chosen once at import so each entry costs a single call
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+
+    def _dumps(entry: AuditEntry) -> bytes:
+        """Encode an entry as one newline-terminated JSON line."""
+        return orjson.dumps(entry, default=str, option=_ORJSON_OPTIONS)
+else:  # pragma: no cover - exercised only without orjson
+    def _dumps(entry: AuditEntry) -> bytes:
+        """Encode an entry as one newline-terminated JSON line."""
+        return (json.dumps(entry, default=_json_default) + "\n").encode("utf-8")
+
+
+def _open_log() -> int:
     AUDIT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with AUDIT_LOG_PATH.open("a", encoding="utf-8") as log_file:
-        log_file.write(line + "\n")
+    # O_APPEND makes each write land atomically at the end, even across processes
+    return os.open(str(AUDIT_LOG_PATH), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o640)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _write_entry(line: bytes) -> None:
+    fd = _open_log()
+    try:
+        _write_all(fd, line)
+    finally:
+        os.close(fd)
+
+
+async def _writer_loop(queue: asyncio.Queue, fd: int) -> None:
+    """Drain the queue, writing whatever has accumulated with one syscall per batch."""
+    try:
+        running = True
+        while running:
+            lines = [await queue.get()]
+            while len(lines) < AUDIT_BATCH_SIZE and not queue.empty():
+                lines.append(queue.get_nowait())
+            if lines[-1] is None:  # shutdown sentinel
+                lines.pop()
+                running = False
+            if lines:
+                try:
+                    await asyncio.to_thread(_write_all, fd, b"".join(lines))
+                except OSError as exc:
+                    logger.error("Could not write %s audit entries: %s", len(lines), exc)
+    finally:
+        os.close(fd)
+
+
+def _on_writer_done(task: asyncio.Task) -> None:
+    """Fall back to direct writes if the writer stops without stop_audit_writer."""
+    global _queue, _writer_task
+    if _writer_task is task:
+        _queue = _writer_task = None
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Audit writer stopped, falling back to direct writes: %s", task.exception())
+
+
+async def start_audit_writer() -> None:
+    """
+    Start the background writer (called from the application lifespan).
+
+    The log is opened here, so a bad path or missing permission fails the
+    startup instead of silently killing the writer task.
+    """
+    global _queue, _writer_task
+    if _writer_task is None:
+        fd = await asyncio.to_thread(_open_log)
+        _queue = asyncio.Queue(maxsize=AUDIT_QUEUE_SIZE)
+        _writer_task = asyncio.create_task(_writer_loop(_queue, fd))
+        _writer_task.add_done_callback(_on_writer_done)
+
+
+async def stop_audit_writer() -> None:
+    """Flush the queued entries and stop the background writer (bounded by AUDIT_STOP_TIMEOUT)."""
+    global _queue, _writer_task
+    queue, task = _queue, _writer_task
+    _queue = _writer_task = None
+    if task is None or task.done():
+        return
+    try:
+        await asyncio.wait_for(queue.put(None), timeout=AUDIT_STOP_TIMEOUT)
+        await asyncio.wait_for(task, timeout=AUDIT_STOP_TIMEOUT)
+    except asyncio.TimeoutError:
+        # wait_for already cancelled the writer if it was the one timing out
+        task.cancel()
+        logger.error("Audit writer did not stop in time, %s entries dropped", queue.qsize())
 
 
 async def record_change(
@@ -38,13 +162,21 @@ async def record_change(
         before: Previous payload snapshot (if available).
         after: New payload snapshot (if applicable).
     """
-    entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+    global dropped_entries
+    entry: AuditEntry = {
+        "timestamp": datetime.now(timezone.utc),
         "resource": resource_type,
         "action": action,
         "uid": uid,
         "before": before,
         "after": after,
     }
-    line = json.dumps(entry, default=str)
-    await asyncio.to_thread(_write_entry, line)
+    line = _dumps(entry)
+    if _queue is None:
+        await asyncio.to_thread(_write_entry, line)
+        return
+    try:
+        _queue.put_nowait(line)
+    except asyncio.QueueFull:
+        dropped_entries += 1
+        logger.warning("Audit queue full, dropped %s entry for %s (%s dropped so far)", action, uid, dropped_entries)
@@ -0,0 +1,132 @@
+# Copyright (c) 2025 harokku999@gmail.com
+# Licensed under the MIT License - https://opensource.org/licenses/MIT
+
+"""
+In-process caches for CalDAV and CardDAV read endpoints.
+
+Single events use a plain TTL cache. Time-range listings use
+stale-while-revalidate: fresh entries are returned as-is, stale ones are
+returned immediately while a background task refreshes them. Single contacts
+and contact searches use plain TTL caches (full addressbook listings are
+revalidated against the addressbook ctag in ``src.nextcloud.contacts``).
+
+Entries are keyed by the authenticated Nextcloud user id, so lookups must only
+happen after ``authenticate_with_nextcloud`` succeeded for the request. Write
+endpoints invalidate the affected entries before returning.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from cachetools import LRUCache, TTLCache
+from src import logger
+from src.common.libs.helpers import DEFAULT_ADDRESSBOOK_NAME, DEFAULT_CALENDAR_NAME
+
+EVENT_CACHE_TTL = float(os.getenv("FASTAPI_EVENT_CACHE_TTL", "60"))
+EVENT_CACHE_SIZE = int(os.getenv("FASTAPI_EVENT_CACHE_SIZE", "1024"))
+
+RANGE_CACHE_FRESH = float(os.getenv("FASTAPI_RANGE_CACHE_FRESH", "60"))
+RANGE_CACHE_STALE = float(os.getenv("FASTAPI_RANGE_CACHE_STALE", "300"))
+RANGE_CACHE_SIZE = int(os.getenv("FASTAPI_RANGE_CACHE_SIZE", "1024"))
+
+CONTACT_CACHE_TTL = float(os.getenv("FASTAPI_CONTACT_CACHE_TTL", "30"))
+CONTACT_CACHE_SIZE = int(os.getenv("FASTAPI_CONTACT_CACHE_SIZE", "1024"))
+
+# (user id, calendar name, uid, privacy) -> Event
+event_cache = TTLCache(maxsize=EVENT_CACHE_SIZE, ttl=EVENT_CACHE_TTL)
+
+
+def event_cache_key(user_id: str, calendar_name: Optional[str], uid: str, privacy: bool) -> tuple:
+    # None means the default calendar, so both spellings must share entries
+    return (user_id, calendar_name or DEFAULT_CALENDAR_NAME, uid, bool(privacy))
+
+
+def invalidate_event(user_id: str, calendar_name: Optional[str], uid: str) -> None:
+    """Drop the cached copies (masked and unmasked) of a single event."""
+    for privacy in (False, True):
+        event_cache.pop(event_cache_key(user_id, calendar_name, uid, privacy), None)
+
+
+# (user id, calendar name, start, end, privacy) -> (stored_at, events)
+range_cache = LRUCache(maxsize=RANGE_CACHE_SIZE)
+# (user id, calendar name) -> write counter; stops refreshes started before a write from storing
+_range_generation = {}
+_revalidating = set()
+_background_tasks = set()
+
+
+def range_cache_key(user_id: str, calendar_name: Optional[str], start: str, end: str, privacy: bool) -> tuple:
+    return (user_id, calendar_name or DEFAULT_CALENDAR_NAME, start, end, bool(privacy))
+
+
+def invalidate_ranges(user_id: str, calendar_name: Optional[str]) -> None:
+    """Drop every cached time range of a calendar (any write may intersect them)."""
+    scope = (user_id, calendar_name or DEFAULT_CALENDAR_NAME)
+    _range_generation[scope] = _range_generation.get(scope, 0) + 1
+    for key in [key for key in range_cache if key[:2] == scope]:
+        range_cache.pop(key, None)
+
+
+async def _revalidate(key: tuple, loader: Callable[[], Awaitable[Any]], generation: int) -> None:
+    try:
+        value = await loader()
+        if _range_generation.get(key[:2], 0) == generation:
+            range_cache[key] = (time.monotonic(), value)
+    except Exception as exc:
+        logger.warning("Background refresh of cached time range failed: %s", exc)
+    finally:
+        _revalidating.discard(key)
+
+
+async def cached_time_range(key: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached value for ``key``, refreshing it in the background once stale."""
+    entry = range_cache.get(key)
+    if entry is not None:
+        stored_at, value = entry
+        age = time.monotonic() - stored_at
+        if age < RANGE_CACHE_FRESH:
+            return value
+        if age < RANGE_CACHE_STALE:
+            if key not in _revalidating:
+                _revalidating.add(key)
+                generation = _range_generation.get(key[:2], 0)
+                task = asyncio.create_task(_revalidate(key, loader, generation))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+            return value
+
+    generation = _range_generation.get(key[:2], 0)
+    value = await loader()
+    if _range_generation.get(key[:2], 0) == generation:
+        range_cache[key] = (time.monotonic(), value)
+    return value
+
+
+# (user id, addressbook name, uid, privacy) -> Contact
+contact_cache = TTLCache(maxsize=CONTACT_CACHE_SIZE, ttl=CONTACT_CACHE_TTL)
+# (user id, addressbook name, criteria digest, privacy) -> List[Contact]
+contact_search_cache = TTLCache(maxsize=CONTACT_CACHE_SIZE, ttl=CONTACT_CACHE_TTL)
+
+
+def contact_cache_key(user_id: str, addressbook_name: Optional[str], uid: str, privacy: bool) -> tuple:
+    # None means the default addressbook, so both spellings must share entries
+    return (user_id, addressbook_name or DEFAULT_ADDRESSBOOK_NAME, uid, bool(privacy))
+
+
+def contact_search_cache_key(user_id: str, addressbook_name: Optional[str], criteria: dict, privacy: bool) -> tuple:
+    """Key a search on a digest of its criteria, so equal searches share an entry whatever the field order."""
+    digest = hashlib.blake2b(json.dumps(criteria, sort_keys=True).encode("utf-8"), digest_size=16).digest()
+    return (user_id, addressbook_name or DEFAULT_ADDRESSBOOK_NAME, digest, bool(privacy))
+
+
+def invalidate_contact(user_id: str, addressbook_name: Optional[str], uid: str) -> None:
+    """Drop the cached copies of a contact and every cached search of its addressbook."""
+    for privacy in (False, True):
+        contact_cache.pop(contact_cache_key(user_id, addressbook_name, uid, privacy), None)
+    scope = (user_id, addressbook_name or DEFAULT_ADDRESSBOOK_NAME)
+    for key in [key for key in contact_search_cache if key[:2] == scope]:
+        contact_search_cache.pop(key, None)
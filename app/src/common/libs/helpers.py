@@ -1,8 +1,15 @@
 # Copyright (c) 2025 harokku999@gmail.com
 # Licensed under the MIT License - https://opensource.org/licenses/MIT
 
+import asyncio
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
 from src.nextcloud.config import NEXTCLOUD_BASE_URL
 
+DEFAULT_CALENDAR_NAME = "personal"
+DEFAULT_ADDRESSBOOK_NAME = "contacts"
+
 class UserSettings:
     """ Base class for user settings."""
     NEXTCLOUD_USERNAME: str
@@ -14,6 +21,7 @@ class UserSettings:
         self.NEXTCLOUD_USERNAME = NEXTCLOUD_USERNAME
         self.NEXTCLOUD_PASSWORD = NEXTCLOUD_PASSWORD
 
+@lru_cache(maxsize=4096)
 def gen_nxtcloud_url_addressbook(username: str, addressbook_name: str = None) -> str:
     """Generate the Nextcloud URL for the address book of a given user.
     
@@ -22,12 +30,13 @@ def gen_nxtcloud_url_addressbook(username: str, addressbook_name: str = None) ->
         addressbook_name (str, optional): The name of the addressbook. Defaults to None.
         
     Returns:
-        str: The generated Nextcloud URL for the address book.
+        str: The generated Nextcloud URL for the address book (memoized per user and name).
     """
     if not addressbook_name:
-        addressbook_name = "contacts"
+        addressbook_name = DEFAULT_ADDRESSBOOK_NAME
     return f"{NEXTCLOUD_BASE_URL}/remote.php/dav/addressbooks/users/{username}/{addressbook_name}/"
 
+@lru_cache(maxsize=4096)
 def gen_nxtcloud_url_calendar(username: str, calendar_name: str = None) -> str:
     """Generate the Nextcloud URL for the calendar of a given user.
     
@@ -36,8 +45,31 @@ def gen_nxtcloud_url_calendar(username: str, calendar_name: str = None) -> str:
         calendar_name (str, optional): The name of the calendar. Defaults to None.
         
     Returns:
-        str: The generated Nextcloud URL for the calendar.
+        str: The generated Nextcloud URL for the calendar (memoized per user and name).
     """
     if not calendar_name:
-        calendar_name = "personal"
-    return f"{NEXTCLOUD_BASE_URL}/remote.php/dav/calendars/{username}/{calendar_name}/"
\ No newline at end of file
+        calendar_name = DEFAULT_CALENDAR_NAME
+    return f"{NEXTCLOUD_BASE_URL}/remote.php/dav/calendars/{username}/{calendar_name}/"
+
+
+async def single_flight(inflight: Dict[Hashable, asyncio.Task], key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Share one ``factory()`` call among concurrent callers using the same ``key``.
+
+    The call runs as its own task and every caller, the one that started it
+    included, awaits it through ``asyncio.shield``: cancelling a caller only
+    abandons that caller's wait, while the others still get the result or the
+    exception. The key is released once the task finishes.
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(factory())
+        inflight[key] = task
+
+        def _release(done: asyncio.Task) -> None:
+            if inflight.get(key) is done:
+                del inflight[key]
+            if not done.cancelled():
+                done.exception()  # mark as retrieved when every caller went away
+
+        task.add_done_callback(_release)
+    return await asyncio.shield(task)
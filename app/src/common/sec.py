@@ -5,60 +5,164 @@
 
 import asyncio
 import base64
+import hashlib
+import importlib.util
 import os
+import random
 import time
+from typing import Dict, Optional, Tuple
 
 import httpx
-from fastapi import HTTPException, status
+from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBasicCredentials
+from src.common import security
+from src.common.libs.helpers import single_flight
 from src.nextcloud.config import NEXTCLOUD_BASE_URL
-from cachetools import TTLCache
 from src import logger
-
-# Cache with max 100 users, 300 seconds (5 min) TTL
-auth_cache = TTLCache(maxsize=100, ttl=300)
+
+# Cache with max 4096 credential pairs, 300 seconds (5 min) TTL; only successes are stored.
+# A plain dict of cache key -> (expires_at, user_info): a hit is one lookup and one
+# float compare, without the lock and bookkeeping of cachetools.TTLCache.
+AUTH_CACHE_TTL = 300.0
+AUTH_CACHE_MAXSIZE = 4096
+auth_cache: Dict[bytes, Tuple[float, dict]] = {}
 
 # Circuit breaker / retry controls (configurable through env vars)
 AUTH_TIMEOUT = float(os.getenv("NEXTCLOUD_AUTH_TIMEOUT", "10"))
 AUTH_CONNECT_TIMEOUT = float(os.getenv("NEXTCLOUD_AUTH_CONNECT_TIMEOUT", "5"))
 AUTH_MAX_RETRIES = int(os.getenv("NEXTCLOUD_AUTH_MAX_RETRIES", "3"))
 AUTH_BACKOFF = float(os.getenv("NEXTCLOUD_AUTH_BACKOFF", "0.6"))
+AUTH_BACKOFF_MAX = float(os.getenv("NEXTCLOUD_AUTH_BACKOFF_MAX", "10"))
 AUTH_CIRCUIT_THRESHOLD = int(os.getenv("NEXTCLOUD_AUTH_CIRCUIT_THRESHOLD", "5"))
 AUTH_CIRCUIT_RESET = float(os.getenv("NEXTCLOUD_AUTH_CIRCUIT_RESET", "30"))
 AUTH_PROXY = os.getenv("NEXTCLOUD_AUTH_PROXY")
+AUTH_MAX_CONNECTIONS = int(os.getenv("NEXTCLOUD_AUTH_MAX_CONNECTIONS", "100"))
+AUTH_MAX_KEEPALIVE = int(os.getenv("NEXTCLOUD_AUTH_MAX_KEEPALIVE", "50"))
+# Multiplex concurrent auth calls over one connection when the optional h2 package is installed
+AUTH_HTTP2 = (
+    os.getenv("NEXTCLOUD_AUTH_HTTP2", "1").lower() not in {"0", "false", "no"}
+    and importlib.util.find_spec("h2") is not None
+)
+
+_auth_client: Optional[httpx.AsyncClient] = None
+# cache key -> task of the auth call currently in flight for those credentials
+_inflight: Dict[bytes, asyncio.Task] = {}
 
-_circuit_lock = asyncio.Lock()
+# Only touched from the event loop and never across an await, so no lock is needed
 _circuit_state = {"failures": 0, "open_until": 0.0}
 
 
-def cache_key(credentials: HTTPBasicCredentials) -> str:
-    return f"{credentials.username}:{credentials.password}"
+def cache_key(credentials: HTTPBasicCredentials) -> bytes:
+    """Key the auth cache on a 16-byte BLAKE2b digest of username and password (never the raw secret)."""
+    return hashlib.blake2b(
+        f"{credentials.username}\0{credentials.password}".encode('utf-8'),
+        digest_size=16,
+    ).digest()
 
 
-async def _ensure_circuit_allows_request() -> None:
+def _store_auth(key: bytes, user_info: dict) -> None:
+    """Cache a successful lookup, dropping expired (then oldest) entries when full."""
+    now = time.monotonic()
+    if len(auth_cache) >= AUTH_CACHE_MAXSIZE:
+        for stale in [k for k, (expires_at, _) in auth_cache.items() if expires_at <= now]:
+            del auth_cache[stale]
+        while len(auth_cache) >= AUTH_CACHE_MAXSIZE:
+            del auth_cache[next(iter(auth_cache))]
+    auth_cache[key] = (now + AUTH_CACHE_TTL, user_info)
+
+
+def _header_cache_key(auth_header: str) -> Optional[bytes]:
+    """Return the auth cache key behind a Basic Authorization value (None if malformed)."""
+    try:
+        decoded = base64.b64decode(auth_header.split(" ", 1)[1]).decode("utf-8")
+    except (IndexError, ValueError):
+        return None
+    username, _, password = decoded.partition(":")
+    return cache_key(HTTPBasicCredentials(username=username, password=password))
+
+
+def forget_auth_header(auth_header: str) -> None:
+    """Drop the cached lookup behind a Basic Authorization value that Nextcloud just rejected."""
+    key = _header_cache_key(auth_header)
+    if key is not None:
+        auth_cache.pop(key, None)
+
+
+def auth_cached(auth_header: str) -> bool:
+    """Return True when a Basic Authorization value has an unexpired cached lookup."""
+    key = _header_cache_key(auth_header)
+    entry = auth_cache.get(key) if key is not None else None
+    return entry is not None and entry[0] > time.monotonic()
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Exponential backoff with full jitter, so clients retrying after the same
+    failure do not hit Nextcloud in lockstep. A numeric Retry-After header is
+    honoured as a lower bound (both capped at AUTH_BACKOFF_MAX).
+    """
+    delay = random.uniform(0, min(AUTH_BACKOFF * (2 ** (attempt - 1)), AUTH_BACKOFF_MAX))
+    if retry_after:
+        try:
+            delay = max(delay, min(float(retry_after), AUTH_BACKOFF_MAX))
+        except ValueError:
+            pass  # HTTP-date form; keep the computed delay
+    return delay
+
+
+def _get_auth_client() -> httpx.AsyncClient:
+    """Create (or reuse) the pooled HTTP client used for OCS auth calls."""
+    global _auth_client
+    if _auth_client is None or _auth_client.is_closed:
+        transport = httpx.AsyncHTTPTransport(proxy=AUTH_PROXY, http2=AUTH_HTTP2) if AUTH_PROXY else None
+        _auth_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(AUTH_TIMEOUT, connect=AUTH_CONNECT_TIMEOUT),
+            transport=transport,
+            http2=AUTH_HTTP2,
+            limits=httpx.Limits(
+                max_keepalive_connections=AUTH_MAX_KEEPALIVE,
+                max_connections=AUTH_MAX_CONNECTIONS,
+            ),
+        )
+    return _auth_client
+
+
+async def close_auth_client() -> None:
+    """Close the pooled auth client (application shutdown)."""
+    global _auth_client
+    client, _auth_client = _auth_client, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def _ensure_circuit_allows_request() -> None:
     """Prevent outbound calls when the breaker is open."""
-    async with _circuit_lock:
-        now = time.monotonic()
-        open_until = _circuit_state.get("open_until", 0.0)
-        if open_until and now < open_until:
-            raise HTTPException(status_code=503, detail="Nextcloud auth temporarily unavailable")
-        if open_until and now >= open_until:
-            _circuit_state["open_until"] = 0.0
-            _circuit_state["failures"] = 0
-
-
-async def _record_success() -> None:
-    async with _circuit_lock:
+    open_until = _circuit_state["open_until"]
+    if not open_until:
+        return  # closed: the common case
+    if time.monotonic() < open_until:
+        raise HTTPException(status_code=503, detail="Nextcloud auth temporarily unavailable")
+    _circuit_state["open_until"] = 0.0
+    _circuit_state["failures"] = 0
+
+
+def auth_circuit_open() -> bool:
+    """Return True while the breaker rejects auth calls (lets middleware fail fast)."""
+    open_until = _circuit_state["open_until"]
+    return bool(open_until) and time.monotonic() < open_until
+
+
+def _record_success() -> None:
+    if _circuit_state["failures"] or _circuit_state["open_until"]:
         _circuit_state["failures"] = 0
         _circuit_state["open_until"] = 0.0
 
 
-async def _record_failure() -> None:
-    async with _circuit_lock:
-        _circuit_state["failures"] += 1
-        if _circuit_state["failures"] >= AUTH_CIRCUIT_THRESHOLD:
-            _circuit_state["open_until"] = time.monotonic() + AUTH_CIRCUIT_RESET
-            _circuit_state["failures"] = 0
+def _record_failure() -> None:
+    _circuit_state["failures"] += 1
+    if _circuit_state["failures"] >= AUTH_CIRCUIT_THRESHOLD:
+        _circuit_state["open_until"] = time.monotonic() + AUTH_CIRCUIT_RESET
+        _circuit_state["failures"] = 0
 
 
 async def authenticate_with_nextcloud(credentials: HTTPBasicCredentials):
@@ -71,21 +175,23 @@ async def authenticate_with_nextcloud(credentials: HTTPBasicCredentials):
     
     **Authentication Flow:**
     1. Check if credentials are cached and still valid
-    2. If not cached, make OCS API request to Nextcloud
+    2. If not cached, join an identical lookup already in flight or make the
+       OCS API request to Nextcloud
     3. Validate response and extract user information
     4. Cache successful authentication for future requests
     5. Return user information or raise appropriate HTTP exception
     
     **Caching Strategy:**
-    - Cache key: combination of username and password
+    - Cache key: 16-byte BLAKE2b digest of the username and password
     - TTL: 300 seconds (5 minutes)
-    - Max size: 100 concurrent users
+    - Max size: 4096 credential pairs
+    - Only successful authentications are cached
     - Automatic expiration and cleanup
     
     **Security Considerations:**
     - Credentials are validated against live Nextcloud user database
     - No local password storage or validation
-    - Cache keys use the raw username and password combination stored only in-memory
+    - Cache keys never hold the raw credentials, only their digest (in-memory only)
     - Proper HTTP status codes for different failure scenarios
     
     Args:
@@ -109,39 +215,40 @@ async def authenticate_with_nextcloud(credentials: HTTPBasicCredentials):
     """
     key = cache_key(credentials)
 
-    if key in auth_cache:
-        return auth_cache[key]
+    entry = auth_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    # Single flight: concurrent misses for the same credentials share one OCS call
+    return await single_flight(_inflight, key, lambda: _request_user_info(credentials, key))
 
-    await _ensure_circuit_allows_request()
+
+async def _request_user_info(credentials: HTTPBasicCredentials, key: bytes) -> dict:
+    """Query the OCS user endpoint with retries and the circuit breaker; cache successes."""
+    _ensure_circuit_allows_request()
 
     url = f"{NEXTCLOUD_BASE_URL}/ocs/v2.php/cloud/user?format=json"
-    headers = {"OCS-APIRequest": "true"}
-    timeout = httpx.Timeout(AUTH_TIMEOUT, connect=AUTH_CONNECT_TIMEOUT)
+    # Built per lookup (reused across retries) and never memoized: a cache keyed on the
+    # raw credentials would keep every attempted password, including wrong ones
+    headers = (
+        (b"Authorization", gen_basic_auth_header(credentials.username, credentials.password).encode("latin-1")),
+        (b"OCS-APIRequest", b"true"),
+    )
     attempt = 0
 
     while True:
         attempt += 1
         try:
-            client_kwargs = {"timeout": timeout}
-            transport = None
-            if AUTH_PROXY:
-                transport = httpx.AsyncHTTPTransport(proxy=AUTH_PROXY)
-                client_kwargs["transport"] = transport
-            async with httpx.AsyncClient(**client_kwargs) as client:
-                response = await client.get(
-                    url,
-                    auth=(credentials.username, credentials.password),
-                    headers=headers,
-                )
+            response = await _get_auth_client().get(url, headers=headers)
 
             if response.status_code == 200:
                 user_info = response.json()["ocs"]["data"]
-                auth_cache[key] = user_info
-                await _record_success()
+                _store_auth(key, user_info)
+                _record_success()
                 return user_info
 
             if response.status_code == 401:
-                await _record_success()
+                _record_success()
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid credentials",
@@ -149,10 +256,10 @@ async def authenticate_with_nextcloud(credentials: HTTPBasicCredentials):
                 )
 
             if response.status_code >= 500:
-                await _record_failure()
+                _record_failure()
                 if attempt > AUTH_MAX_RETRIES:
                     raise HTTPException(status_code=503, detail="Nextcloud auth temporarily unavailable")
-                backoff = AUTH_BACKOFF * attempt
+                backoff = _retry_delay(attempt, response.headers.get("Retry-After"))
                 logger.warning(
                     "Nextcloud auth failed with %s (attempt %s/%s), retrying in %.2fs",
                     response.status_code,
@@ -163,14 +270,14 @@ async def authenticate_with_nextcloud(credentials: HTTPBasicCredentials):
                 await asyncio.sleep(backoff)
                 continue
 
-            await _record_success()
+            _record_success()
             raise HTTPException(status_code=response.status_code, detail="Nextcloud auth failed")
 
         except httpx.RequestError as exc:
-            await _record_failure()
+            _record_failure()
             if attempt > AUTH_MAX_RETRIES:
                 raise HTTPException(status_code=503, detail=f"Nextcloud auth unavailable: {exc}") from exc
-            backoff = AUTH_BACKOFF * attempt
+            backoff = _retry_delay(attempt)
             logger.warning(
                 "Nextcloud auth request error (attempt %s/%s): %s. Retrying in %.2fs",
                 attempt,
@@ -181,6 +288,16 @@ async def authenticate_with_nextcloud(credentials: HTTPBasicCredentials):
             await asyncio.sleep(backoff)
 
 
+async def current_user(credentials: HTTPBasicCredentials = Depends(security)) -> dict:
+    """
+    FastAPI dependency returning the authenticated Nextcloud user.
+
+    FastAPI caches dependency values per request, so every consumer in the same
+    request shares one resolution.
+    """
+    return await authenticate_with_nextcloud(credentials)
+
+
 def gen_basic_auth_header(username: str, password: str) -> str:
     """
     Generate an HTTP Basic Authentication header value.
@@ -193,6 +310,9 @@ def gen_basic_auth_header(username: str, password: str) -> str:
     3. Base64 encoding the bytes
     4. Prepending "Basic " to the base64-encoded string
     
+    The value is deliberately not memoized: it is reversible to the password,
+    and a cache would keep it (for wrong passwords too) long after the request.
+    
     Args:
         username: The username for authentication
         password: The password for authentication
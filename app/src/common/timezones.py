@@ -8,7 +8,8 @@ Centralizing TZID extraction and application keeps CalDAV parsing/writing
 consistent and makes reminder handling easier to reason about.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
@@ -23,15 +24,27 @@ def extract_timezone_from_property(prop: Any) -> Optional[str]:
     if not prop:
         return None
 
-    params = getattr(prop, "params", None)
-    if params and "TZID" in params:
-        return str(params["TZID"])
-
-    dt_value = getattr(prop, "dt", None)
-    if isinstance(dt_value, datetime) and dt_value.tzinfo:
-        return timezone_from_datetime(dt_value)
+    # Attribute access in try blocks: the common case (a decoded property) pays
+    # no getattr default handling, and TZID is looked up once
+    try:
+        params = prop.params
+    except AttributeError:
+        params = None
+    if params:
+        tzid = params.get("TZID")
+        if tzid:
+            return str(tzid)
 
-    return None
+    try:
+        dt_value = prop.dt
+    except AttributeError:
+        return None
+    if not isinstance(dt_value, datetime):
+        return None
+    tzinfo = dt_value.tzinfo
+    if tzinfo is None:
+        return None
+    return getattr(tzinfo, "key", None) or tzinfo.tzname(dt_value)
 
 
 def timezone_from_datetime(value: datetime) -> Optional[str]:
@@ -46,6 +59,13 @@ def timezone_from_datetime(value: datetime) -> Optional[str]:
     return tzinfo.tzname(value)
 
 
+def to_naive_utc(value: datetime) -> datetime:
+    """Normalize a datetime to naive UTC (the CalDAV helpers' convention); naive values are taken as UTC."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
 def apply_timezone(value: Optional[datetime], timezone: Optional[str]) -> Optional[datetime]:
     """
     Attach a timezone to a naive datetime when possible.
@@ -55,7 +75,14 @@ def apply_timezone(value: Optional[datetime], timezone: Optional[str]) -> Option
     if not value or value.tzinfo is not None or not timezone:
         return value
 
+    zone = _zoneinfo(timezone)
+    return value.replace(tzinfo=zone) if zone else value
+
+
+@lru_cache(maxsize=256)
+def _zoneinfo(name: str) -> Optional[ZoneInfo]:
+    """Resolve a TZID once; unknown identifiers are cached as None."""
     try:
-        return value.replace(tzinfo=ZoneInfo(timezone))
+        return ZoneInfo(name)
     except (ZoneInfoNotFoundError, ValueError):
-        return value
+        return None
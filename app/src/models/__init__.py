@@ -17,7 +17,7 @@ Modules:
 
 from .contact import Contact, ContactSearchCriteria, Address, Email, Phone
 from .event import Event, EventSearchCriteria, Attendee, Reminder
-from .api_params import UidParam, DateTimeRangeParams, EventsQueryParams, ContactsQueryParams, StatusQueryParams
+from .api_params import UidParam, DateTimeRangeParams, EventsQueryParams, EventsBatchGetRequest, ContactsBatchGetRequest, ContactsBatchCreateRequest, ContactsQueryParams, StatusQueryParams
 
 __all__ = [
     # Contact models
@@ -37,6 +37,9 @@ __all__ = [
     "UidParam",
     "DateTimeRangeParams",
     "EventsQueryParams",
+    "EventsBatchGetRequest",
+    "ContactsBatchGetRequest",
+    "ContactsBatchCreateRequest",
     "ContactsQueryParams",
     "StatusQueryParams",
 ]
\ No newline at end of file
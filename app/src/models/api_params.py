@@ -13,6 +13,9 @@ The module includes:
 - DateTimeRangeParams: Query parameters for datetime range filtering
 - ContactsQueryParams: Query parameters for contacts endpoints
 - EventsQueryParams: Query parameters for events endpoints
+- EventsBatchGetRequest: Request body for fetching several events at once
+- ContactsBatchGetRequest: Request body for fetching several contacts at once
+- ContactsBatchCreateRequest: Request body for creating several contacts at once
 
 Benefits of using Pydantic for API parameters:
 1. Automatic validation of parameter types and formats
@@ -22,12 +25,22 @@ Benefits of using Pydantic for API parameters:
 5. Consistent parameter handling across endpoints
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator, validator
+from typing import Annotated, List, Optional
+from pydantic import BaseModel, Field, StringConstraints, field_validator, model_validator, validator
 from datetime import datetime
 import re
 from src import logger
+from src.common.timezones import to_naive_utc
+from src.models.contact import Contact
 
+# Characters that cannot appear in a <uid>.ics path segment (separators and control
+# characters); the middle class requires at least one non-whitespace character.
+# Kept looser than UidParam so UIDs created by other clients (e.g. "...@google.com") stay reachable.
+_UID_UNSAFE = r"/\\?#\x00-\x1f\x7f"
+UID_PATTERN = rf"^[^{_UID_UNSAFE}]*[^{_UID_UNSAFE}\s][^{_UID_UNSAFE}]*$"
+
+# Characters UidParam rejects as problematic in URLs, matched in a single scan
+_UID_INVALID_RE = re.compile(r"[\\/?#\[\]@!$&'()*+,;=]")
 
 class UidParam(BaseModel):
     """
@@ -51,10 +64,9 @@ class UidParam(BaseModel):
             raise ValueError("UID cannot be empty or whitespace only")
         
         # Check for potentially problematic characters in URLs
-        invalid_chars = ['/', '\\', '?', '#', '[', ']', '@', '!', '$', '&', "'", '(', ')', '*', '+', ',', ';', '=']
-        for char in invalid_chars:
-            if char in v:
-                raise ValueError(f"UID contains invalid character: '{char}'")
+        match = _UID_INVALID_RE.search(v)
+        if match:
+            raise ValueError(f"UID contains invalid character: '{match.group(0)}'")
         
         return v.strip()
 
@@ -65,35 +77,25 @@ class DateTimeRangeParams(BaseModel):
     
     Used for endpoints that need to filter by date/time ranges.
     """
-    start_datetime: str = Field(
+    start_datetime: datetime = Field(
         ...,
         description="Start datetime in ISO format (YYYY-MM-DDTHH:MM:SS)",
         json_schema_extra={"example": "2025-04-21T00:00:00"}
     )
-    end_datetime: str = Field(
+    end_datetime: datetime = Field(
         ...,
         description="End datetime in ISO format (YYYY-MM-DDTHH:MM:SS)",
         json_schema_extra={"example": "2025-04-28T23:59:59"}
     )
     
-    @field_validator('start_datetime', 'end_datetime')
-    def validate_datetime_format(cls, v):
-        """Validate that datetime strings are in correct ISO format."""
-        try:
-            datetime.fromisoformat(v)
-            return v
-        except ValueError:
-            raise ValueError(f"Invalid datetime format: {v}. Expected ISO format (YYYY-MM-DDTHH:MM:SS)")
-    
-    @field_validator('end_datetime')
-    def validate_end_after_start(cls, v, values):
-        """Validate that end_datetime is after start_datetime."""
-        if 'start_datetime' in values:
-            start_dt = datetime.fromisoformat(values['start_datetime'])
-            end_dt = datetime.fromisoformat(v)
-            if end_dt <= start_dt:
-                raise ValueError("end_datetime must be after start_datetime")
-        return v
+    @model_validator(mode="after")
+    def validate_end_after_start(self):
+        """Normalize both bounds to naive UTC, then validate that end_datetime is after start_datetime."""
+        self.start_datetime = to_naive_utc(self.start_datetime)
+        self.end_datetime = to_naive_utc(self.end_datetime)
+        if self.end_datetime <= self.start_datetime:
+            raise ValueError("end_datetime must be after start_datetime")
+        return self
 
 
 class EventsQueryParams(BaseModel):
@@ -102,12 +104,12 @@ class EventsQueryParams(BaseModel):
     
     Combines datetime range filtering with optional calendar selection.
     """
-    start_datetime: str = Field(
+    start_datetime: datetime = Field(
         ...,
         description="Start datetime in ISO format (YYYY-MM-DDTHH:MM:SS)",
         json_schema_extra={"example": "2025-04-21T00:00:00"}
     )
-    end_datetime: str = Field(
+    end_datetime: datetime = Field(
         ...,
         description="End datetime in ISO format (YYYY-MM-DDTHH:MM:SS)",
         json_schema_extra={"example": "2025-04-28T23:59:59"}
@@ -118,24 +120,84 @@ class EventsQueryParams(BaseModel):
         json_schema_extra={"example": "personal"}
     )
     
-    @field_validator('start_datetime', 'end_datetime')
-    def validate_datetime_format(cls, v):
-        """Validate that datetime strings are in correct ISO format."""
-        try:
-            datetime.fromisoformat(v)
-            return v
-        except ValueError:
-            raise ValueError(f"Invalid datetime format: {v}. Expected ISO format (YYYY-MM-DDTHH:MM:SS)")
+    @model_validator(mode="after")
+    def validate_end_after_start(self):
+        """Normalize both bounds to naive UTC, then validate that end_datetime is after start_datetime."""
+        self.start_datetime = to_naive_utc(self.start_datetime)
+        self.end_datetime = to_naive_utc(self.end_datetime)
+        if self.end_datetime <= self.start_datetime:
+            raise ValueError("end_datetime must be after start_datetime")
+        return self
+
+
+class EventsBatchGetRequest(BaseModel):
+    """
+    Request body for fetching several events in one call.
+    
+    All UIDs are resolved with a single CalDAV calendar-multiget REPORT.
+    """
+    uids: List[Annotated[str, StringConstraints(min_length=1, max_length=255, pattern=UID_PATTERN)]] = Field(
+        ...,
+        description="UIDs of the events to retrieve",
+        min_length=1,
+        max_length=100,
+        json_schema_extra={"example": ["550e8400-e29b-41d4-a716-446655440000"]}
+    )
+    calendar_name: Optional[str] = Field(
+        None,
+        description="Optional calendar name to read the events from",
+        max_length=100,
+        json_schema_extra={"example": "personal"}
+    )
+    privacy: bool = Field(
+        False,
+        description="Enable privacy mode to mask sensitive values in the response"
+    )
+
+
+class ContactsBatchGetRequest(BaseModel):
+    """
+    Request body for fetching several contacts in one call.
     
-    @field_validator('end_datetime')
-    def validate_end_after_start(cls, v, values):
-        """Validate that end_datetime is after start_datetime."""
-        if 'start_datetime' in values:
-            start_dt = datetime.fromisoformat(values['start_datetime'])
-            end_dt = datetime.fromisoformat(v)
-            if end_dt <= start_dt:
-                raise ValueError("end_datetime must be after start_datetime")
-        return v
+    All UIDs are resolved with a single CardDAV addressbook-multiget REPORT.
+    """
+    uids: List[Annotated[str, StringConstraints(min_length=1, max_length=255, pattern=UID_PATTERN)]] = Field(
+        ...,
+        description="UIDs of the contacts to retrieve",
+        min_length=1,
+        max_length=100,
+        json_schema_extra={"example": ["550e8400-e29b-41d4-a716-446655440000"]}
+    )
+    addressbook_name: Optional[str] = Field(
+        None,
+        description="Optional addressbook name to read the contacts from",
+        max_length=100,
+        json_schema_extra={"example": "contacts"}
+    )
+    privacy: bool = Field(
+        False,
+        description="Enable privacy mode to mask sensitive values in the response"
+    )
+
+
+class ContactsBatchCreateRequest(BaseModel):
+    """
+    Request body for creating several contacts in one call.
+    
+    The contacts are written with concurrent CardDAV PUTs.
+    """
+    contacts: List[Contact] = Field(
+        ...,
+        description="Contacts to create",
+        min_length=1,
+        max_length=100,
+    )
+    addressbook_name: Optional[str] = Field(
+        None,
+        description="Optional addressbook name to create the contacts in",
+        max_length=100,
+        json_schema_extra={"example": "contacts"}
+    )
 
 
 class ContactsQueryParams(BaseModel):
@@ -88,6 +88,11 @@ class ContactSearchCriteria(BaseModel):
     The search_type field determines whether to use OR logic ("anyof") or AND logic ("allof")
     when multiple search criteria are provided.
 
+    Setting match_type to "equals" turns the partial matches into exact (still
+    case-insensitive) ones, which Nextcloud answers from its indexed card
+    properties instead of scanning the whole addressbook; limit caps the number
+    of results returned by the server.
+
     """
     uid: Optional[str] = Field(None, description="Search by contact UID (case-insensitive partial match)")
     full_name: Optional[str] = Field(None, description="Search by contact's full name (case-insensitive partial match)")
@@ -100,14 +105,19 @@ class ContactSearchCriteria(BaseModel):
         default="anyof",
         description="Search logic: 'anyof' (OR) means any criteria can match, 'allof' (AND) means all criteria must match"
     )
+    match_type: Optional[Literal["contains", "equals"]] = Field(
+        default="contains",
+        description="'contains' for partial matches, 'equals' for exact matches (served from the server-side index)"
+    )
+    limit: Optional[int] = Field(None, ge=1, description="Maximum number of contacts returned by the server")
     
     def to_dict(self):
         """
-        Convert to dictionary, excluding None values and search_type.
+        Convert to dictionary, excluding None values, search_type, match_type and limit.
         
         Returns:
             dict: Dictionary containing only the non-None search criteria fields,
-                  excluding the search_type field which is handled separately.
+                  excluding the search_type, match_type and limit fields which are handled separately.
         """
         return {k: v for k, v in self.model_dump().items()
-                if v is not None and k != "search_type"}
+                if v is not None and k not in ("search_type", "match_type", "limit")}
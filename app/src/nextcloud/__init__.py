@@ -4,6 +4,11 @@
 import os
 import yaml
 
+# The libyaml-backed loader is much faster than the pure-Python one when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# config path -> loaded config (with env overrides applied)
+_CONFIG_CACHE = {}
+
 
 def _get_config_path():
     """Return the config path, allowing NEXTCLOUD_CONFIG_FILE override."""
@@ -26,11 +31,22 @@ def _override_nextcloud_settings(config):
 
 
 def load_config():
-    """Load configuration from YAML file with optional env overrides."""
+    """
+    Load configuration from YAML file with optional env overrides.
+
+    The result is cached per config path; call ``load_config.cache_clear()``
+    to force a re-read.
+    """
     config_path = _get_config_path()
-    with open(config_path, 'r', encoding='utf-8') as file:
-        config = yaml.safe_load(file)
-    return _override_nextcloud_settings(config)
+    config = _CONFIG_CACHE.get(config_path)
+    if config is None:
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.load(file, Loader=_YAML_LOADER)
+        config = _CONFIG_CACHE[config_path] = _override_nextcloud_settings(config)
+    return config
+
+
+load_config.cache_clear = _CONFIG_CACHE.clear
 
 # Error messages
 API_ERR_AUTH_FAILED = "Incorrect username or password"
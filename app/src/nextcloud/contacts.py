@@ -24,6 +24,7 @@ and vCard format conversion for seamless contact management.
 **Supported Operations:**
 - `get_all_contacts()`: Bulk contact retrieval from addressbook
 - `get_contact_by_uid()`: Single contact lookup by unique identifier
+- `get_contacts_by_uids()`: Several contacts in one addressbook-multiget REPORT
 - `search_contacts()`: Advanced filtering with multiple search criteria
 - `create_contact()`: New contact creation with automatic UID generation
 - `update_contact()`: Existing contact modification with conflict detection
@@ -55,7 +56,15 @@ Comprehensive error management with appropriate HTTP status codes:
 - 503: Server communication errors
 """
 
-from src.common.libs.helpers import gen_nxtcloud_url_addressbook
+import asyncio
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import quote, unquote, urlsplit
+
+from cachetools import LRUCache
+
+from src.common.libs.helpers import DEFAULT_ADDRESSBOOK_NAME, gen_nxtcloud_url_addressbook, single_flight
 from fastapi import HTTPException, status
 from fastapi.security import HTTPBasicCredentials
 from src.common.audit import record_change
@@ -64,7 +73,6 @@ from src.models.contact import Contact, ContactSearchCriteria
 from typing import List, Dict, Optional, Any
 
 from src.nextcloud.libs.carddav_helpers import (
-    parse_xml_response,
     parse_vcard_to_contact,
     contact_to_vcard,
     validate_and_correct_url,
@@ -73,6 +81,58 @@ from src.nextcloud.libs.carddav_helpers import (
 from src.nextcloud.libs.dav_clients import CardDavClient
 from src import logger
 
+# Addressbooks with at least this many vCards are parsed in a process pool
+CONTACTS_PARALLEL_THRESHOLD = int(os.getenv("NEXTCLOUD_CONTACTS_PARALLEL_THRESHOLD", "500"))
+_PARSE_WORKERS = os.cpu_count() or 1
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+CONTACTS_CTAG_CACHE_SIZE = int(os.getenv("NEXTCLOUD_CONTACTS_CTAG_CACHE_SIZE", "256"))
+# (user id, addressbook name, privacy) -> (ctag, contacts); a changed ctag means a full REPORT
+_ctag_cache = LRUCache(maxsize=CONTACTS_CTAG_CACHE_SIZE)
+# Serializes concurrent listings of one addressbook so they share a single REPORT
+_ctag_locks: "weakref.WeakValueDictionary[tuple, asyncio.Lock]" = weakref.WeakValueDictionary()
+# (user id, addressbook name, uid, privacy) -> task of the GET currently in flight
+_inflight_lookups: Dict[tuple, asyncio.Task] = {}
+
+# Upper bound on concurrent PUTs issued by create_contacts, to avoid overwhelming Sabre
+CONTACTS_CREATE_CONCURRENCY = int(os.getenv("NEXTCLOUD_CONTACTS_CREATE_CONCURRENCY", "16"))
+
+
+def _contact_url(addressbook_url: str, uid: str) -> str:
+    """URL of the ``<uid>.vcf`` resource inside an addressbook."""
+    return addressbook_url + uid + ".vcf"
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the vCard parsing workers (called from the application lifespan)."""
+    global _parse_pool
+    pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+
+async def _parse_contacts(parsed_data: List[Dict[str, Any]], privacy: Optional[bool]) -> List[Contact]:
+    """
+    Convert REPORT items to contacts without blocking the event loop on large addressbooks.
+
+    Small results are parsed inline, where spawning work would cost more than it saves.
+    Larger ones are split into one slice per worker; the items are plain dicts of
+    strings and the resulting models pickle back cheaply.
+    """
+    global _parse_pool
+    if len(parsed_data) < CONTACTS_PARALLEL_THRESHOLD:
+        return parse_contacts_from_response(parsed_data, privacy)
+
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=_PARSE_WORKERS)
+    loop = asyncio.get_running_loop()
+    size = -(-len(parsed_data) // _PARSE_WORKERS)
+    parts = await asyncio.gather(*(
+        loop.run_in_executor(_parse_pool, parse_contacts_from_response, parsed_data[i:i + size], privacy)
+        for i in range(0, len(parsed_data), size)
+    ))
+    return [contact for part in parts for contact in part]
+
 
 async def _raise_contact_conflict(
     client: CardDavClient,
@@ -113,6 +173,9 @@ async def get_all_contacts(credentials: HTTPBasicCredentials, addressbook_name:
     This function performs a CardDAV REPORT request to retrieve all contacts from
     the specified Nextcloud addressbook. It handles the HTTP request, parses the
     XML response, and converts the vCard data into Contact objects.
+
+    A Depth 0 PROPFIND for the addressbook ctag is issued first; while the ctag
+    is unchanged the previously parsed contacts are returned without a REPORT.
     
     The Contact objects include the following information:
     - UID
@@ -136,21 +199,33 @@ async def get_all_contacts(credentials: HTTPBasicCredentials, addressbook_name:
     Raises:
         HTTPException: For authentication, authorization, server, or parsing errors.
     """
-    logger.debug(f"get_all_contacts: retrieving all contacts with privacy mode: {privacy}")
+    logger.debug("get_all_contacts: retrieving all contacts with privacy mode: %s", privacy)
         
     user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
     
     carddav_url = gen_nxtcloud_url_addressbook(user_info['id'], addressbook_name)
-    logger.debug(f"get_all_contacts: carddav_url: {carddav_url}")
+    logger.debug("get_all_contacts: carddav_url: %s", carddav_url)
 
     auth_header = gen_basic_auth_header(credentials.username, credentials.password)
     client = CardDavClient(carddav_url, auth_header)
-    response_text = await client.report_addressbook()
 
-    parsed_data = parse_xml_response(response_text)
-    contacts = parse_contacts_from_response(parsed_data, privacy)
-    return contacts
+    key = (user_info['id'], addressbook_name or DEFAULT_ADDRESSBOOK_NAME, bool(privacy))
+    # The local reference keeps the lock alive in the weak mapping while it is in use
+    lock = _ctag_locks.get(key)
+    if lock is None:
+        lock = _ctag_locks[key] = asyncio.Lock()
+    async with lock:
+        ctag = await client.get_ctag()
+        cached = _ctag_cache.get(key)
+        if ctag is not None and cached is not None and cached[0] == ctag:
+            logger.debug("get_all_contacts: addressbook unchanged (ctag %s), serving cached contacts", ctag)
+            return list(cached[1])
+
+        parsed_data = await client.report_addressbook()
+        contacts = await _parse_contacts(parsed_data, privacy)
+        if ctag is not None:
+            _ctag_cache[key] = (ctag, contacts)
+    return list(contacts)
 
 
 async def search_contacts(
@@ -179,13 +254,12 @@ async def search_contacts(
     Raises:
         HTTPException: For authentication, authorization, server, or parsing errors.
     """
-    logger.debug(f"search_contacts: searching contacts with criteria: {search_criteria} with privacy mode: {privacy}")
+    logger.debug("search_contacts: searching contacts with criteria: %s with privacy mode: %s", search_criteria, privacy)
         
     user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
     
     carddav_url = gen_nxtcloud_url_addressbook(user_info['id'], addressbook_name)
-    logger.debug(f"search_contacts: carddav_url: {carddav_url}")
+    logger.debug("search_contacts: carddav_url: %s", carddav_url)
     
     auth_header = gen_basic_auth_header(credentials.username, credentials.password)
     # Extract search_type from the criteria
@@ -195,13 +269,13 @@ async def search_contacts(
     criteria_dict = search_criteria.to_dict()
     
     client = CardDavClient(carddav_url, auth_header)
-    response_text = await client.search_addressbook(criteria_dict, search_type)
-    
-    # Parse XML response
-    parsed_data = parse_xml_response(response_text)
+    # The multistatus XML is parsed while it streams in
+    parsed_data = await client.search_addressbook(
+        criteria_dict, search_type, search_criteria.match_type or "contains", search_criteria.limit
+    )
     
     # Parse vCards to Contact objects using the shared helper function
-    contacts = parse_contacts_from_response(parsed_data, privacy)
+    contacts = await _parse_contacts(parsed_data, privacy)
     
     return contacts
 
@@ -227,10 +301,9 @@ async def create_contact(credentials: HTTPBasicCredentials, contact: Contact, ad
     Raises:
         HTTPException: For authentication, authorization, server, or parsing errors.
     """
-    logger.debug(f"create_contact: received contact to create: {contact}")
+    logger.debug("create_contact: received contact to create: %s", contact)
         
     user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
     
     # Ensure the contact has a UID
     if not contact.uid:
@@ -243,29 +316,85 @@ async def create_contact(credentials: HTTPBasicCredentials, contact: Contact, ad
     
     # Ensure the carddav_url ends with a slash
     carddav_url = gen_nxtcloud_url_addressbook(user_info['id'], addressbook_name)
-    logger.debug(f"create_contact: carddav_url: {carddav_url}")
+    logger.debug("create_contact: carddav_url: %s", carddav_url)
     auth_header = gen_basic_auth_header(credentials.username, credentials.password)
     client = CardDavClient(carddav_url, auth_header)
     
-    # Create the contact filename with the UID
-    contact_filename = f"{contact.uid}.vcf"
-    
-    # Join the URL properly
-    contact_url = client.build_url(contact_filename)
+    contact_url = _contact_url(carddav_url, contact.uid)
     
-    # Update the contact's url with the URL where it will be created (with validation)
-    contact.url = validate_and_correct_url(contact_url)
+    # Built from the configured base URL, so it needs no validation
+    contact.url = contact_url
 
-    logger.debug(f"Creating contact at URL: {contact_url}")
+    logger.debug("Creating contact at URL: %s", contact_url)
     
     # Generate the vCard data with the updated url
-    vcard_data = contact_to_vcard(contact)
+    vcard_data = await asyncio.to_thread(contact_to_vcard, contact)
     
     etag = await client.create_contact(contact_url, vcard_data)
     contact.etag = etag or contact.etag
     await record_change("contact", contact.uid, "create", None, contact.model_dump())
     return contact
-
+
+
+async def create_contacts(
+    credentials: HTTPBasicCredentials,
+    contacts: List[Contact],
+    addressbook_name: Optional[str] = None
+) -> List[Contact]:
+    """
+    Create several contacts concurrently in the specified Nextcloud CardDAV addressbook.
+    
+    Each contact goes through ``create_contact``; at most
+    ``CONTACTS_CREATE_CONCURRENCY`` PUTs are in flight at once over the pooled session.
+    Every PUT is allowed to finish before an error is raised, so the contacts that
+    were created stay created (and audited) even when another one fails. The error
+    then lists the UIDs that were created and the failure of every other contact.
+    
+    Args:
+        credentials (HTTPBasicCredentials): HTTP Basic Authentication credentials.
+        contacts (List[Contact]): The Contact objects to create.
+        addressbook_name (Optional[str]): The name of the addressbook. Defaults to None (uses "contacts").
+        
+    Returns:
+        List[Contact]: The created contacts, in request order.
+        
+    Raises:
+        HTTPException: When any creation fails. It carries the status code of the first
+            failure and a detail of the form ``{"message": ..., "created": [uid, ...],
+            "failed": [{"uid": ..., "status_code": ..., "detail": ...}, ...]}``.
+    """
+    semaphore = asyncio.Semaphore(CONTACTS_CREATE_CONCURRENCY)
+    
+    async def create_one(contact: Contact) -> Contact:
+        async with semaphore:
+            return await create_contact(credentials, contact, addressbook_name)
+    
+    results = await asyncio.gather(*(create_one(contact) for contact in contacts), return_exceptions=True)
+    failed = [
+        (contact, result) for contact, result in zip(contacts, results) if isinstance(result, BaseException)
+    ]
+    if failed:
+        logger.debug("create_contacts: %d of %d creations failed", len(failed), len(results))
+        first_error = failed[0][1]
+        if not isinstance(first_error, Exception):
+            raise first_error  # cancellation and friends are not creation failures
+        raise HTTPException(
+            status_code=getattr(first_error, "status_code", status.HTTP_503_SERVICE_UNAVAILABLE),
+            detail={
+                "message": f"{len(failed)} of {len(results)} contacts could not be created",
+                "created": [result.uid for result in results if isinstance(result, Contact)],
+                "failed": [
+                    {
+                        "uid": contact.uid,
+                        "status_code": getattr(error, "status_code", None),
+                        "detail": getattr(error, "detail", None) or str(error),
+                    }
+                    for contact, error in failed
+                ],
+            },
+        )
+    return results
+
 
 async def update_contact(credentials: HTTPBasicCredentials, contact: Contact, addressbook_name: Optional[str] = None) -> Contact:
     """
@@ -291,13 +420,12 @@ async def update_contact(credentials: HTTPBasicCredentials, contact: Contact, ad
         HTTPException: For authentication, authorization, server, or parsing errors.
         ValueError: If the contact doesn't have a UID.
     """
-    logger.debug(f"update_contact: updating contact with UID: {contact.uid}")
+    logger.debug("update_contact: updating contact with UID: %s", contact.uid)
         
     user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
     
     carddav_url = gen_nxtcloud_url_addressbook(user_info['id'], addressbook_name)
-    logger.debug(f"update_contact: carddav_url: {carddav_url}")
+    logger.debug("update_contact: carddav_url: %s", carddav_url)
     
     auth_header = gen_basic_auth_header(credentials.username, credentials.password)
     client = CardDavClient(carddav_url, auth_header)
@@ -311,13 +439,12 @@ async def update_contact(credentials: HTTPBasicCredentials, contact: Contact, ad
         contact_url = contact.url
     else:
         # Construct a URL based on the carddav_url and UID
-        contact_filename = f"{contact.uid}.vcf"
-        contact_url = client.build_url(contact_filename)
+        contact_url = _contact_url(carddav_url, contact.uid)
         
-        # Update the contact's url if it wasn't already set (with validation)
-        contact.url = validate_and_correct_url(contact_url)
+        # Update the contact's url if it wasn't already set (built from the configured base URL)
+        contact.url = contact_url
 
-    logger.debug(f"updating contact at URL: {contact_url}")
+    logger.debug("updating contact at URL: %s", contact_url)
 
     existing_vcard, existing_etag = await client.get_contact(contact_url)
     if existing_vcard is None:
@@ -329,7 +456,7 @@ async def update_contact(credentials: HTTPBasicCredentials, contact: Contact, ad
         raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail="Missing ETag for contact update")
     
     # Generate the vCard data with the updated url
-    vcard_data = contact_to_vcard(contact)
+    vcard_data = await asyncio.to_thread(contact_to_vcard, contact)
     
     try:
         new_etag = await client.update_contact(contact_url, vcard_data, etag=etag_to_use)
@@ -364,13 +491,12 @@ async def delete_contact(credentials: HTTPBasicCredentials, uid: str, addressboo
         HTTPException: For authentication, authorization, server, or parsing errors.
         ValueError: If the uid is empty or None.
     """
-    logger.debug(f"delete_contact: deleting contact with UID: {uid}")
+    logger.debug("delete_contact: deleting contact with UID: %s", uid)
         
     user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
     
     carddav_url = gen_nxtcloud_url_addressbook(user_info['id'], addressbook_name)
-    logger.debug(f"delete_contact: carddav_url: {carddav_url}")
+    logger.debug("delete_contact: carddav_url: %s", carddav_url)
     
     auth_header = gen_basic_auth_header(credentials.username, credentials.password)
     client = CardDavClient(carddav_url, auth_header)
@@ -379,10 +505,9 @@ async def delete_contact(credentials: HTTPBasicCredentials, uid: str, addressboo
         raise ValueError("Contact UID must be provided for deletion")
     
     # Construct the URL for the contact
-    contact_filename = f"{uid}.vcf"
-    contact_url = client.build_url(contact_filename)
+    contact_url = _contact_url(carddav_url, uid)
     
-    logger.debug(f"Deleting contact at URL: {contact_url}")
+    logger.debug("Deleting contact at URL: %s", contact_url)
 
     existing_vcard, existing_etag = await client.get_contact(contact_url)
     if existing_vcard is None:
@@ -422,13 +547,12 @@ async def get_contact_by_uid(credentials: HTTPBasicCredentials, uid: str, addres
         HTTPException: For authentication, authorization, server, or parsing errors.
         ValueError: If the uid is empty or None.
     """
-    logger.debug(f"get_contact_by_uid: retrieving contact with UID: {uid} with privacy mode: {privacy}")
+    logger.debug("get_contact_by_uid: retrieving contact with UID: %s with privacy mode: %s", uid, privacy)
         
     user_info = await authenticate_with_nextcloud(credentials)
-    logger.debug(f"User credentials: {user_info}")
     
     carddav_url = gen_nxtcloud_url_addressbook(user_info['id'], addressbook_name)
-    logger.debug(f"get_contact_by_uid: carddav_url: {carddav_url}")
+    logger.debug("get_contact_by_uid: carddav_url: %s", carddav_url)
     
     auth_header = gen_basic_auth_header(credentials.username, credentials.password)
     client = CardDavClient(carddav_url, auth_header)
@@ -437,14 +561,61 @@ async def get_contact_by_uid(credentials: HTTPBasicCredentials, uid: str, addres
         raise ValueError("Contact UID must be provided for retrieval")
     
     # Construct the URL for the contact
-    contact_filename = f"{uid}.vcf"
-    contact_url = client.build_url(contact_filename)
-    
-    logger.debug(f"Retrieving contact at URL: {contact_url}")
+    contact_url = _contact_url(carddav_url, uid)
     
-    vcard_text, etag = await client.get_contact(contact_url)
-    if vcard_text is None:
-        return None
+    logger.debug("Retrieving contact at URL: %s", contact_url)
+
+    async def fetch() -> Optional[Contact]:
+        vcard_text, etag = await client.get_contact(contact_url)
+        if vcard_text is None:
+            return None
+        return parse_vcard_to_contact(vcard_text, contact_url, privacy, etag)
+
+    # Single flight: concurrent lookups of the same contact share one GET
+    key = (user_info['id'], addressbook_name or DEFAULT_ADDRESSBOOK_NAME, uid, bool(privacy))
+    return await single_flight(_inflight_lookups, key, fetch)
+
+
+async def get_contacts_by_uids(
+    credentials: HTTPBasicCredentials,
+    uids: List[str],
+    addressbook_name: Optional[str] = None,
+    privacy: Optional[bool] = False
+) -> Dict[str, Contact]:
+    """
+    Retrieve several contacts by UID with a single CardDAV addressbook-multiget REPORT.
     
-    contact = parse_vcard_to_contact(vcard_text, contact_url, privacy, etag)
-    return contact
+    Args:
+        credentials (HTTPBasicCredentials): HTTP Basic Authentication credentials.
+        uids (List[str]): The UIDs of the contacts to retrieve.
+        addressbook_name (Optional[str]): The name of the addressbook. Defaults to None (uses "contacts").
+        privacy (Optional[bool]): Enable privacy mode to mask sensitive values. Defaults to False.
+        
+    Returns:
+        Dict[str, Contact]: Contacts found on the server keyed by UID; missing UIDs are absent.
+        
+    Raises:
+        HTTPException: For authentication, authorization, server, or parsing errors.
+        ValueError: If no UID is provided.
+    """
+    if not uids or not all(uids):
+        raise ValueError("Contact UIDs must be provided for retrieval")
+    
+    user_info = await authenticate_with_nextcloud(credentials)
+    carddav_url = gen_nxtcloud_url_addressbook(user_info['id'], addressbook_name)
+    auth_header = gen_basic_auth_header(credentials.username, credentials.password)
+    client = CardDavClient(carddav_url, auth_header)
+    
+    # Percent-encoded like the hrefs the server returns (and unquote() reverses below)
+    hrefs = [quote(urlsplit(_contact_url(carddav_url, uid)).path) for uid in uids]
+    logger.debug("get_contacts_by_uids: fetching %d contacts from %s", len(hrefs), carddav_url)
+    
+    contacts = {}
+    for item in await client.multiget_contacts(hrefs):
+        href = item.get('href') or ''
+        # Resources are stored as <uid>.vcf, so the file name identifies the request
+        uid = unquote(href.rstrip('/').rsplit('/', 1)[-1]).removesuffix(".vcf")
+        contact = parse_vcard_to_contact(item['vcard_data'], validate_and_correct_url(href), privacy, item.get('etag'))
+        if contact:
+            contacts[uid] = contact
+    return contacts
@@ -8,17 +8,19 @@ This module provides functions to interact with Nextcloud CalDAV events.
 It includes functionality to retrieve and search events from a Nextcloud server.
 """
 
-from typing import Optional, List, Any, Dict
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional, List, Any, Dict, Tuple
+from urllib.parse import quote, unquote, urlsplit
 from fastapi import HTTPException, status
 from fastapi.security import HTTPBasicCredentials
 
 from src.common.audit import record_change
-from src.common.libs.helpers import gen_nxtcloud_url_calendar
-from src.common.sec import gen_basic_auth_header, authenticate_with_nextcloud
+from src.common.libs.helpers import DEFAULT_CALENDAR_NAME, gen_nxtcloud_url_calendar
+from src.common.sec import cache_key, gen_basic_auth_header, authenticate_with_nextcloud
 from src.models.event import Event
 from src.nextcloud.libs.caldav_helpers import (
     parse_ical_to_event,
-    parse_caldav_xml_response,
     event_to_ical,
     parse_events_from_response
 )
@@ -27,6 +29,14 @@ from src.nextcloud.libs.dav_clients import CalDavClient
 from src import logger
 
 
+class EventNotFound(Exception):
+    """Raised when the calendar holds no event with the requested UID."""
+
+    def __init__(self, uid: str) -> None:
+        super().__init__(f"Event with UID {uid} not found")
+        self.uid = uid
+
+
 async def _raise_event_conflict(
     client: CalDavClient,
     event_url: str,
@@ -35,13 +45,13 @@ async def _raise_event_conflict(
 ) -> None:
     """
     Fetch the latest event snapshot and raise a conflict with payload metadata.
+
+    Raises ``EventNotFound`` instead when the event no longer exists (a
+    conditional PUT fails with 412 on a missing resource as well).
     """
-    latest_event = None
-    latest_ical, latest_etag = await client.get_event(event_url)
-    if latest_ical:
-        latest_event = parse_ical_to_event(latest_ical, event_url, False, latest_etag)
+    latest_event = await _fetch_event(client, uid, event_url)
 
-    current_payload = latest_event.model_dump() if latest_event else None
+    current_payload = latest_event.model_dump()
     await record_change(
         "event",
         uid,
@@ -58,7 +68,37 @@ async def _raise_event_conflict(
         },
     )
 
-async def get_event_by_uid(credentials: HTTPBasicCredentials, uid: str, calendar_name: Optional[str] = None, privacy: Optional[bool] = False) -> Optional[Event]:
+def _start_sort_key(event: Event) -> float:
+    """
+    Start of an event as seconds since the epoch, for sorting.
+
+    Compares instants rather than ISO strings, so ``Z``/``+02:00`` offsets and
+    all-day dates order correctly. Floating (naive) times are read as UTC; a
+    missing or unparseable start sorts first.
+    """
+    try:
+        start = datetime.fromisoformat(event.start)
+    except (TypeError, ValueError):
+        return float("-inf")
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return start.timestamp()
+
+
+async def _fetch_event(client: CalDavClient, uid: str, event_url: str, privacy: Optional[bool] = False) -> Event:
+    """
+    GET and parse one event through an already authenticated client.
+
+    Lets callers that hold a client (updates, conflict reporting) skip the
+    authentication and client setup done by ``get_event_by_uid``.
+    """
+    ical_text, etag = await client.get_event(event_url)
+    if not ical_text:
+        raise EventNotFound(uid)
+    return parse_ical_to_event(ical_text, event_url, privacy, etag)
+
+
+async def get_event_by_uid(credentials: HTTPBasicCredentials, uid: str, calendar_name: Optional[str] = None, privacy: Optional[bool] = False) -> Event:
     """
     Retrieve a single event by its UID from the specified Nextcloud CalDAV calendar.
     
@@ -72,9 +112,10 @@ async def get_event_by_uid(credentials: HTTPBasicCredentials, uid: str, calendar
         calendar_name (Optional[str]): The name of the calendar. Defaults to None (uses "personal").
         
     Returns:
-        Optional[Event]: The Event object if found, None otherwise.
+        Event: The Event object.
         
     Raises:
+        EventNotFound: If no event with this UID exists.
         HTTPException: For authentication, authorization, server, or parsing errors.
         ValueError: If the uid is empty or None.
     """
@@ -98,11 +139,155 @@ async def get_event_by_uid(credentials: HTTPBasicCredentials, uid: str, calendar
     
     logger.debug(f"Retrieving event at URL: {event_url}")
     
-    ical_text, etag = await client.get_event(event_url)
-    if ical_text is None:
-        return None
-    
-    return parse_ical_to_event(ical_text, event_url, privacy, etag)
+    return await _fetch_event(client, uid, event_url, privacy)
+
+
+async def get_events_by_uids(
+    credentials: HTTPBasicCredentials,
+    uids: List[str],
+    calendar_name: Optional[str] = None,
+    privacy: Optional[bool] = False
+) -> Dict[str, Event]:
+    """
+    Retrieve several events by UID with a single CalDAV calendar-multiget REPORT.
+    
+    Args:
+        credentials (HTTPBasicCredentials): HTTP Basic Authentication credentials.
+        uids (List[str]): The UIDs of the events to retrieve.
+        calendar_name (Optional[str]): The name of the calendar. Defaults to None (uses "personal").
+        privacy (Optional[bool]): Enable privacy mode to mask sensitive values. Defaults to False.
+        
+    Returns:
+        Dict[str, Event]: Events found on the server keyed by UID; missing or
+            unparseable UIDs are absent.
+        
+    Raises:
+        HTTPException: For authentication, authorization, server, or parsing errors.
+        ValueError: If no UID is provided.
+    """
+    events, _ = await _multiget_events(credentials, uids, calendar_name, privacy)
+    return events
+
+
+async def _multiget_events(
+    credentials: HTTPBasicCredentials,
+    uids: List[str],
+    calendar_name: Optional[str],
+    privacy: Optional[bool]
+) -> Tuple[Dict[str, Event], Dict[str, Exception]]:
+    """Fetch ``uids`` with one multiget, returning parsed events and per-UID parse errors.
+
+    A resource that fails to parse is logged and reported in the second mapping
+    instead of failing the whole batch.
+    """
+    if not uids or not all(uids):
+        raise ValueError("Event UIDs must be provided for retrieval")
+    
+    user_info = await authenticate_with_nextcloud(credentials)
+    caldav_url = gen_nxtcloud_url_calendar(user_info['id'], calendar_name)
+    auth_header = gen_basic_auth_header(credentials.username, credentials.password)
+    client = CalDavClient(caldav_url, auth_header)
+    
+    # Percent-encoded like the hrefs the server returns (and unquote() reverses below)
+    hrefs = [quote(urlsplit(client.build_url(f"{uid}.ics")).path) for uid in uids]
+    logger.debug(f"get_events_by_uids: fetching {len(hrefs)} events from {client.base_url}")
+    
+    events = {}
+    errors = {}
+    for item in await client.multiget_events(hrefs):
+        href = item.get('href') or ''
+        # Resources are stored as <uid>.ics, so the file name identifies the request
+        uid = unquote(href.rstrip('/').rsplit('/', 1)[-1]).removesuffix(".ics")
+        try:
+            event = parse_ical_to_event(item['calendar_data'], validate_and_correct_url(href), privacy, item.get('etag'))
+        except Exception as e:
+            logger.error(f"Error parsing event {uid}: {e}")
+            logger.error(f"Event href: {href}")
+            errors[uid] = e
+            continue
+        if event:
+            events[uid] = event
+    return events, errors
+
+
+class BatchedEventFetcher:
+    """
+    Coalesce concurrent single-event reads into one calendar-multiget REPORT.
+    
+    Calls arriving within ``batch_window`` seconds for the same credentials,
+    calendar and privacy mode are fetched together (at most ``batch_max`` per
+    REPORT). A batch holding a single UID falls back to a plain GET.
+    """
+
+    def __init__(self, batch_window: float = 0.005, batch_max: int = 64) -> None:
+        self.batch_window = batch_window
+        self.batch_max = batch_max
+        self._pending: Dict[tuple, List[tuple]] = {}
+        self._tasks = set()
+
+    async def get(
+        self,
+        credentials: HTTPBasicCredentials,
+        uid: str,
+        calendar_name: Optional[str] = None,
+        privacy: Optional[bool] = False
+    ) -> Event:
+        """Return the event for ``uid``, sharing the round-trip with concurrent callers.
+
+        Raises EventNotFound when the calendar has no such event.
+        """
+        loop = asyncio.get_running_loop()
+        # Digest of the credentials, so no plaintext password is kept while a batch is pending
+        key = (cache_key(credentials), calendar_name or DEFAULT_CALENDAR_NAME, bool(privacy))
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            loop.call_later(self.batch_window, self._flush, key, batch, credentials, calendar_name, privacy)
+        future = loop.create_future()
+        batch.append((uid, future))
+        if len(batch) >= self.batch_max:
+            self._flush(key, batch, credentials, calendar_name, privacy)
+        return await future
+
+    def _flush(self, key, batch, credentials, calendar_name, privacy) -> None:
+        if self._pending.get(key) is not batch:
+            return  # already flushed because it reached batch_max
+        del self._pending[key]
+        task = asyncio.create_task(self._run(batch, credentials, calendar_name, privacy))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch, credentials, calendar_name, privacy) -> None:
+        errors = {}
+        try:
+            if len(batch) == 1:
+                uid, future = batch[0]
+                results = {uid: await get_event_by_uid(credentials, uid, calendar_name, privacy)}
+            else:
+                uids = list(dict.fromkeys(uid for uid, _ in batch))
+                results, errors = await _multiget_events(credentials, uids, calendar_name, privacy)
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        except BaseException:
+            # The batch task itself was cancelled (e.g. at shutdown): release every waiter
+            for _, future in batch:
+                future.cancel()
+            raise
+        for uid, future in batch:
+            if future.done():
+                continue
+            if uid in results:
+                future.set_result(results[uid])
+            elif uid in errors:
+                future.set_exception(errors[uid])
+            else:
+                future.set_exception(EventNotFound(uid))
+
+
+event_fetcher = BatchedEventFetcher()
 
 
 async def get_events_by_time_range(
@@ -147,16 +332,14 @@ async def get_events_by_time_range(
     
     logger.debug(f"Retrieving events between {start_datetime} and {end_datetime} from {client.base_url}")
     
-    response_text = await client.report_time_range(start_datetime, end_datetime)
-    
-    # Parse the XML response
-    calendar_items = parse_caldav_xml_response(response_text)
+    # The multistatus XML is parsed while it streams in
+    calendar_items = await client.report_time_range(start_datetime, end_datetime)
     
     # Convert each calendar item to an Event object using the new helper function
     events = parse_events_from_response(calendar_items, privacy)
     
-    # Sort events by start datetime
-    events.sort(key=lambda event: event.start if event.start else "")
+    # Sort events by start instant (the key is computed once per event; the sort is stable)
+    events.sort(key=_start_sort_key)
     
     logger.debug(f"Sorted {len(events)} events by start datetime")
     
@@ -210,17 +393,17 @@ async def create_event(credentials: HTTPBasicCredentials, event: Event, calendar
     
     logger.debug(f"Creating event at URL: {event_url}")
     
-    # Convert the Event object to iCalendar format
-    ical_data = event_to_ical(event)
+    # Convert the Event object to iCalendar format (CPU-bound, kept off the event loop)
+    ical_data = await asyncio.to_thread(event_to_ical, event)
     
-    logger.debug(f"iCalendar data:\n{ical_data}")
+    logger.debug("iCalendar data:\n%s", ical_data)
     
     new_etag = await client.create_event(event_url, ical_data)
     event.etag = new_etag or event.etag
     await record_change("event", event.uid, "create", None, event.model_dump())
     
-    # Update the event URL with validation
-    event.url = validate_and_correct_url(event_url)
+    # event_url is built from the configured base URL, so it needs no validation
+    event.url = event_url
     
     logger.debug(f"Event created successfully with UID: {event.uid}")
     
@@ -273,40 +456,45 @@ async def update_event(credentials: HTTPBasicCredentials, event: Event, calendar
     
     logger.debug(f"Updating event at URL: {event_url}")
     
-    # Optional: Check if the event exists
-    existing_event = await get_event_by_uid(credentials, event.uid, calendar_name)
-    if not existing_event:
-        raise ValueError(f"Event with UID {event.uid} not found")
-    
-    # Preserve certain fields from the existing event if not provided in the update
-    if not event.url:
-        event.url = validate_and_correct_url(existing_event.url) if existing_event.url else None
-    
-    if not event.created:
-        event.created = existing_event.created
-    
-    etag_to_use = event.etag or existing_event.etag
-    if not etag_to_use:
-        raise ValueError("Event ETag is required for updates")
+    # The stored copy is only needed to carry CREATED over when the payload lacks it;
+    # otherwise the conditional PUT below is enough to detect missing or changed events
+    existing_event = None
+    if not event.created:
+        try:
+            existing_event = await _fetch_event(client, event.uid, event_url)
+        except EventNotFound as exc:
+            raise ValueError(str(exc)) from None
+        event.created = existing_event.created
     
-    # Convert the Event object to iCalendar format
-    ical_data = event_to_ical(event)
+    # If-Match: * only succeeds when the event exists
+    etag_to_use = event.etag or (existing_event.etag if existing_event else None) or "*"
     
-    logger.debug(f"iCalendar data for update:\n{ical_data}")
+    # Convert the Event object to iCalendar format (CPU-bound, kept off the event loop)
+    ical_data = await asyncio.to_thread(event_to_ical, event)
+    
+    logger.debug("iCalendar data for update:\n%s", ical_data)
     
     try:
         new_etag = await client.update_event(event_url, ical_data, etag=etag_to_use)
     except HTTPException as exc:
-        if exc.status_code == status.HTTP_412_PRECONDITION_FAILED:
-            await _raise_event_conflict(client, event_url, event.uid, event.model_dump())
+        if exc.status_code in (status.HTTP_404_NOT_FOUND, status.HTTP_412_PRECONDITION_FAILED):
+            try:
+                await _raise_event_conflict(client, event_url, event.uid, event.model_dump())
+            except EventNotFound as not_found:
+                raise ValueError(str(not_found)) from None
         raise
     
-    # Update the event URL (in case it changed) with validation
-    event.url = validate_and_correct_url(event_url)
-    event.etag = new_etag or etag_to_use
+    # Update the event URL (in case it changed); built from the configured base URL
+    event.url = event_url
+    event.etag = new_etag or (etag_to_use if etag_to_use != "*" else None)
     
     logger.debug(f"Event updated successfully with UID: {event.uid}")
-    await record_change("event", event.uid, "update", existing_event.model_dump(), event.model_dump())
+    if existing_event:
+        before = existing_event.model_dump()
+    else:
+        # Without the preflight read only the replaced version's location and ETag are known
+        before = {"uid": event.uid, "url": event_url, "etag": etag_to_use if etag_to_use != "*" else None}
+    await record_change("event", event.uid, "update", before, event.model_dump())
     
     return event
 
@@ -350,23 +538,14 @@ async def delete_event(credentials: HTTPBasicCredentials, uid: str, calendar_nam
     
     logger.debug(f"Deleting event at URL: {event_url}")
     
-    # Optional: Check if the event exists
-    existing_event = await get_event_by_uid(credentials, uid, calendar_name)
-    if not existing_event:
-        logger.debug(f"Event with UID {uid} not found, nothing to delete")
-        return False
-    
-    try:
-        deleted = await client.delete_event(event_url, etag=existing_event.etag)
-    except HTTPException as exc:
-        if exc.status_code == status.HTTP_412_PRECONDITION_FAILED:
-            await _raise_event_conflict(client, event_url, uid, {"deleted": True})
-        raise
-
+    # No preflight GET: the server answers 404 for a missing event
+    deleted = await client.delete_event(event_url)
+
     if not deleted:
         logger.debug(f"Event with UID {uid} not found on server")
         return False
     
     logger.debug(f"Event deleted successfully with UID: {uid}")
-    await record_change("event", uid, "delete", existing_event.model_dump(), None)
+    # The deleted payload is not read beforehand, so the entry only references its location
+    await record_change("event", uid, "delete", {"uid": uid, "url": event_url, "etag": None}, None)
     return True
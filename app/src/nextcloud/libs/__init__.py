@@ -1,2 +1,27 @@
+import xml.etree.ElementTree as ET
 
-PRIVACY_MODE_TXT: str = "** Privacy mode activated **"
\ No newline at end of file
+try:  # lxml (libxml2) parses multistatus bodies in C; the stdlib parser is the fallback
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - optional dependency
+    lxml_etree = None
+
+PRIVACY_MODE_TXT: str = "** Privacy mode activated **"
+
+
+def new_multistatus_parser():
+    """
+    Return an incremental parser emitting an ``end`` event per closed DAV ``<response>``.
+
+    Uses lxml when it is installed (only ``{DAV:}response`` events are reported,
+    blank text is dropped and no id table is kept), ``xml.etree`` otherwise. Both
+    expose the same ``feed``/``read_events``/``close`` interface.
+    """
+    if lxml_etree is not None:
+        return lxml_etree.XMLPullParser(
+            events=('end',),
+            tag='{DAV:}response',
+            remove_blank_text=True,
+            collect_ids=False,
+            huge_tree=False,
+        )
+    return ET.XMLPullParser(events=('end',))
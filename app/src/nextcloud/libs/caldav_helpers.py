@@ -9,15 +9,16 @@ including iCalendar parsing, event formatting, and component processing.
 """
 
 from fastapi import HTTPException
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterable, List, Dict, Any, Iterator, Optional
 import icalendar
-import xml.etree.ElementTree as ET
 from datetime import datetime
+from xml.sax.saxutils import escape
 
 from src.models.event import Event, Attendee, Reminder
-from src.nextcloud.libs import PRIVACY_MODE_TXT
+from src.nextcloud.libs import PRIVACY_MODE_TXT, new_multistatus_parser
 from src.nextcloud.libs.carddav_helpers import validate_and_correct_url
 from src.common.timezones import extract_timezone_from_property
+from src import logger
 from src.reminders.utils import (
     build_reminder_payload,
     decode_trigger_value,
@@ -358,6 +359,50 @@ def create_calendar_query_xml(start_datetime: str, end_datetime: str) -> str:
     </c:filter>
 </c:calendar-query>"""
 
+def create_calendar_multiget_xml(hrefs: List[str]) -> str:
+    """
+    Create the XML data for a CalDAV calendar-multiget request.
+    
+    Args:
+        hrefs (List[str]): Absolute or server-relative URLs of the .ics resources to fetch.
+        
+    Returns:
+        str: Complete XML data for the request.
+    """
+    href_elements = "\n".join(f"    <d:href>{escape(href)}</d:href>" for href in hrefs)
+    
+    return f"""<?xml version="1.0" encoding="utf-8" ?>
+<c:calendar-multiget xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
+    <d:prop>
+        <d:getetag/>
+        <c:calendar-data/>
+    </d:prop>
+{href_elements}
+</c:calendar-multiget>"""
+
+def _drain_calendar_items(parser) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the href/calendar_data/etag of every <response> the parser has closed so far.
+
+    Each element is cleared once read, so a large multistatus never lives in
+    memory as a complete tree.
+    """
+    for _, response_element in parser.read_events():
+        if response_element.tag != '{DAV:}response':
+            continue
+        href_element = response_element.find('.//{DAV:}href')
+        etag_element = response_element.find('.//{DAV:}getetag')
+        calendar_data_element = response_element.find('.//{urn:ietf:params:xml:ns:caldav}calendar-data')
+
+        if calendar_data_element is not None and calendar_data_element.text:
+            yield {
+                'href': href_element.text if href_element is not None else None,
+                'calendar_data': calendar_data_element.text,
+                'etag': etag_element.text if etag_element is not None else None,
+            }
+        response_element.clear()
+
+
 def parse_caldav_xml_response(response_text: str) -> List[Dict[str, Any]]:
     """
     Parse the XML response from the CalDAV server.
@@ -368,21 +413,29 @@ def parse_caldav_xml_response(response_text: str) -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: List of dictionaries containing href and calendar_data.
     """
+    parser = new_multistatus_parser()
+    parser.feed(response_text)
+    parser.close()
+    return list(_drain_calendar_items(parser))
+
+
+async def parse_caldav_xml_stream(chunks: AsyncIterable[bytes]) -> List[Dict[str, Any]]:
+    """
+    Parse a CalDAV multistatus body while it is being received.
+
+    Args:
+        chunks (AsyncIterable[bytes]): Raw body chunks (e.g. ``response.content.iter_chunked``).
+
+    Returns:
+        List[Dict[str, Any]]: Same items as ``parse_caldav_xml_response``.
+    """
     result = []
-    root = ET.fromstring(response_text)
-    
-    for response_element in root.findall('.//{DAV:}response'):
-        href_element = response_element.find('.//{DAV:}href')
-        etag_element = response_element.find('.//{DAV:}getetag')
-        calendar_data_element = response_element.find('.//{urn:ietf:params:xml:ns:caldav}calendar-data')
-        
-        if calendar_data_element is not None and calendar_data_element.text:
-            result.append({
-                'href': href_element.text if href_element is not None else None,
-                'calendar_data': calendar_data_element.text,
-                'etag': etag_element.text if etag_element is not None else None,
-            })
-    
+    parser = new_multistatus_parser()
+    async for chunk in chunks:
+        parser.feed(chunk)
+        result.extend(_drain_calendar_items(parser))
+    parser.close()
+    result.extend(_drain_calendar_items(parser))
     return result
 
 
@@ -558,8 +611,6 @@ def parse_events_from_response(parsed_data: List[Dict[str, Any]], privacy: Optio
     Returns:
         List[Event]: List of successfully parsed Event objects.
     """
-    from src import logger
-    
     events = []
     for i, item in enumerate(parsed_data):
         href = item.get('href', None)
@@ -9,10 +9,13 @@ including request creation, response parsing, and vCard processing.
 """
 
 from fastapi import HTTPException
+from functools import lru_cache
 from src.models.contact import Address, Contact, Email, Phone
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import AsyncIterable, Dict, Any, Iterable, Iterator, List, Mapping, Optional
 import vobject
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
 from urllib.parse import urlparse, urlunparse
 
 from src.nextcloud import (
@@ -22,12 +25,29 @@ from src.nextcloud import (
     API_ERR_SERVER_ERROR,
     API_ERR_SERVER_UNATTENDED_RESPONSE
 )
-from src.nextcloud.libs import PRIVACY_MODE_TXT
+from src.nextcloud.libs import PRIVACY_MODE_TXT, new_multistatus_parser
 from src.nextcloud.config import NEXTCLOUD_BASE_URL
 from src import logger
 
 
-def create_request_headers(auth_header: str) -> Dict[str, str]:
+# Header builders return read-only mappings; copy them to add per-request headers.
+# They are not memoized: a cache keyed on the Authorization value would keep
+# every user's (base64-encoded) password in memory indefinitely.
+
+def create_auth_headers(auth_header: str) -> Mapping[str, str]:
+    """
+    Create the headers for a plain CardDAV GET or DELETE.
+    
+    Args:
+        auth_header (str): HTTP Authorization header value.
+        
+    Returns:
+        Mapping[str, str]: Read-only headers for the request.
+    """
+    return MappingProxyType({"authorization": auth_header})
+
+
+def create_request_headers(auth_header: str) -> Mapping[str, str]:
     """
     Create headers for the CardDAV request.
     
@@ -35,23 +55,34 @@ def create_request_headers(auth_header: str) -> Dict[str, str]:
         auth_header (str): HTTP Authorization header value.
         
     Returns:
-        Dict[str, str]: Headers dictionary for the request.
+        Mapping[str, str]: Read-only headers for the request.
     """
-    return {
+    return MappingProxyType({
         "Depth": "1",
         "Content-Type": "application/xml; charset=utf-8",
         "authorization": auth_header
-    }
+    })
 
 
-def create_request_xml() -> str:
+def create_propfind_headers(auth_header: str) -> Mapping[str, str]:
     """
-    Create the XML data for the CardDAV request.
+    Create headers for a Depth 0 PROPFIND on the addressbook itself.
     
+    Args:
+        auth_header (str): HTTP Authorization header value.
+        
     Returns:
-        str: XML data for the request.
+        Mapping[str, str]: Read-only headers for the request.
     """
-    return """<?xml version="1.0"?>
+    return MappingProxyType({
+        "Depth": "0",
+        "Content-Type": "application/xml; charset=utf-8",
+        "authorization": auth_header
+    })
+
+
+# Static request bodies, encoded once at import and sent as-is
+_REPORT_XML = b"""<?xml version="1.0"?>
                 <card:addressbook-query xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">
                 <d:prop>
                     <d:getetag/>
@@ -59,6 +90,61 @@ def create_request_xml() -> str:
                 </d:prop>
                 </card:addressbook-query>"""
 
+_CTAG_REQUEST_XML = b"""<?xml version="1.0"?>
+                <d:propfind xmlns:d="DAV:" xmlns:cs="http://calendarserver.org/ns/">
+                <d:prop>
+                    <cs:getctag/>
+                </d:prop>
+                </d:propfind>"""
+
+
+def create_request_xml() -> bytes:
+    """
+    Create the XML data for the CardDAV request.
+    
+    Returns:
+        bytes: XML data for the request (a shared constant).
+    """
+    return _REPORT_XML
+
+
+def create_ctag_request_xml() -> bytes:
+    """
+    Create the PROPFIND body asking for the addressbook ctag.
+    
+    Returns:
+        bytes: XML data for the request (a shared constant).
+    """
+    return _CTAG_REQUEST_XML
+
+
+def parse_ctag_response(response_text: str) -> Optional[str]:
+    """
+    Extract the ctag from a PROPFIND multistatus.
+    
+    Args:
+        response_text (str): XML response text from the server.
+        
+    Returns:
+        Optional[str]: The ctag, or None when the server does not expose one.
+    """
+    ctag_element = ET.fromstring(response_text).find('.//{http://calendarserver.org/ns/}getctag')
+    return ctag_element.text if ctag_element is not None and ctag_element.text else None
+
+
+def trim_response_text(response_text: str, limit: int = 512) -> str:
+    """
+    Shorten a server response body for use in an error message.
+    
+    Args:
+        response_text (str): Response text from the server.
+        limit (int): Maximum number of characters kept. Defaults to 512.
+        
+    Returns:
+        str: The text itself, or its first ``limit`` characters followed by an ellipsis.
+    """
+    return response_text if len(response_text) <= limit else response_text[:limit] + "…"
+
 
 def handle_response_status(status_code: int, response_text: str) -> None:
     """
@@ -84,7 +170,30 @@ def handle_response_status(status_code: int, response_text: str) -> None:
     if status_code >= 500:
         raise HTTPException(status_code=500, detail=API_ERR_SERVER_ERROR)
     if status_code != 207:
-        raise HTTPException(status_code=status_code, detail=f"{API_ERR_SERVER_UNATTENDED_RESPONSE}: {response_text}")
+        raise HTTPException(status_code=status_code, detail=f"{API_ERR_SERVER_UNATTENDED_RESPONSE}: {trim_response_text(response_text)}")
+
+
+def _drain_response_items(parser) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the href/vcard_data/etag of every <response> the parser has closed so far.
+
+    Each element is cleared once read, so a large multistatus never lives in
+    memory as a complete tree.
+    """
+    for _, response_element in parser.read_events():
+        if response_element.tag != '{DAV:}response':
+            continue
+        href_element = response_element.find('.//{DAV:}href')
+        etag_element = response_element.find('.//{DAV:}getetag')
+        vcard_data_element = response_element.find('.//{urn:ietf:params:xml:ns:carddav}address-data')
+
+        if vcard_data_element is not None and vcard_data_element.text:
+            yield {
+                'href': href_element.text if href_element is not None else None,
+                'vcard_data': vcard_data_element.text,
+                'etag': etag_element.text if etag_element is not None else None,
+            }
+        response_element.clear()
 
 
 def parse_xml_response(response_text: str) -> List[Dict[str, Any]]:
@@ -97,21 +206,29 @@ def parse_xml_response(response_text: str) -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: List of dictionaries containing href and vcard_data.
     """
+    parser = new_multistatus_parser()
+    parser.feed(response_text)
+    parser.close()
+    return list(_drain_response_items(parser))
+
+
+async def parse_xml_stream(chunks: AsyncIterable[bytes]) -> List[Dict[str, Any]]:
+    """
+    Parse a multistatus body while it is being received.
+
+    Args:
+        chunks (AsyncIterable[bytes]): Raw body chunks (e.g. ``response.content.iter_chunked``).
+
+    Returns:
+        List[Dict[str, Any]]: Same items as ``parse_xml_response``.
+    """
     result = []
-    root = ET.fromstring(response_text)
-    
-    for response_element in root.findall('.//{DAV:}response'):
-        href_element = response_element.find('.//{DAV:}href')
-        etag_element = response_element.find('.//{DAV:}getetag')
-        vcard_data_element = response_element.find('.//{urn:ietf:params:xml:ns:carddav}address-data')
-        
-        if vcard_data_element is not None and vcard_data_element.text:
-            result.append({
-                'href': href_element.text if href_element is not None else None,
-                'vcard_data': vcard_data_element.text,
-                'etag': etag_element.text if etag_element is not None else None,
-            })
-    
+    parser = new_multistatus_parser()
+    async for chunk in chunks:
+        parser.feed(chunk)
+        result.extend(_drain_response_items(parser))
+    parser.close()
+    result.extend(_drain_response_items(parser))
     return result
 
 
@@ -124,6 +241,10 @@ def parse_vcard_to_contact(
     """
     Parse a vCard string into a Contact object.
     
+    Every value handed to the models below is already a ``str`` (or ``None``), so
+    they are built with ``model_construct`` and skip Pydantic validation; this
+    runs once per vCard of every addressbook REPORT.
+    
     This function extracts relevant information from a vCard string and creates a Contact object.
     It handles various vCard properties including:
     - UID
@@ -159,12 +280,12 @@ def parse_vcard_to_contact(
                     try:
                         # Safely extract type_param
                         tag = str(e.type_param) if hasattr(e, 'type_param') and e.type_param is not None else ""
-                        emails.append(Email(email=str(e.value), tag=tag))
+                        emails.append(Email.model_construct(email=str(e.value), tag=tag))
                     except Exception as email_error:
                         logger.error(f"Error parsing email for contact UID {uid}: {email_error}")
                         logger.error(f"Email object: {e}")
                         # Add email without tag as fallback
-                        emails.append(Email(email=str(e.value), tag=""))
+                        emails.append(Email.model_construct(email=str(e.value), tag=""))
         
         # Extract phone numbers
         phones = []
@@ -174,12 +295,12 @@ def parse_vcard_to_contact(
                     try:
                         # Safely extract type_param
                         tag = str(p.type_param) if hasattr(p, 'type_param') and p.type_param is not None else ""
-                        phones.append(Phone(number=str(p.value), tag=tag))
+                        phones.append(Phone.model_construct(number=str(p.value), tag=tag))
                     except Exception as phone_error:
                         logger.error(f"Error parsing phone for contact UID {uid}: {phone_error}")
                         logger.error(f"Phone object: {p}")
                         # Add phone without tag as fallback
-                        phones.append(Phone(number=str(p.value), tag=""))
+                        phones.append(Phone.model_construct(number=str(p.value), tag=""))
         
         # Extract addresses
         addresses = []
@@ -190,16 +311,17 @@ def parse_vcard_to_contact(
                         # Safely extract type_param
                         tag = str(adr.type_param) if hasattr(adr, 'type_param') and adr.type_param is not None else ""
 
-                        # If privacy is enabled
-                        street=str(adr.value.street) if hasattr(adr.value, 'street') else None
-                        city=str(adr.value.city) if hasattr(adr.value, 'city') else None
-                        postal_code=str(adr.value.code) if hasattr(adr.value, 'code') else None
+                        # If privacy is enabled, the masked parts are never read
                         if privacy is True:
                             city = PRIVACY_MODE_TXT
                             street = PRIVACY_MODE_TXT
                             postal_code = None
+                        else:
+                            street=str(adr.value.street) if hasattr(adr.value, 'street') else None
+                            city=str(adr.value.city) if hasattr(adr.value, 'city') else None
+                            postal_code=str(adr.value.code) if hasattr(adr.value, 'code') else None
 
-                        addresses.append(Address(
+                        addresses.append(Address.model_construct(
                             street=street,
                             city=city,
                             state=str(adr.value.region) if hasattr(adr.value, 'region') else None,
@@ -221,7 +343,7 @@ def parse_vcard_to_contact(
                             street = PRIVACY_MODE_TXT
                             postal_code = None
 
-                        addresses.append(Address(
+                        addresses.append(Address.model_construct(
                             street=street,
                             city=city,
                             state=str(adr.value.region) if hasattr(adr.value, 'region') else None,
@@ -230,17 +352,12 @@ def parse_vcard_to_contact(
                             tag=""
                         ))
         
-        # Extract birthday and format as YYYY-MM-DD
+        # Extract birthday and format as YYYY-MM-DD (left as None in privacy mode)
         birthday = None
-        if hasattr(vcard, 'bday'):
+        if privacy is not True and hasattr(vcard, 'bday'):
             try:
                 # Get the raw birthday value
                 bday_value = str(vcard.bday.value)
-
-                if privacy is True:
-                    # If privacy is enabled, return None for birthday
-                    birthday = None
-                    return
                 
                 # Handle different vCard birthday formats
                 # Format 1: YYYYMMDD
@@ -302,7 +419,7 @@ def parse_vcard_to_contact(
                         groups.append(value)
         
         # Create and return Contact object
-        return Contact(
+        return Contact.model_construct(
             uid=uid,
             full_name=full_name,
             emails=emails,
@@ -338,18 +455,19 @@ def create_prop_filter(property_name: str, search_value: str, match_type: str =
     """
     return f"""
         <card:prop-filter name="{property_name}">
-            <card:text-match collation="i;unicode-casemap" match-type="{match_type}">{search_value}</card:text-match>
+            <card:text-match collation="i;unicode-casemap" match-type="{match_type}">{escape(search_value)}</card:text-match>
         </card:prop-filter>
     """
 
 
-def create_search_filter_xml(search_criteria: Dict[str, str], search_type: str = "anyof") -> str:
+def create_search_filter_xml(search_criteria: Dict[str, str], search_type: str = "anyof", match_type: str = "contains") -> str:
     """
     Create a CardDAV filter XML string based on search criteria.
     
     Args:
         search_criteria (Dict[str, str]): Dictionary mapping property names to search values.
         search_type (str): The search type, either "anyof" (OR logic) or "allof" (AND logic).
+        match_type (str): Text match type applied to every criterion ("contains" or "equals").
         
     Returns:
         str: XML string for the filter, or empty string if no criteria provided.
@@ -369,7 +487,7 @@ def create_search_filter_xml(search_criteria: Dict[str, str], search_type: str =
     
     for field, value in search_criteria.items():
         if field in property_mapping and value and len(str(value)) > 0:
-            prop_filters.append(create_prop_filter(property_mapping[field], str(value)))
+            prop_filters.append(create_prop_filter(property_mapping[field], str(value), match_type))
     
     if not prop_filters:
         return ""
@@ -381,29 +499,90 @@ def create_search_filter_xml(search_criteria: Dict[str, str], search_type: str =
     """
 
 
-def create_search_request_xml(search_criteria: Dict[str, str] = None, search_type: str = "anyof") -> str:
+# vCard properties parse_vcard_to_contact reads; anything else (PHOTO, LOGO, KEY...)
+# is dead weight on the wire for a search result
+CONTACT_VCARD_PROPERTIES = (
+    "VERSION",
+    "UID",
+    "FN",
+    "EMAIL",
+    "TEL",
+    "ADR",
+    "BDAY",
+    "NOTE",
+    "CATEGORIES",
+    "X-ADDRESSBOOKSERVER-GROUP",
+    "X-ADDRESSBOOKSERVER-MEMBER",
+)
+
+_CONTACT_ADDRESS_DATA_XML = (
+    "<card:address-data>"
+    + "".join(f'<card:prop name="{name}"/>' for name in CONTACT_VCARD_PROPERTIES)
+    + "</card:address-data>"
+)
+
+# Only the filter varies between searches; it goes between these two halves
+_SEARCH_XML_HEAD = f"""<?xml version="1.0"?>
+        <card:addressbook-query xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">
+            <d:prop>
+                <d:getetag/>
+                {_CONTACT_ADDRESS_DATA_XML}
+            </d:prop>
+            """.encode()
+_SEARCH_XML_TAIL = b"""
+        </card:addressbook-query>"""
+
+
+def create_search_request_xml(
+    search_criteria: Dict[str, str] = None,
+    search_type: str = "anyof",
+    match_type: str = "contains",
+    limit: Optional[int] = None,
+) -> bytes:
     """
     Create the complete XML data for a CardDAV search request.
+
+    The returned address data is limited to ``CONTACT_VCARD_PROPERTIES`` (RFC 6352
+    section 10.4.2), so the server leaves out photos and other unused properties.
+    "equals" matches let Sabre/Nextcloud answer from the indexed card properties,
+    and ``limit`` is sent as ``<card:limit><card:nresults>`` (section 8.6.1).
     
     Args:
         search_criteria (Dict[str, str], optional): Dictionary of search criteria.
         search_type (str, optional): The search type, either "anyof" (OR logic) or "allof" (AND logic).
+        match_type (str, optional): Text match type, either "contains" or "equals".
+        limit (Optional[int], optional): Maximum number of results the server should return.
+        
+    Returns:
+        bytes: Complete XML data for the request.
+    """
+    filter_xml = create_search_filter_xml(search_criteria, search_type, match_type) if search_criteria else ""
+    limit_xml = f"<card:limit><card:nresults>{int(limit)}</card:nresults></card:limit>" if limit else ""
+    if not filter_xml and not limit_xml:
+        return _SEARCH_XML_HEAD + _SEARCH_XML_TAIL
+    return b"%b%b%b%b" % (_SEARCH_XML_HEAD, filter_xml.encode(), limit_xml.encode(), _SEARCH_XML_TAIL)
+
+
+def create_addressbook_multiget_xml(hrefs: List[str]) -> str:
+    """
+    Create the XML data for a CardDAV addressbook-multiget request.
+    
+    Args:
+        hrefs (List[str]): Absolute or server-relative URLs of the .vcf resources to fetch.
         
     Returns:
         str: Complete XML data for the request.
     """
-    filter_xml = ""
-    if search_criteria:
-        filter_xml = create_search_filter_xml(search_criteria, search_type)
+    href_elements = "\n".join(f"    <d:href>{escape(href)}</d:href>" for href in hrefs)
     
-    return f"""<?xml version="1.0"?>
-        <card:addressbook-query xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">
-            <d:prop>
-                <d:getetag/>
-                <card:address-data/>
-            </d:prop>
-            {filter_xml}
-        </card:addressbook-query>"""
+    return f"""<?xml version="1.0" encoding="utf-8" ?>
+<card:addressbook-multiget xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">
+    <d:prop>
+        <d:getetag/>
+        <card:address-data/>
+    </d:prop>
+{href_elements}
+</card:addressbook-multiget>"""
 
 
 def contact_to_vcard(contact: Contact) -> str:
@@ -487,7 +666,24 @@ def contact_to_vcard(contact: Contact) -> str:
     return vcard.serialize()
 
 
-def create_vcard_headers(auth_header: str) -> Dict[str, str]:
+def create_new_vcard_headers(auth_header: str) -> Mapping[str, str]:
+    """
+    Create headers for a CardDAV PUT that must not replace an existing vCard.
+    
+    Args:
+        auth_header (str): HTTP Authorization header value.
+        
+    Returns:
+        Mapping[str, str]: Read-only headers for the request, with ``If-None-Match: *``.
+    """
+    return MappingProxyType({
+        "Content-Type": "text/vcard; charset=utf-8",
+        "If-None-Match": "*",
+        "authorization": auth_header
+    })
+
+
+def create_vcard_headers(auth_header: str) -> Mapping[str, str]:
     """
     Create headers for the CardDAV PUT request to create or update a vCard.
     
@@ -495,14 +691,19 @@ def create_vcard_headers(auth_header: str) -> Dict[str, str]:
         auth_header (str): HTTP Authorization header value.
         
     Returns:
-        Dict[str, str]: Headers dictionary for the request.
+        Mapping[str, str]: Read-only headers for the request.
     """
-    return {
+    return MappingProxyType({
         "Content-Type": "text/vcard; charset=utf-8",
         "authorization": auth_header
-    }
+    })
+
+
+# Parsed once: every URL handed out by this API is rebased on it
+_CONFIG_URL = urlparse(NEXTCLOUD_BASE_URL)
 
 
+@lru_cache(maxsize=4096)
 def validate_and_correct_url(url: str) -> str:
     """
     Validate and correct a URL to ensure it uses the correct base URL from configuration.
@@ -527,8 +728,8 @@ def validate_and_correct_url(url: str) -> str:
         >>> validate_and_correct_url("remote.php/dav/addressbooks/users/test/")
         "https://good.example.com:12200/remote.php/dav/addressbooks/users/test/"
     """
-    # Parse the configuration base URL to get the correct components
-    config_parsed = urlparse(NEXTCLOUD_BASE_URL)
+    # Components of the configured base URL
+    config_parsed = _CONFIG_URL
     
     # Parse the input URL
     input_parsed = urlparse(url)
@@ -567,7 +768,7 @@ def validate_and_correct_url(url: str) -> str:
     return corrected_url
 
 
-def parse_contacts_from_response(parsed_data: List[Dict[str, Any]], privacy: Optional[bool] = False) -> List[Contact]:
+def parse_contacts_from_response(parsed_data: Iterable[Dict[str, Any]], privacy: Optional[bool] = False) -> List[Contact]:
     """
     Parse contacts from CardDAV response data.
     
@@ -576,7 +777,7 @@ def parse_contacts_from_response(parsed_data: List[Dict[str, Any]], privacy: Opt
     the href URLs using the validate_and_correct_url function.
     
     Args:
-        parsed_data (List[Dict[str, Any]]): List of dictionaries containing href and vcard_data.
+        parsed_data (Iterable[Dict[str, Any]]): Dictionaries containing href and vcard_data.
         privacy (Optional[bool]): Enable privacy mode to mask sensitive values. Defaults to False.
         
     Returns:
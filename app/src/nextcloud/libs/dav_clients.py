@@ -3,32 +3,51 @@
 import asyncio
 import atexit
 import os
-from typing import Dict, Optional, Tuple
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 import aiohttp
 from fastapi import HTTPException
 
+from src.common.sec import forget_auth_header
 from src.nextcloud import API_ERR_CONNECTION_ERROR
 from src.nextcloud.libs.carddav_helpers import (
+    create_addressbook_multiget_xml,
+    create_auth_headers,
+    create_ctag_request_xml,
+    create_new_vcard_headers,
+    create_propfind_headers,
     create_request_headers,
     create_request_xml,
     create_search_request_xml,
     create_vcard_headers,
     handle_response_status,
+    parse_ctag_response,
+    parse_xml_stream,
+    trim_response_text,
 )
 from src.nextcloud.libs.caldav_helpers import (
     create_caldav_event_headers,
     create_caldav_request_headers,
+    create_calendar_multiget_xml,
     create_calendar_query_xml,
     handle_caldav_response_status,
+    parse_caldav_xml_response,
+    parse_caldav_xml_stream,
 )
 
 
 _DAV_TOTAL_TIMEOUT = float(os.getenv("NEXTCLOUD_DAV_TIMEOUT", "30"))
 _DAV_CONNECT_TIMEOUT = float(os.getenv("NEXTCLOUD_DAV_CONNECT_TIMEOUT", "10"))
+_DAV_READ_TIMEOUT = float(os.getenv("NEXTCLOUD_DAV_READ_TIMEOUT", "20"))
 _DAV_MAX_CONNECTIONS = int(os.getenv("NEXTCLOUD_DAV_MAX_CONNECTIONS", "50"))
+_DAV_MAX_CONNECTIONS_PER_HOST = int(os.getenv("NEXTCLOUD_DAV_MAX_CONNECTIONS_PER_HOST", "32"))
+_DAV_KEEPALIVE_TIMEOUT = float(os.getenv("NEXTCLOUD_DAV_KEEPALIVE_TIMEOUT", "75"))
 _DAV_MAX_RETRIES = int(os.getenv("NEXTCLOUD_DAV_MAX_RETRIES", "2"))
 _DAV_BACKOFF = float(os.getenv("NEXTCLOUD_DAV_BACKOFF", "0.4"))
+_DAV_CHUNK_SIZE = 64 * 1024
+# Timed-out requests are only retried for these; a slow PUT/DELETE may already have
+# been applied, and replaying it would turn that success into a 404/409/412
+_DAV_RETRY_ON_TIMEOUT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PROPFIND", "REPORT"})
 _DAV_PROXY = os.getenv("NEXTCLOUD_DAV_PROXY")
 _DAV_TRUST_ENV = os.getenv("NEXTCLOUD_DAV_TRUST_ENV", "1").lower() not in {"0", "false", "no"}
 
@@ -46,8 +65,22 @@ async def _get_shared_session() -> aiohttp.ClientSession:
         if _shared_session and not _shared_session.closed:
             return _shared_session
 
-        timeout = aiohttp.ClientTimeout(total=_DAV_TOTAL_TIMEOUT, connect=_DAV_CONNECT_TIMEOUT)
-        connector = aiohttp.TCPConnector(limit=_DAV_MAX_CONNECTIONS, ttl_dns_cache=300)
+        # sock_read frees a pooled connection held by a server that stopped sending
+        timeout = aiohttp.ClientTimeout(
+            total=_DAV_TOTAL_TIMEOUT,
+            connect=_DAV_CONNECT_TIMEOUT,
+            sock_read=_DAV_READ_TIMEOUT,
+        )
+        # Keep idle sockets long enough to reuse them across bursts of small CardDAV/CalDAV calls
+        connector = aiohttp.TCPConnector(
+            limit=_DAV_MAX_CONNECTIONS,
+            limit_per_host=_DAV_MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout=_DAV_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=300,
+        )
+        # aiohttp advertises Accept-Encoding (gzip, deflate, plus br with the [speedups]
+        # extra) and decompresses while streaming, so repetitive multistatus XML is
+        # fetched compressed; auto_decompress is left on for the chunked parsers
         _shared_session = aiohttp.ClientSession(
             timeout=timeout,
             connector=connector,
@@ -56,8 +89,21 @@ async def _get_shared_session() -> aiohttp.ClientSession:
         return _shared_session
 
 
+async def open_shared_session() -> aiohttp.ClientSession:
+    """Create the shared session up front (called from the application lifespan)."""
+    return await _get_shared_session()
+
+
+async def close_shared_session() -> None:
+    """Close the shared session on the loop that created it (application shutdown)."""
+    global _shared_session
+    session, _shared_session = _shared_session, None
+    if session and not session.closed:
+        await session.close()
+
+
 def _close_shared_session() -> None:
-    """Ensure the shared session is closed when the process exits."""
+    """Fallback for runs without a lifespan: close the session when the process exits."""
     session = globals().get("_shared_session")
     if session and not session.closed:
         loop = asyncio.new_event_loop()
@@ -70,8 +116,27 @@ def _close_shared_session() -> None:
 atexit.register(_close_shared_session)
 
 
+async def _read_text(response: aiohttp.ClientResponse) -> str:
+    """
+    Read a body chunk by chunk into one buffer and decode it once.
+
+    Large vCards (embedded PHOTO data) are never held as an intermediate
+    ``bytes`` copy next to the decoded string.
+    """
+    buffer = bytearray()
+    async for chunk in response.content.iter_chunked(_DAV_CHUNK_SIZE):
+        buffer.extend(chunk)
+    return buffer.decode(response.charset or "utf-8")
+
+
 class BaseDavClient:
-    """Shared functionality for DAV clients."""
+    """
+    Shared functionality for DAV clients.
+
+    Instances only hold the base URL and Authorization value; every request goes
+    through the process-wide pooled session, so building one client per call
+    costs no connection setup.
+    """
 
     def __init__(self, base_url: str, auth_header: str, proxy_url: Optional[str] = None) -> None:
         self.base_url = base_url if base_url.endswith('/') else f"{base_url}/"
@@ -87,12 +152,18 @@ class BaseDavClient:
         self,
         method: str,
         url: str,
-        headers: Dict[str, str],
-        data: Optional[str] = None
-    ) -> Tuple[int, str, aiohttp.typedefs.LooseHeaders]:
-        """Execute an HTTP request and return the (status, text, headers) tuple with retries."""
+        headers: Mapping[str, str],
+        data: Optional[Union[str, bytes]] = None,
+        on_multistatus: Optional[Callable[[AsyncIterable[bytes]], Awaitable[Any]]] = None,
+    ) -> Tuple[int, Any, aiohttp.typedefs.LooseHeaders]:
+        """
+        Execute an HTTP request and return the (status, text, headers) tuple with retries.
+
+        When ``on_multistatus`` is given, a 207 body is handed to it as a chunk
+        stream and its result takes the place of the text.
+        """
         attempt = 0
-        last_exc: Optional[aiohttp.ClientError] = None
+        last_exc: Optional[Exception] = None
 
         while attempt <= _DAV_MAX_RETRIES:
             attempt += 1
@@ -105,12 +176,21 @@ class BaseDavClient:
                     data=data,
                     proxy=self.proxy,
                 ) as response:
-                    text = await response.text()
+                    if response.status == 401:
+                        # Credentials changed since they were cached; re-check them next time
+                        forget_auth_header(self.auth_header)
+                    if on_multistatus is not None and response.status == 207:
+                        body = await on_multistatus(response.content.iter_chunked(_DAV_CHUNK_SIZE))
+                        return response.status, body, response.headers
+                    text = await _read_text(response)
                     return response.status, text, response.headers
-            except aiohttp.ClientError as exc:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                # CancelledError is a BaseException and is never caught here
                 last_exc = exc
                 if attempt > _DAV_MAX_RETRIES:
                     break
+                if isinstance(exc, asyncio.TimeoutError) and method not in _DAV_RETRY_ON_TIMEOUT_METHODS:
+                    break
                 await asyncio.sleep(_DAV_BACKOFF * attempt)
 
         raise HTTPException(
@@ -122,25 +202,52 @@ class BaseDavClient:
 class CardDavClient(BaseDavClient):
     """Async helper for CardDAV operations."""
 
-    async def report_addressbook(self) -> str:
-        """Fetch all contacts via REPORT."""
+    async def get_ctag(self) -> Optional[str]:
+        """Fetch the addressbook ctag, which changes whenever any contact does."""
+        headers = create_propfind_headers(self.auth_header)
+        status, text, _ = await self._request("PROPFIND", self.base_url, headers, data=create_ctag_request_xml())
+        handle_response_status(status, text)
+        return parse_ctag_response(text)
+
+    async def report_addressbook(self) -> List[Dict[str, Any]]:
+        """Fetch all contacts via REPORT, parsing the multistatus as it arrives."""
         headers = create_request_headers(self.auth_header)
         xml_data = create_request_xml()
-        status, text, _ = await self._request("REPORT", self.base_url, headers, data=xml_data)
-        handle_response_status(status, text)
-        return text
+        status, items, _ = await self._request(
+            "REPORT", self.base_url, headers, data=xml_data, on_multistatus=parse_xml_stream
+        )
+        handle_response_status(status, items)
+        return items
 
-    async def search_addressbook(self, criteria: Dict[str, str], search_type: str) -> str:
-        """Execute a REPORT with filters."""
+    async def search_addressbook(
+        self,
+        criteria: Dict[str, str],
+        search_type: str,
+        match_type: str = "contains",
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Execute a REPORT with filters, parsing the multistatus as it arrives."""
         headers = create_request_headers(self.auth_header)
-        xml_data = create_search_request_xml(criteria, search_type)
-        status, text, _ = await self._request("REPORT", self.base_url, headers, data=xml_data)
-        handle_response_status(status, text)
-        return text
+        xml_data = create_search_request_xml(criteria, search_type, match_type, limit)
+        status, items, _ = await self._request(
+            "REPORT", self.base_url, headers, data=xml_data, on_multistatus=parse_xml_stream
+        )
+        handle_response_status(status, items)
+        return items
+
+    async def multiget_contacts(self, contact_urls: List[str]) -> List[Dict[str, Any]]:
+        """Fetch several vCards in one addressbook-multiget REPORT."""
+        headers = create_request_headers(self.auth_header)
+        xml_data = create_addressbook_multiget_xml(contact_urls)
+        status, items, _ = await self._request(
+            "REPORT", self.base_url, headers, data=xml_data, on_multistatus=parse_xml_stream
+        )
+        handle_response_status(status, items)
+        return items
 
     async def get_contact(self, contact_url: str) -> Tuple[Optional[str], Optional[str]]:
         """Retrieve a single vCard."""
-        headers = {"authorization": self.auth_header}
+        headers = create_auth_headers(self.auth_header)
         status, text, response_headers = await self._request("GET", contact_url, headers)
         if status == 404:
             return None, None
@@ -149,14 +256,17 @@ class CardDavClient(BaseDavClient):
         return text, response_headers.get("ETag")
 
     async def create_contact(self, contact_url: str, vcard_data: str) -> Optional[str]:
-        """Create a contact via PUT."""
-        headers = create_vcard_headers(self.auth_header)
-        status, text, response_headers = await self._request("PUT", contact_url, headers, data=vcard_data)
+        """Create a contact via PUT; fails with 409 instead of overwriting an existing one."""
+        headers = create_new_vcard_headers(self.auth_header)
+        # Sent as UTF-8 bytes (matching the declared charset) with a plain Content-Length
+        status, text, response_headers = await self._request("PUT", contact_url, headers, data=vcard_data.encode("utf-8"))
         if status not in (201, 204):
+            if status == 412:
+                raise HTTPException(status_code=409, detail=f"Contact already exists at {contact_url}")
             if status == 405:
                 raise HTTPException(
                     status_code=405,
-                    detail=f"Cannot create contact at this URL. The server responded: {text}"
+                    detail=f"Cannot create contact at this URL. The server responded: {trim_response_text(text)}"
                 )
             handle_response_status(status, text)
         return response_headers.get("ETag")
@@ -165,39 +275,39 @@ class CardDavClient(BaseDavClient):
         """Update an existing contact."""
         headers = create_vcard_headers(self.auth_header)
         if etag:
-            headers["If-Match"] = etag
-        status, text, response_headers = await self._request("PUT", contact_url, headers, data=vcard_data)
+            headers = {**headers, "If-Match": etag}
+        status, text, response_headers = await self._request("PUT", contact_url, headers, data=vcard_data.encode("utf-8"))
         if status not in (200, 201, 204):
             if status == 404:
                 raise HTTPException(
                     status_code=404,
-                    detail=f"Contact not found at {contact_url}. The server responded: {text}"
+                    detail=f"Contact not found at {contact_url}. The server responded: {trim_response_text(text)}"
                 )
             if status == 405:
                 raise HTTPException(
                     status_code=405,
-                    detail=f"Cannot update contact at this URL. The server responded: {text}"
+                    detail=f"Cannot update contact at this URL. The server responded: {trim_response_text(text)}"
                 )
             handle_response_status(status, text)
         return response_headers.get("ETag")
 
     async def delete_contact(self, contact_url: str, etag: Optional[str] = None) -> None:
         """Delete a vCard."""
-        headers = {"authorization": self.auth_header}
+        headers = create_auth_headers(self.auth_header)
         if etag:
-            headers["If-Match"] = etag
+            headers = {**headers, "If-Match": etag}
         status, text, _ = await self._request("DELETE", contact_url, headers)
         if status in (200, 204):
             return
         if status == 404:
             raise HTTPException(
                 status_code=404,
-                detail=f"Contact not found at {contact_url}. The server responded: {text}"
+                detail=f"Contact not found at {contact_url}. The server responded: {trim_response_text(text)}"
             )
         if status == 405:
             raise HTTPException(
                 status_code=405,
-                detail=f"Cannot delete contact at this URL. The server responded: {text}"
+                detail=f"Cannot delete contact at this URL. The server responded: {trim_response_text(text)}"
             )
         handle_response_status(status, text)
 
@@ -205,14 +315,29 @@ class CardDavClient(BaseDavClient):
 class CalDavClient(BaseDavClient):
     """Async helper for CalDAV operations."""
 
-    async def report_time_range(self, start_datetime: str, end_datetime: str) -> str:
-        """Fetch events within a time window."""
+    async def report_time_range(self, start_datetime: str, end_datetime: str) -> List[Dict[str, Any]]:
+        """Fetch events within a time window, parsing the multistatus as it arrives."""
         headers = create_caldav_request_headers(self.auth_header)
         xml_data = create_calendar_query_xml(start_datetime, end_datetime)
-        status, text, _ = await self._request("REPORT", self.base_url, headers, data=xml_data)
+        status, items, _ = await self._request(
+            "REPORT", self.base_url, headers, data=xml_data, on_multistatus=parse_caldav_xml_stream
+        )
         if status != 207:
-            handle_caldav_response_status(status, text)
-        return text
+            handle_caldav_response_status(status, items)
+            return parse_caldav_xml_response(items)
+        return items
+
+    async def multiget_events(self, event_urls: List[str]) -> List[Dict[str, Any]]:
+        """Fetch several events in one calendar-multiget REPORT, parsing the multistatus as it arrives."""
+        headers = create_caldav_request_headers(self.auth_header)
+        xml_data = create_calendar_multiget_xml(event_urls)
+        status, items, _ = await self._request(
+            "REPORT", self.base_url, headers, data=xml_data, on_multistatus=parse_caldav_xml_stream
+        )
+        if status != 207:
+            handle_caldav_response_status(status, items)
+            return parse_caldav_xml_response(items)
+        return items
 
     async def get_event(self, event_url: str) -> Tuple[Optional[str], Optional[str]]:
         """Retrieve a single event."""
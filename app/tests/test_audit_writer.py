@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from src.common import audit as audit_mod
+
+
+def _read_entries(path):
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+@pytest.mark.asyncio
+async def test_entries_queued_before_stop_are_flushed_in_order(monkeypatch, tmp_path):
+    audit_file = tmp_path / "logs" / "audit.log"
+    monkeypatch.setattr(audit_mod, "AUDIT_LOG_PATH", audit_file)
+    monkeypatch.setattr(audit_mod, "AUDIT_BATCH_SIZE", 16)
+
+    await audit_mod.start_audit_writer()
+    try:
+        for i in range(100):
+            await audit_mod.record_change("contact", f"contact-{i}", "create", None, {"index": i})
+    finally:
+        await audit_mod.stop_audit_writer()
+
+    entries = _read_entries(audit_file)
+    assert [entry["uid"] for entry in entries] == [f"contact-{i}" for i in range(100)]
+    assert [entry["after"]["index"] for entry in entries] == list(range(100))
+    assert audit_mod._queue is None and audit_mod._writer_task is None
+
+    # Without a writer, entries are appended directly
+    await audit_mod.record_change("contact", "contact-direct", "delete", {"index": 0}, None)
+    assert _read_entries(audit_file)[-1]["uid"] == "contact-direct"
+
+
+@pytest.mark.asyncio
+async def test_entries_beyond_a_full_queue_are_dropped_and_counted(monkeypatch, tmp_path):
+    audit_file = tmp_path / "audit.log"
+    monkeypatch.setattr(audit_mod, "AUDIT_LOG_PATH", audit_file)
+    monkeypatch.setattr(audit_mod, "AUDIT_QUEUE_SIZE", 2)
+    monkeypatch.setattr(audit_mod, "dropped_entries", 0)
+
+    await audit_mod.start_audit_writer()
+    try:
+        # put_nowait never yields, so the writer cannot drain the queue between these calls
+        for i in range(5):
+            await audit_mod.record_change("event", f"event-{i}", "update", None, None)
+        assert audit_mod.dropped_entries == 3
+    finally:
+        await audit_mod.stop_audit_writer()
+
+    assert [entry["uid"] for entry in _read_entries(audit_file)] == ["event-0", "event-1"]
@@ -0,0 +1,39 @@
+import time
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from src.common import sec as sec_mod
+from src.common.add_proxy import CustomProxyHeadersMiddleware
+from src.common.sec import current_user
+
+
+def _make_client(monkeypatch):
+    monkeypatch.setattr(sec_mod, "auth_cache", {})
+    monkeypatch.setattr(sec_mod, "_circuit_state", {"failures": 0, "open_until": time.monotonic() + 60})
+
+    app = FastAPI()
+    app.add_middleware(CustomProxyHeadersMiddleware)
+
+    @app.get("/whoami")
+    async def whoami(user_info: dict = Depends(current_user)):
+        return user_info
+
+    return TestClient(app)
+
+
+def test_open_breaker_still_serves_cached_credentials(monkeypatch):
+    client = _make_client(monkeypatch)
+    key = sec_mod.cache_key(sec_mod.HTTPBasicCredentials(username="demo", password="pass"))
+    sec_mod._store_auth(key, {"id": "demo"})
+
+    response = client.get("/whoami", auth=("demo", "pass"))
+    assert response.status_code == 200
+    assert response.json() == {"id": "demo"}
+
+
+def test_open_breaker_rejects_uncached_credentials(monkeypatch):
+    client = _make_client(monkeypatch)
+
+    response = client.get("/whoami", auth=("demo", "other"))
+    assert response.status_code == 503
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException, status
+from fastapi.security import HTTPBasicCredentials
+
+from src.common import sec as sec_mod
+
+
+@pytest.fixture
+def stub_lookup(monkeypatch):
+    monkeypatch.setattr(sec_mod, "auth_cache", {})
+    monkeypatch.setattr(sec_mod, "_inflight", {})
+    state = {"calls": 0, "release": asyncio.Event(), "error": None}
+
+    async def fake_request_user_info(credentials, key):
+        state["calls"] += 1
+        await state["release"].wait()
+        if state["error"] is not None:
+            raise state["error"]
+        return {"id": credentials.username}
+
+    monkeypatch.setattr(sec_mod, "_request_user_info", fake_request_user_info)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_does_not_fail_the_others(stub_lookup):
+    credentials = HTTPBasicCredentials(username="demo", password="pass")
+
+    owner = asyncio.create_task(sec_mod.authenticate_with_nextcloud(credentials))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(sec_mod.authenticate_with_nextcloud(credentials))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    await asyncio.sleep(0)
+    stub_lookup["release"].set()
+
+    assert await waiter == {"id": "demo"}
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    assert stub_lookup["calls"] == 1
+    assert sec_mod._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_lookup_error_reaches_every_caller(stub_lookup):
+    credentials = HTTPBasicCredentials(username="demo", password="wrong")
+    stub_lookup["error"] = HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+
+    callers = [asyncio.create_task(sec_mod.authenticate_with_nextcloud(credentials)) for _ in range(3)]
+    await asyncio.sleep(0)
+    stub_lookup["release"].set()
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert stub_lookup["calls"] == 1
+    assert all(isinstance(result, HTTPException) and result.status_code == 401 for result in results)
+    assert sec_mod._inflight == {}
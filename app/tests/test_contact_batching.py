@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException, status
+from fastapi.security import HTTPBasicCredentials
+
+from src.common import audit as audit_mod
+from src.models.contact import Contact
+from src.nextcloud import contacts as contacts_mod
+
+
+@pytest.mark.asyncio
+async def test_create_contacts_keeps_successes_when_one_fails(monkeypatch, tmp_path):
+    audit_file = tmp_path / "contact_audit.log"
+    monkeypatch.setattr(audit_mod, "AUDIT_LOG_PATH", audit_file)
+    monkeypatch.setattr(contacts_mod, "CONTACTS_CREATE_CONCURRENCY", 2)
+
+    async def fake_auth(credentials):
+        return {"id": "demo"}
+
+    monkeypatch.setattr(contacts_mod, "authenticate_with_nextcloud", fake_auth)
+
+    state = {"in_flight": 0, "max_in_flight": 0, "created": []}
+
+    class StubCardDavClient:
+        def __init__(self, base_url, auth_header):
+            self.base_url = base_url
+            self.auth_header = auth_header
+
+        async def create_contact(self, contact_url: str, vcard_data: str):
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            try:
+                await asyncio.sleep(0.01)
+                if "contact-bad" in contact_url:
+                    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="exists")
+                state["created"].append(contact_url)
+                return f'"etag-{len(state["created"])}"'
+            finally:
+                state["in_flight"] -= 1
+
+    monkeypatch.setattr(contacts_mod, "CardDavClient", StubCardDavClient)
+
+    credentials = HTTPBasicCredentials(username="user", password="pass")
+    contacts = [
+        Contact(uid="contact-1", full_name="Alice"),
+        Contact(uid="contact-bad", full_name="Mallory"),
+        Contact(uid="contact-2", full_name="Bob"),
+        Contact(uid="contact-3", full_name="Carol"),
+    ]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await contacts_mod.create_contacts(credentials, contacts)
+
+    assert exc_info.value.status_code == status.HTTP_409_CONFLICT
+    detail = exc_info.value.detail
+    assert sorted(detail["created"]) == ["contact-1", "contact-2", "contact-3"]
+    assert detail["failed"] == [{"uid": "contact-bad", "status_code": 409, "detail": "exists"}]
+    # Every other PUT ran to completion despite the failure, within the concurrency bound
+    assert len(state["created"]) == 3
+    assert state["max_in_flight"] == 2
+
+    entries = [json.loads(line) for line in audit_file.read_text().splitlines() if line.strip()]
+    assert sorted(entry["uid"] for entry in entries) == ["contact-1", "contact-2", "contact-3"]
+    assert all(entry["action"] == "create" for entry in entries)
+
+
+@pytest.mark.asyncio
+async def test_create_contacts_returns_results_in_request_order(monkeypatch):
+    async def fake_create_contact(credentials, contact, addressbook_name=None):
+        # Finish in reverse order to make sure the result order comes from the request
+        await asyncio.sleep(0.001 * (5 - int(contact.uid.rsplit("-", 1)[-1])))
+        contact.etag = f'"etag-{contact.uid}"'
+        return contact
+
+    monkeypatch.setattr(contacts_mod, "create_contact", fake_create_contact)
+
+    credentials = HTTPBasicCredentials(username="user", password="pass")
+    contacts = [Contact(uid=f"contact-{i}", full_name=f"Person {i}") for i in range(5)]
+    created = await contacts_mod.create_contacts(credentials, contacts)
+
+    assert [contact.uid for contact in created] == [f"contact-{i}" for i in range(5)]
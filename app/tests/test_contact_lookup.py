@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+from fastapi.security import HTTPBasicCredentials
+
+from src.models.contact import Contact
+from src.nextcloud import contacts as contacts_mod
+from src.nextcloud.libs.carddav_helpers import contact_to_vcard
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_lookup_does_not_fail_concurrent_ones(monkeypatch):
+    async def fake_auth(credentials):
+        return {"id": "demo"}
+
+    monkeypatch.setattr(contacts_mod, "authenticate_with_nextcloud", fake_auth)
+    monkeypatch.setattr(contacts_mod, "_inflight_lookups", {})
+
+    vcard = contact_to_vcard(Contact(uid="contact-1", full_name="Alice"))
+    state = {"get": 0, "release": asyncio.Event()}
+
+    class StubCardDavClient:
+        def __init__(self, base_url, auth_header):
+            self.base_url = base_url
+            self.auth_header = auth_header
+
+        async def get_contact(self, contact_url: str):
+            state["get"] += 1
+            await state["release"].wait()
+            return vcard, '"etag-1"'
+
+    monkeypatch.setattr(contacts_mod, "CardDavClient", StubCardDavClient)
+
+    credentials = HTTPBasicCredentials(username="user", password="pass")
+    owner = asyncio.create_task(contacts_mod.get_contact_by_uid(credentials, "contact-1"))
+    await asyncio.sleep(0)
+    # None and the explicit default name address the same lookup
+    waiter = asyncio.create_task(contacts_mod.get_contact_by_uid(credentials, "contact-1", "contacts"))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    await asyncio.sleep(0)
+    state["release"].set()
+
+    contact = await waiter
+    assert contact.full_name == "Alice"
+    assert contact.etag == '"etag-1"'
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    assert state["get"] == 1
+    assert contacts_mod._inflight_lookups == {}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_ctag_skips_the_addressbook_report(monkeypatch):
+    async def fake_auth(credentials):
+        return {"id": "demo"}
+
+    monkeypatch.setattr(contacts_mod, "authenticate_with_nextcloud", fake_auth)
+    monkeypatch.setattr(contacts_mod, "_ctag_cache", contacts_mod.LRUCache(maxsize=8))
+
+    state = {"ctag": "ctag-1", "ctag_calls": 0, "report": 0}
+    vcard = contact_to_vcard(Contact(uid="contact-1", full_name="Alice"))
+
+    class StubCardDavClient:
+        def __init__(self, base_url, auth_header):
+            self.base_url = base_url
+            self.auth_header = auth_header
+
+        async def get_ctag(self):
+            state["ctag_calls"] += 1
+            return state["ctag"]
+
+        async def report_addressbook(self):
+            state["report"] += 1
+            await asyncio.sleep(0.01)
+            return [{"href": "/contacts/contact-1.vcf", "etag": '"etag-1"', "vcard_data": vcard}]
+
+    monkeypatch.setattr(contacts_mod, "CardDavClient", StubCardDavClient)
+
+    async def fake_parse(parsed_data, privacy):
+        return [Contact(uid=item["href"].rsplit("/", 1)[-1].removesuffix(".vcf"), full_name="Alice") for item in parsed_data]
+
+    monkeypatch.setattr(contacts_mod, "_parse_contacts", fake_parse)
+
+    credentials = HTTPBasicCredentials(username="user", password="pass")
+    # Concurrent listings of the default addressbook, spelled both ways, share one REPORT
+    first, second = await asyncio.gather(
+        contacts_mod.get_all_contacts(credentials),
+        contacts_mod.get_all_contacts(credentials, "contacts"),
+    )
+    assert [contact.uid for contact in first] == ["contact-1"]
+    assert [contact.uid for contact in second] == ["contact-1"]
+    assert state["report"] == 1
+
+    await contacts_mod.get_all_contacts(credentials)
+    assert state["report"] == 1
+    assert state["ctag_calls"] == 3
+
+    state["ctag"] = "ctag-2"
+    await contacts_mod.get_all_contacts(credentials)
+    assert state["report"] == 2
+
+
+@pytest.mark.asyncio
+async def test_multiget_percent_encodes_hrefs_and_maps_them_back(monkeypatch):
+    async def fake_auth(credentials):
+        return {"id": "demo"}
+
+    monkeypatch.setattr(contacts_mod, "authenticate_with_nextcloud", fake_auth)
+
+    uid = "héllo wörld%1"
+    vcard = contact_to_vcard(Contact(uid=uid, full_name="Alice"))
+    requested = []
+
+    class StubCardDavClient:
+        def __init__(self, base_url, auth_header):
+            self.base_url = base_url
+            self.auth_header = auth_header
+
+        async def multiget_contacts(self, hrefs):
+            requested.extend(hrefs)
+            return [{"href": href, "etag": '"etag-1"', "vcard_data": vcard} for href in hrefs]
+
+    monkeypatch.setattr(contacts_mod, "CardDavClient", StubCardDavClient)
+
+    credentials = HTTPBasicCredentials(username="user", password="pass")
+    contacts = await contacts_mod.get_contacts_by_uids(credentials, [uid])
+
+    assert requested[0].endswith("/h%C3%A9llo%20w%C3%B6rld%251.vcf")
+    assert list(contacts) == [uid]
@@ -0,0 +1,128 @@
+import asyncio
+from urllib.parse import urlsplit
+
+import pytest
+from fastapi.security import HTTPBasicCredentials
+
+from src.models.event import Event
+from src.nextcloud import events as events_mod
+from src.nextcloud.libs.caldav_helpers import event_to_ical
+
+
+def _install_stub_client(monkeypatch, calendar_data):
+    calls = {"multiget": [], "get": []}
+
+    async def fake_auth(credentials):
+        return {"id": "demo"}
+
+    class StubCalDavClient:
+        def __init__(self, base_url, auth_header):
+            self.base_url = base_url if base_url.endswith('/') else f"{base_url}/"
+            self.auth_header = auth_header
+
+        def build_url(self, relative_path: str) -> str:
+            return f"{self.base_url}{relative_path.lstrip('/')}"
+
+        async def multiget_events(self, hrefs):
+            calls["multiget"].append(list(hrefs))
+            items = []
+            for href in hrefs:
+                uid = href.rsplit('/', 1)[-1].removesuffix(".ics")
+                if uid in calendar_data:
+                    items.append({"href": href, "etag": f'"etag-{uid}"', "calendar_data": calendar_data[uid]})
+            return items
+
+        async def get_event(self, event_url: str):
+            uid = urlsplit(event_url).path.rsplit('/', 1)[-1].removesuffix(".ics")
+            calls["get"].append(uid)
+            return calendar_data[uid], f'"etag-{uid}"'
+
+    monkeypatch.setattr(events_mod, "authenticate_with_nextcloud", fake_auth)
+    monkeypatch.setattr(events_mod, "CalDavClient", StubCalDavClient)
+    return calls
+
+
+def _ical(uid: str) -> str:
+    return event_to_ical(Event(uid=uid, summary=f"Event {uid}", start="2025-04-21T14:00:00", end="2025-04-21T15:00:00"))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_multiget(monkeypatch):
+    calls = _install_stub_client(monkeypatch, {uid: _ical(uid) for uid in ("a", "b", "c")})
+    fetcher = events_mod.BatchedEventFetcher(batch_window=0.01)
+    credentials = HTTPBasicCredentials(username="user", password="pass")
+
+    results = await asyncio.gather(
+        fetcher.get(credentials, "a"),
+        fetcher.get(credentials, "b"),
+        fetcher.get(credentials, "c"),
+        fetcher.get(credentials, "missing"),
+        return_exceptions=True,
+    )
+
+    assert len(calls["multiget"]) == 1
+    assert len(calls["multiget"][0]) == 4
+    assert calls["get"] == []
+    assert [event.uid for event in results[:3]] == ["a", "b", "c"]
+    assert results[0].etag == '"etag-a"'
+    assert isinstance(results[3], events_mod.EventNotFound)
+
+
+@pytest.mark.asyncio
+async def test_unparseable_item_only_fails_its_own_read(monkeypatch):
+    calendar_data = {"good": _ical("good"), "bad": "not a calendar"}
+    calls = _install_stub_client(monkeypatch, calendar_data)
+    fetcher = events_mod.BatchedEventFetcher(batch_window=0.01)
+    credentials = HTTPBasicCredentials(username="user", password="pass")
+
+    good, bad = await asyncio.gather(
+        fetcher.get(credentials, "good"),
+        fetcher.get(credentials, "bad"),
+        return_exceptions=True,
+    )
+
+    assert len(calls["multiget"]) == 1
+    assert good.uid == "good"
+    assert isinstance(bad, Exception)
+    assert not isinstance(bad, events_mod.EventNotFound)
+
+    events = await events_mod.get_events_by_uids(credentials, ["good", "bad"])
+    assert list(events) == ["good"]
+
+
+@pytest.mark.asyncio
+async def test_default_calendar_spellings_share_a_batch_keyed_without_the_password(monkeypatch):
+    calls = _install_stub_client(monkeypatch, {uid: _ical(uid) for uid in ("a", "b")})
+    fetcher = events_mod.BatchedEventFetcher(batch_window=0.01)
+    credentials = HTTPBasicCredentials(username="user", password="s3cret")
+
+    first = asyncio.create_task(fetcher.get(credentials, "a"))
+    second = asyncio.create_task(fetcher.get(credentials, "b", "personal"))
+    await asyncio.sleep(0)
+    assert len(fetcher._pending) == 1
+    assert "s3cret" not in repr(list(fetcher._pending))
+
+    await asyncio.gather(first, second)
+    assert len(calls["multiget"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_releases_its_waiters(monkeypatch):
+    _install_stub_client(monkeypatch, {uid: _ical(uid) for uid in ("a", "b")})
+    started = asyncio.Event()
+
+    async def stalled_multiget(credentials, uids, calendar_name, privacy):
+        started.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(events_mod, "_multiget_events", stalled_multiget)
+    fetcher = events_mod.BatchedEventFetcher(batch_window=0.001)
+    credentials = HTTPBasicCredentials(username="user", password="pass")
+
+    readers = [asyncio.create_task(fetcher.get(credentials, uid)) for uid in ("a", "b")]
+    await started.wait()
+    for task in list(fetcher._tasks):
+        task.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*readers, return_exceptions=True), timeout=1)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
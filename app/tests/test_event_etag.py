@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+from cachetools import TTLCache
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import events as events_api
+from src.api.errors import register_exception_handlers
+from src.common.sec import current_user
+from src.models.event import Event
+
+
+def _make_client(monkeypatch):
+    server = {"event": Event(uid="event-1", summary="Standup", start="2025-04-21T09:00:00", etag='"etag-1"')}
+
+    async def fake_get(credentials, uid, calendar_name=None, privacy=False):
+        return server["event"].model_copy()
+
+    monkeypatch.setattr(events_api, "event_fetcher", SimpleNamespace(get=fake_get))
+    monkeypatch.setattr(events_api, "event_cache", TTLCache(maxsize=16, ttl=60))
+
+    app = FastAPI()
+    app.include_router(events_api.router, prefix="/events")
+    register_exception_handlers(app)
+    app.dependency_overrides[current_user] = lambda: {"id": "demo"}
+    client = TestClient(app, base_url="http://api.myhost.com")
+    client.auth = ("user", "pass")
+    return client, server
+
+
+def test_matching_if_none_match_returns_304_without_body(monkeypatch):
+    client, _ = _make_client(monkeypatch)
+
+    first = client.get("/events/event-1")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag == 'W/"etag-1"'
+
+    revalidated = client.get("/events/event-1", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+
+
+def test_changed_event_returns_200_with_the_new_etag(monkeypatch):
+    client, server = _make_client(monkeypatch)
+
+    etag = client.get("/events/event-1").headers["ETag"]
+    server["event"] = Event(uid="event-1", summary="Standup (moved)", start="2025-04-21T10:00:00", etag='"etag-2"')
+    events_api.event_cache.clear()
+
+    response = client.get("/events/event-1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == 'W/"etag-2"'
+    assert response.json()["summary"] == "Standup (moved)"
+
+    # Privacy-masked bodies carry their own validator
+    masked = client.get("/events/event-1", params={"privacy": True}, headers={"If-None-Match": response.headers["ETag"]})
+    assert masked.status_code == 200
+    assert masked.headers["ETag"] == 'W/"etag-2-p"'
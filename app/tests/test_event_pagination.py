@@ -0,0 +1,86 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import events as events_api
+from src.api.errors import register_exception_handlers
+from src.common import cache as cache_mod
+from src.common.sec import current_user
+from src.models.event import Event
+
+
+def _make_client(monkeypatch, total):
+    events = [
+        Event(uid=f"event-{i}", summary=f"Event {i}", start=f"2025-04-21T{i % 24:02d}:00:00")
+        for i in range(total)
+    ]
+    calls = {"report": 0}
+
+    async def fake_time_range(credentials, start_datetime, end_datetime, calendar_name, privacy=False):
+        calls["report"] += 1
+        return events
+
+    monkeypatch.setattr(events_api, "get_events_by_time_range", fake_time_range)
+    monkeypatch.setattr(cache_mod, "range_cache", cache_mod.LRUCache(maxsize=16))
+
+    app = FastAPI()
+    app.include_router(events_api.router, prefix="/events")
+    register_exception_handlers(app)
+    app.dependency_overrides[current_user] = lambda: {"id": "demo"}
+    client = TestClient(app, base_url="http://api.myhost.com")
+    client.auth = ("user", "pass")
+    return client, calls
+
+
+def _get_page(client, **params):
+    query = {"start_datetime": "2025-04-21T00:00:00", "end_datetime": "2025-04-22T00:00:00", **params}
+    return client.get("/events/", params=query)
+
+
+def test_pages_follow_next_cursor_until_the_last_page(monkeypatch):
+    client, calls = _make_client(monkeypatch, total=5)
+
+    first = _get_page(client, limit=2)
+    assert first.status_code == 200
+    assert [event["uid"] for event in first.json()] == ["event-0", "event-1"]
+    assert first.headers["X-Next-Cursor"] == "2"
+    assert 'rel="next"' in first.headers["Link"]
+    assert "cursor=2" in first.headers["Link"]
+
+    second = _get_page(client, limit=2, cursor=first.headers["X-Next-Cursor"])
+    assert [event["uid"] for event in second.json()] == ["event-2", "event-3"]
+    assert second.headers["X-Next-Cursor"] == "4"
+
+    last = _get_page(client, limit=2, cursor=second.headers["X-Next-Cursor"])
+    assert [event["uid"] for event in last.json()] == ["event-4"]
+    assert "X-Next-Cursor" not in last.headers
+    assert "Link" not in last.headers
+
+    # Later pages are served from the cached listing
+    assert calls["report"] == 1
+
+
+def test_exact_last_page_has_no_next_cursor(monkeypatch):
+    client, _ = _make_client(monkeypatch, total=4)
+
+    last = _get_page(client, limit=2, cursor="2")
+    assert [event["uid"] for event in last.json()] == ["event-2", "event-3"]
+    assert "X-Next-Cursor" not in last.headers
+
+
+@pytest.mark.parametrize("cursor", ["4", "99"])
+def test_cursor_past_the_end_returns_an_empty_page(monkeypatch, cursor):
+    client, _ = _make_client(monkeypatch, total=4)
+
+    response = _get_page(client, limit=2, cursor=cursor)
+    assert response.status_code == 200
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.parametrize("cursor", ["-1", "abc"])
+def test_malformed_cursor_is_rejected(monkeypatch, cursor):
+    client, _ = _make_client(monkeypatch, total=4)
+
+    response = _get_page(client, limit=2, cursor=cursor)
+    assert response.status_code == 400
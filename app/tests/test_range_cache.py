@@ -0,0 +1,80 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.common import cache as cache_mod
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {"value": 1000.0}
+    # Patch the module's view of time only; the event loop keeps the real clock
+    monkeypatch.setattr(cache_mod, "time", SimpleNamespace(monotonic=lambda: now["value"]))
+    monkeypatch.setattr(cache_mod, "range_cache", cache_mod.LRUCache(maxsize=16))
+    monkeypatch.setattr(cache_mod, "_range_generation", {})
+    monkeypatch.setattr(cache_mod, "RANGE_CACHE_FRESH", 60.0)
+    monkeypatch.setattr(cache_mod, "RANGE_CACHE_STALE", 300.0)
+    return now
+
+
+async def _drain_background_tasks():
+    while cache_mod._background_tasks:
+        await asyncio.gather(*list(cache_mod._background_tasks))
+
+
+@pytest.mark.asyncio
+async def test_stale_hit_is_served_while_refreshing_in_background(clock):
+    key = cache_mod.range_cache_key("demo", None, "2025-04-21T00:00:00", "2025-04-22T00:00:00", False)
+    values = iter(["first", "second"])
+    loads = {"count": 0}
+
+    async def loader():
+        loads["count"] += 1
+        return next(values)
+
+    assert await cache_mod.cached_time_range(key, loader) == "first"
+
+    clock["value"] += 30
+    assert await cache_mod.cached_time_range(key, loader) == "first"
+    assert loads["count"] == 1
+
+    clock["value"] += 60
+    assert await cache_mod.cached_time_range(key, loader) == "first"
+    await _drain_background_tasks()
+    assert loads["count"] == 2
+    assert await cache_mod.cached_time_range(key, loader) == "second"
+
+
+@pytest.mark.asyncio
+async def test_write_during_load_blocks_the_store(clock):
+    key = cache_mod.range_cache_key("demo", "personal", "2025-04-21T00:00:00", "2025-04-22T00:00:00", False)
+    loads = {"count": 0}
+
+    async def loader():
+        loads["count"] += 1
+        # A write lands while the REPORT is in flight
+        cache_mod.invalidate_ranges("demo", None)
+        return "pre-write"
+
+    assert await cache_mod.cached_time_range(key, loader) == "pre-write"
+    assert key not in cache_mod.range_cache
+
+
+@pytest.mark.asyncio
+async def test_write_during_background_refresh_blocks_the_store(clock):
+    key = cache_mod.range_cache_key("demo", None, "2025-04-21T00:00:00", "2025-04-22T00:00:00", False)
+
+    async def initial_loader():
+        return "initial"
+
+    await cache_mod.cached_time_range(key, initial_loader)
+    clock["value"] += 120
+
+    async def refresh_loader():
+        cache_mod.invalidate_ranges("demo", "personal")
+        return "pre-write"
+
+    assert await cache_mod.cached_time_range(key, refresh_loader) == "initial"
+    await _drain_background_tasks()
+    assert key not in cache_mod.range_cache